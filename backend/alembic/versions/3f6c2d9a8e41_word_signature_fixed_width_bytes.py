@@ -0,0 +1,80 @@
+"""word signature fixed-width bytes
+
+Revision ID: 3f6c2d9a8e41
+Revises: b485f0245c12
+Create Date: 2026-10-18 10:12:41.503118
+
+"""
+from string import ascii_lowercase
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = '3f6c2d9a8e41'
+down_revision: Union[str, None] = 'b485f0245c12'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def _letter_count(letter: str) -> str:
+    return f"(length(lower(word)) - length(replace(lower(word), '{letter}', '')))"
+
+
+# A letter count must fit in its byte; lpad would silently truncate a larger one.
+MAX_LETTER_COUNT = 255
+
+# One byte per letter a-z, matching utils.string_utils.compute_letter_frequency.
+SIGNATURE_FROM_WORD = "decode(" + " || ".join(
+    f"lpad(to_hex({_letter_count(letter)}), 2, '0')" for letter in ascii_lowercase
+) + ", 'hex')"
+
+# The legacy format: decimal counts joined into one string.
+LEGACY_SIGNATURE_FROM_BYTES = " || ".join(
+    f"get_byte(signature, {position})::text" for position in range(len(ascii_lowercase))
+)
+
+
+def _words_table_exists() -> bool:
+    # Fresh databases get the table from Base.metadata.create_all on startup.
+    return sa.inspect(op.get_bind()).has_table('words')
+
+
+def _check_letter_counts() -> None:
+    # Only a word longer than MAX_LETTER_COUNT can repeat a letter more often.
+    counts = ", ".join(_letter_count(letter) for letter in ascii_lowercase)
+    too_long = op.get_bind().execute(sa.text(
+        f"SELECT word FROM words WHERE length(word) > {MAX_LETTER_COUNT} "
+        f"AND greatest({counts}) > {MAX_LETTER_COUNT} LIMIT 5"
+    )).scalars().all()
+    if too_long:
+        raise RuntimeError(f"Words repeating a letter more than {MAX_LETTER_COUNT} times cannot get a "
+                           f"one-byte-per-letter signature; shorten or delete them first: {too_long}")
+
+
+def upgrade() -> None:
+    if not _words_table_exists():
+        return
+
+    _check_letter_counts()
+    op.drop_index('ix_words_signature', table_name='words', if_exists=True)
+    op.alter_column('words', 'signature',
+                    type_=postgresql.BYTEA(),
+                    existing_nullable=False,
+                    postgresql_using=SIGNATURE_FROM_WORD)
+    op.create_index('ix_words_signature', 'words', ['signature'], unique=False)
+
+
+def downgrade() -> None:
+    if not _words_table_exists():
+        return
+
+    op.drop_index('ix_words_signature', table_name='words', if_exists=True)
+    # The legacy format exceeds 26 characters once a letter repeats 10+ times.
+    op.alter_column('words', 'signature',
+                    type_=sa.String(),
+                    existing_nullable=False,
+                    postgresql_using=LEGACY_SIGNATURE_FROM_BYTES)
+    op.create_index('ix_words_signature', 'words', ['signature'], unique=False)
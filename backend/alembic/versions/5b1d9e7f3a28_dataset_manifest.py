@@ -0,0 +1,53 @@
+"""dataset manifest
+
+Revision ID: 5b1d9e7f3a28
+Revises: e2b8f4c6a913
+Create Date: 2026-10-18 23:02:47.915403
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = '5b1d9e7f3a28'
+down_revision: Union[str, None] = 'e2b8f4c6a913'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    inspector = sa.inspect(op.get_bind())
+
+    if not inspector.has_table('dataset_manifest'):
+        op.create_table('dataset_manifest',
+        sa.Column('dataset', sa.String(), nullable=False),
+        sa.Column('digest', sa.LargeBinary(length=32), nullable=False),
+        sa.Column('updated_at', sa.DateTime(timezone=True), nullable=False),
+        sa.PrimaryKeyConstraint('dataset', name='dataset_manifest_pkey')
+        )
+
+    if not inspector.has_table('dataset_manifest_chunk'):
+        op.create_table('dataset_manifest_chunk',
+        sa.Column('dataset', sa.String(), nullable=False),
+        sa.Column('chunk_hash', sa.LargeBinary(length=32), nullable=False),
+        sa.PrimaryKeyConstraint('dataset', 'chunk_hash', name='dataset_manifest_chunk_pkey')
+        )
+
+    # Superseded by the manifest: the first sync re-reads the file once and records its chunks.
+    if inspector.has_table('dataset_checkpoint'):
+        op.drop_table('dataset_checkpoint')
+
+
+def downgrade() -> None:
+    op.drop_table('dataset_manifest_chunk')
+    op.drop_table('dataset_manifest')
+    op.create_table('dataset_checkpoint',
+    sa.Column('dataset', sa.String(), nullable=False),
+    sa.Column('digest', sa.LargeBinary(length=32), nullable=False),
+    sa.Column('byte_offset', sa.BigInteger(), nullable=False),
+    sa.Column('completed', sa.Boolean(), nullable=False),
+    sa.Column('updated_at', sa.DateTime(timezone=True), nullable=False),
+    sa.PrimaryKeyConstraint('dataset', name='dataset_checkpoint_pkey')
+    )
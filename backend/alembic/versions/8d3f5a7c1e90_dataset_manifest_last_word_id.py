@@ -0,0 +1,30 @@
+"""dataset manifest last word id
+
+Revision ID: 8d3f5a7c1e90
+Revises: 5b1d9e7f3a28
+Create Date: 2026-10-19 10:12:36.204417
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = '8d3f5a7c1e90'
+down_revision: Union[str, None] = '5b1d9e7f3a28'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    inspector = sa.inspect(op.get_bind())
+
+    # Filled in by the next dataset sync.
+    columns = {column['name'] for column in inspector.get_columns('dataset_manifest')}
+    if 'last_word_id' not in columns:
+        op.add_column('dataset_manifest', sa.Column('last_word_id', sa.Integer(), nullable=True))
+
+
+def downgrade() -> None:
+    op.drop_column('dataset_manifest', 'last_word_id')
@@ -0,0 +1,64 @@
+"""request log rollups and word counter
+
+Revision ID: 9a1e7c4b2d55
+Revises: 3f6c2d9a8e41
+Create Date: 2026-10-18 11:03:27.219470
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = '9a1e7c4b2d55'
+down_revision: Union[str, None] = '3f6c2d9a8e41'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    inspector = sa.inspect(op.get_bind())
+
+    if not inspector.has_table('request_log_rollup'):
+        op.create_table('request_log_rollup',
+        sa.Column('bucket_start', sa.DateTime(timezone=True), nullable=False),
+        sa.Column('endpoint', sa.String(), nullable=False),
+        sa.Column('request_count', sa.BigInteger(), nullable=False),
+        sa.Column('processing_time_sum', sa.Float(), nullable=False),
+        sa.Column('processing_time_min', sa.Float(), nullable=True),
+        sa.Column('processing_time_max', sa.Float(), nullable=True),
+        sa.PrimaryKeyConstraint('bucket_start', 'endpoint', name='request_log_rollup_pkey')
+        )
+
+    if not inspector.has_table('service_counter'):
+        op.create_table('service_counter',
+        sa.Column('name', sa.String(), nullable=False),
+        sa.Column('value', sa.BigInteger(), nullable=False),
+        sa.PrimaryKeyConstraint('name', name='service_counter_pkey')
+        )
+
+    # Fresh databases get request_log and words from Base.metadata.create_all on startup.
+    if inspector.has_table('request_log'):
+        op.execute("""
+            INSERT INTO request_log_rollup (bucket_start, endpoint, request_count, processing_time_sum,
+                                            processing_time_min, processing_time_max)
+            SELECT date_trunc('minute', timestamp), endpoint, count(*), coalesce(sum(processing_time), 0),
+                   min(processing_time), max(processing_time)
+            FROM request_log
+            WHERE timestamp IS NOT NULL AND endpoint IS NOT NULL
+            GROUP BY 1, 2
+            ON CONFLICT (bucket_start, endpoint) DO NOTHING
+        """)
+
+    if inspector.has_table('words'):
+        op.execute("""
+            INSERT INTO service_counter (name, value)
+            SELECT 'words', count(*) FROM words
+            ON CONFLICT (name) DO NOTHING
+        """)
+
+
+def downgrade() -> None:
+    op.drop_table('service_counter')
+    op.drop_table('request_log_rollup')
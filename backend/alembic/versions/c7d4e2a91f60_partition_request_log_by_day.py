@@ -0,0 +1,96 @@
+"""partition request_log by day
+
+Revision ID: c7d4e2a91f60
+Revises: 9a1e7c4b2d55
+Create Date: 2026-10-18 18:40:12.508113
+
+"""
+from datetime import date, datetime, time, timedelta, timezone
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = 'c7d4e2a91f60'
+down_revision: Union[str, None] = '9a1e7c4b2d55'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Partitions created past today; the application keeps creating them from then on.
+PREMAKE_DAYS = 7
+
+
+def _relkind(bind) -> Union[str, None]:
+    return bind.execute(sa.text("SELECT relkind FROM pg_class WHERE oid = to_regclass('request_log')")).scalar()
+
+
+def _day_start(day: date) -> str:
+    return datetime.combine(day, time.min, tzinfo=timezone.utc).isoformat()
+
+
+def _rename_request_log(to: str) -> str:
+    """
+    Move the current request_log and its indexes out of the way; returns its id sequence.
+    """
+    op.execute(f"ALTER TABLE request_log RENAME TO {to}")
+    op.execute(f"ALTER INDEX request_log_pkey RENAME TO {to}_pkey")
+    op.execute(f"ALTER INDEX IF EXISTS ix_request_log_endpoint RENAME TO ix_{to}_endpoint")
+    op.execute(f"ALTER INDEX IF EXISTS ix_request_log_timestamp RENAME TO ix_{to}_timestamp")
+    return op.get_bind().execute(sa.text(f"SELECT pg_get_serial_sequence('{to}', 'id')")).scalar()
+
+
+def _create_request_log(sequence: str, partition_by: str = "") -> None:
+    op.execute(f"""
+        CREATE TABLE request_log (
+            id INTEGER NOT NULL DEFAULT nextval('{sequence}'::regclass),
+            endpoint VARCHAR NOT NULL,
+            timestamp TIMESTAMP WITH TIME ZONE NOT NULL,
+            processing_time DOUBLE PRECISION NOT NULL,
+            word VARCHAR,
+            CONSTRAINT request_log_pkey PRIMARY KEY (id{', timestamp' if partition_by else ''})
+        ) {partition_by}
+    """)
+    op.execute(f"ALTER SEQUENCE {sequence} OWNED BY request_log.id")
+
+
+def _copy_and_drop(source: str) -> None:
+    op.execute(f"""
+        INSERT INTO request_log (id, endpoint, timestamp, processing_time, word)
+        SELECT id, endpoint, timestamp, processing_time, word FROM {source}
+    """)
+    op.execute(f"DROP TABLE {source}")
+    op.create_index('ix_request_log_endpoint', 'request_log', ['endpoint'], unique=False)
+    op.create_index('ix_request_log_timestamp', 'request_log', ['timestamp'], unique=False)
+
+
+def upgrade() -> None:
+    bind = op.get_bind()
+    # Fresh databases get the partitioned table from Base.metadata.create_all on startup.
+    if _relkind(bind) != 'r':
+        return
+
+    sequence = _rename_request_log('request_log_unpartitioned')
+    _create_request_log(sequence, partition_by="PARTITION BY RANGE (timestamp)")
+
+    today = datetime.now(tz=timezone.utc).date()
+    days = set(bind.execute(sa.text(
+        "SELECT DISTINCT CAST(timezone('UTC', timestamp) AS DATE) FROM request_log_unpartitioned"
+    )).scalars())
+    days.update(today + timedelta(days=offset) for offset in range(PREMAKE_DAYS + 1))
+    for day in sorted(days):
+        op.execute(
+            f"CREATE TABLE request_log_p{day:%Y%m%d} PARTITION OF request_log "
+            f"FOR VALUES FROM ('{_day_start(day)}') TO ('{_day_start(day + timedelta(days=1))}')"
+        )
+
+    _copy_and_drop('request_log_unpartitioned')
+
+
+def downgrade() -> None:
+    if _relkind(op.get_bind()) != 'p':
+        return
+
+    sequence = _rename_request_log('request_log_partitioned')
+    _create_request_log(sequence)
+    _copy_and_drop('request_log_partitioned')
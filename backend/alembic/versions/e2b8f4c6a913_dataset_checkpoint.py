@@ -0,0 +1,35 @@
+"""dataset checkpoint
+
+Revision ID: e2b8f4c6a913
+Revises: c7d4e2a91f60
+Create Date: 2026-10-18 21:14:05.371820
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = 'e2b8f4c6a913'
+down_revision: Union[str, None] = 'c7d4e2a91f60'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    inspector = sa.inspect(op.get_bind())
+
+    if not inspector.has_table('dataset_checkpoint'):
+        op.create_table('dataset_checkpoint',
+        sa.Column('dataset', sa.String(), nullable=False),
+        sa.Column('digest', sa.LargeBinary(length=32), nullable=False),
+        sa.Column('byte_offset', sa.BigInteger(), nullable=False),
+        sa.Column('completed', sa.Boolean(), nullable=False),
+        sa.Column('updated_at', sa.DateTime(timezone=True), nullable=False),
+        sa.PrimaryKeyConstraint('dataset', name='dataset_checkpoint_pkey')
+        )
+
+
+def downgrade() -> None:
+    op.drop_table('dataset_checkpoint')
@@ -1,81 +1,132 @@
 from datetime import datetime
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, func
-from typing import Optional
+from sqlalchemy import select
+from typing import AsyncGenerator, Literal, Optional
 from models.request_log import RequestLog
-from models.word import Word
-from dependencies import get_db_session
-from fastapi import APIRouter, HTTPException, Depends, Query, status
-from fastapi.responses import JSONResponse
+from database.connection import pool_status
+from database.stats_utils import get_rollup_totals, get_word_count
+from dependencies import get_db_session_app, get_read_db_session
+from fastapi import APIRouter, HTTPException, Depends, Query, Request, status
+from fastapi.responses import JSONResponse, StreamingResponse
 
+from schemas.request_log_schemas import RequestLogPage, RequestLogRecord
 from settings import settings
 
 router = APIRouter()
 
+DEFAULT_PAGE_SIZE = 100
+MAX_PAGE_SIZE = 1000
+STREAM_FETCH_SIZE = 1000
 
-@router.get("/request_logs")
-async def get_all_request_logs(db: AsyncSession = Depends(get_db_session)):
+REQUEST_LOG_COLUMNS = (
+    RequestLog.id,
+    RequestLog.endpoint,
+    RequestLog.timestamp,
+    RequestLog.processing_time,
+    RequestLog.word,
+)
+
+
+@router.get("/request_logs", response_model=RequestLogPage)
+async def get_all_request_logs(
+    request: Request,
+    cursor: Optional[int] = Query(None, ge=0, description="Return records with an id greater than this."),
+    limit: Optional[int] = Query(None, ge=1, le=MAX_PAGE_SIZE),
+    endpoint: Optional[str] = Query(None),
+    from_date: Optional[datetime] = Query(None, alias="from"),
+    to_date: Optional[datetime] = Query(None, alias="to"),
+    output_format: Literal["json", "ndjson"] = Query("json", alias="format"),
+    db: AsyncSession = Depends(get_read_db_session),
+):
     """
-    Retrieve all records from the request_log table.
+    Retrieve records from the request_log table, oldest first.
+
+    Records are paginated by keyset on id: each JSON page carries the cursor
+    for the next one. With format=ndjson every matching record is streamed
+    from a server-side cursor, one JSON object per line, so memory stays
+    constant regardless of the table size.
 
     Returns:
-        A list of request log records.
+        A page of request log records, or an NDJSON stream of them.
     """
+    statement = (
+        select(*REQUEST_LOG_COLUMNS)
+        .where(RequestLog.id > cursor if cursor is not None else True)
+        .where(RequestLog.endpoint == endpoint if endpoint else True)
+        .where(RequestLog.timestamp >= from_date if from_date else True)
+        .where(RequestLog.timestamp <= to_date if to_date else True)
+        .order_by(RequestLog.id)
+    )
+
+    if output_format == "ndjson":
+        if limit is not None:
+            statement = statement.limit(limit)
+        return StreamingResponse(_stream_request_logs(request, statement), media_type="application/x-ndjson")
+
     try:
-        result = await db.execute(select(RequestLog))
-        logs = result.scalars().all()
-        return logs
+        result = await db.execute(statement.limit(limit or DEFAULT_PAGE_SIZE))
+        items = [RequestLogRecord.model_validate(row) for row in result.all()]
+        next_cursor = items[-1].id if len(items) == (limit or DEFAULT_PAGE_SIZE) else None
+        return RequestLogPage(items=items, next_cursor=next_cursor)
     except Exception as e:
         return JSONResponse(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
                             content={"error": f"Failed to fetch request logs: {str(e)}"})
 
+
+async def _stream_request_logs(request: Request, statement) -> AsyncGenerator[str, None]:
+    """
+    Yield request log records as NDJSON lines from a server-side cursor.
+
+    The request's session is closed before a streaming response is sent,
+    so the stream owns a session of its own.
+    """
+    async with get_db_session_app(request.app, read_only=True) as db_session:
+        result = await db_session.stream(statement.execution_options(yield_per=STREAM_FETCH_SIZE))
+        async for rows in result.partitions():
+            yield "".join(RequestLogRecord.model_validate(row).model_dump_json() + "\n" for row in rows)
+
 @router.get("/stats")
 async def get_stats(
+    request: Request,
     from_date: Optional[datetime] = Query(None, alias="from"),
     to_date: Optional[datetime] = Query(None, alias="to"),
-    db: AsyncSession = Depends(get_db_session),
+    db: AsyncSession = Depends(get_read_db_session),
 ):
     """
     Retrieve statistics about the service, optionally filtered by time frame.
 
+    Answers from the per-minute request_log rollups and the cached word counter,
+    so the cost does not grow with the size of request_log. Time frames are
+    resolved at one-minute granularity.
+
     Returns:
      - the total number of words in the words table.
      - the total requests to /api/<ver>/similar endpoint.
      - the average processing time of server requests, excluding /stats.
+     - the saturation of this worker's database connection pools (the read
+       replica's too, when one is configured).
     """
     try:
         similar_endpoint = f"/api/{settings.API_VERSION}/similar"
 
-        query_words = await db.execute(select(func.count(Word.word)))
-        total_words = query_words.scalar() or 0
-
-        try:
-            total_requests_endpoint = await db.execute(
-                select(func.count(RequestLog.id).label("total_requests"))
-                .where(RequestLog.endpoint == similar_endpoint)
-                .where(RequestLog.timestamp >= from_date if from_date else True)
-                .where(RequestLog.timestamp <= to_date if to_date else True)
-            )
-            total_request_object = total_requests_endpoint.first()
-            total_requests = total_request_object.total_requests if total_request_object.total_requests else 0
-        except (TypeError, ValueError):
-            total_requests = 0
-
-        try:
-            avg_time_endpoint = await db.execute(
-                select(func.avg(RequestLog.processing_time).label("avg_processing_time"))
-                .where(RequestLog.timestamp >= from_date if from_date else True)
-                .where(RequestLog.timestamp <= to_date if to_date else True)
-            )
-            avg_time_object = avg_time_endpoint.first()
-            avg_processing_time_ms = avg_time_object.avg_processing_time if avg_time_object.avg_processing_time else 0
-        except (TypeError, ValueError):
-            avg_processing_time_ms = 0
+        total_words = await get_word_count(db)
+
+        total_requests, _ = await get_rollup_totals(
+            db, endpoint=similar_endpoint, from_date=from_date, to_date=to_date
+        )
+
+        all_requests, processing_time_sum = await get_rollup_totals(
+            db, from_date=from_date, to_date=to_date
+        )
+        avg_processing_time_ms = processing_time_sum / all_requests if all_requests else 0
 
         return {
             "totalWords": total_words,
             "totalRequests": total_requests,
             "avgProcessingTimeMs": int(avg_processing_time_ms),
+            "dbPool": pool_status(request.app.state.db_engine),
+            **({"dbReadPool": pool_status(request.app.state.db_read_engine)}
+               if request.app.state.db_read_engine is not request.app.state.db_engine else {}),
         }
 
 
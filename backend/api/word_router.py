@@ -1,22 +1,89 @@
+import asyncio
+import codecs
+import logging
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from datetime import datetime, timezone
 
 from time import time
-from typing import List, Optional
-from fastapi import APIRouter, HTTPException, Depends, Query
-from sqlalchemy import select, DateTime, Column
+from typing import AsyncIterator, Dict, Iterable, List, Optional, Tuple
+from fastapi import APIRouter, HTTPException, Depends, Query, Request, UploadFile, File
+from sqlalchemy import select, DateTime, Column, LargeBinary, any_, bindparam
+from sqlalchemy.dialects.postgresql import ARRAY, insert
 from sqlalchemy.exc import IntegrityError
-from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncSession
 from starlette import status
+from starlette.datastructures import State
 
+from database.stats_utils import increment_word_count, record_rollups
 from models.request_log import RequestLog
-from models.word import Word
-from dependencies import get_db_session
-from schemas.word_schemas import SimilarWordsResponse, AddWordResponse, AddWordRequest
+from models.word import Word, WORD_MAX_LENGTH
+from dependencies import (
+    get_db_session, get_read_db_session, get_anagram_index, get_request_log_sink, get_similar_cache,
+    get_subanagram_index, get_near_anagram_index, get_phrase_anagram_pool, get_phrase_anagram_slots
+)
+from lib.anagram_index import AnagramIndex
+from lib.metrics import SIMILAR_CACHE_LOOKUPS, SIMILAR_LOOKUPS
+from lib.near_anagram_index import NearAnagramIndex
+from lib.phrase_anagrams import search_phrase
+from lib.request_log_sink import RequestLogSink
+from lib.similar_cache import SimilarWordsCache
+from lib.subanagram_index import SubanagramIndex
+from lib.tracing import span
+from lib.word_events import apply_words_added, notify_words_added
+from schemas.word_schemas import (
+    SimilarWordsResponse, AddWordResponse, AddWordRequest, SimilarWordsBatchRequest, SimilarWordsBatchResponse,
+    AddWordsRequest, AddWordsResponse, SubanagramsResponse, NearAnagram, NearAnagramsResponse, PhraseAnagramsRequest,
+    PhraseAnagramsResponse, BATCH_MAX_WORDS, PHRASE_MAX_LETTERS
+)
 from settings import settings as app_config
-from utils.string_utils import compute_letter_frequency
+from utils.string_utils import ALPHABET_SIZE, compute_letter_frequency, compute_letter_frequencies, is_valid_word
+
+logger = logging.getLogger(__name__)
 
 router = APIRouter()
 
+UPLOAD_READ_SIZE = 1 << 20
+
+SIMILAR_STATEMENT = select(Word.word).where(Word.signature == bindparam("signature"))
+
+# One statement for any batch size: `= ANY($1)` binds the signatures as a single array.
+SIMILAR_BATCH_STATEMENT = (
+    select(Word.word, Word.signature)
+    .where(Word.signature == any_(bindparam("signatures", type_=ARRAY(LargeBinary))))
+)
+
+
+async def prepare_lookup_statements(conn: AsyncConnection) -> None:
+    """
+    Run the signature lookup once on a pooled connection so asyncpg prepares
+    it into its statement cache.
+
+    Args:
+        conn (AsyncConnection): The connection to prepare the statement on.
+    """
+    await conn.execute(SIMILAR_STATEMENT, {"signature": bytes(ALPHABET_SIZE)})
+    await conn.commit()
+
+
+async def prepare_hot_statements(conn: AsyncConnection) -> None:
+    """
+    Run the hot statements once on a pooled connection so asyncpg prepares
+    them into its statement cache: the signature lookup, and the inline
+    request-log insert with its rollup upsert (rolled back).
+
+    Args:
+        conn (AsyncConnection): The connection to prepare the statements on.
+    """
+    await prepare_lookup_statements(conn)
+
+    async with AsyncSession(bind=conn, join_transaction_mode="rollback_only") as db_session:
+        timestamp = datetime.now(tz=timezone.utc)
+        db_session.add(RequestLog(endpoint="", processing_time=0.0, word=None, timestamp=timestamp))
+        await record_rollups(db_session, [{"endpoint": "", "processing_time": 0.0, "timestamp": timestamp}])
+        await db_session.flush()
+    await conn.rollback()
+
 
 @router.get("/similar",
             response_model=SimilarWordsResponse,
@@ -24,14 +91,22 @@ router = APIRouter()
             summary="Retrieve similar words")
 async def get_similar_words(
         word: str = Query(..., min_length=1),
-        db: AsyncSession = Depends(get_db_session)
+        db: AsyncSession = Depends(get_db_session),
+        read_db: AsyncSession = Depends(get_read_db_session),
+        index: Optional[AnagramIndex] = Depends(get_anagram_index),
+        cache: Optional[SimilarWordsCache] = Depends(get_similar_cache),
+        log_sink: Optional[RequestLogSink] = Depends(get_request_log_sink)
 ):
     """
     Retrieve all words in the dataset that share the same sorted character tuple as the given word.
 
     Args:
         word (str): The word to find similar words for.
-        db (AsyncSession): Database session.
+        db (AsyncSession): Database session, for the request log.
+        read_db (AsyncSession): Read-only database session, for the lookup.
+        index (Optional[AnagramIndex]): In-memory anagram index, if enabled.
+        cache (Optional[SimilarWordsCache]): Signature-keyed cache of database lookups, if enabled.
+        log_sink (Optional[RequestLogSink]): Background request-log writer, if enabled.
     Returns:
         List[str]: A list of words that share the same sorted character tuple as the input word,
          excluding the word itself.
@@ -40,7 +115,7 @@ async def get_similar_words(
         HTTPException: No similar words found.
     """
 
-    similar, processing_time = await fetch_similar_words(word, db)
+    similar, processing_time = await fetch_similar_words(word, read_db, index, cache)
 
     if not similar:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Similar words not found")
@@ -49,40 +124,271 @@ async def get_similar_words(
         endpoint=f"/api/{app_config.API_VERSION}/similar",
         processing_time=processing_time,
         db=db,
-        word=word
+        word=word,
+        sink=log_sink
     )
 
     return SimilarWordsResponse(similar=list(similar))
 
 
+@router.post("/similar/batch",
+             response_model=SimilarWordsBatchResponse,
+             status_code=status.HTTP_200_OK,
+             summary="Retrieve similar words for many words at once")
+async def get_similar_words_batch(
+        batch_request: SimilarWordsBatchRequest,
+        db: AsyncSession = Depends(get_db_session),
+        read_db: AsyncSession = Depends(get_read_db_session),
+        index: Optional[AnagramIndex] = Depends(get_anagram_index),
+        cache: Optional[SimilarWordsCache] = Depends(get_similar_cache),
+        log_sink: Optional[RequestLogSink] = Depends(get_request_log_sink)
+):
+    """
+    Retrieve the similar words of every word in the request with a single lookup.
+
+    Args:
+        batch_request (SimilarWordsBatchRequest): The words to find similar words for.
+        db (AsyncSession): Database session, for the request log.
+        read_db (AsyncSession): Read-only database session, for the lookup.
+        index (Optional[AnagramIndex]): In-memory anagram index, if enabled.
+        cache (Optional[SimilarWordsCache]): Signature-keyed cache of database lookups, if enabled.
+        log_sink (Optional[RequestLogSink]): Background request-log writer, if enabled.
+    Returns:
+        SimilarWordsBatchResponse: The similar words of each input word (possibly empty),
+         excluding the word itself.
+    """
+    results, processing_time = await fetch_similar_words_batch(batch_request.words, read_db, index, cache)
+
+    await log_request(
+        endpoint=f"/api/{app_config.API_VERSION}/similar/batch",
+        processing_time=processing_time,
+        db=db,
+        sink=log_sink
+    )
+
+    return SimilarWordsBatchResponse(results=results)
+
+
+@router.get("/similar/near",
+            response_model=NearAnagramsResponse,
+            status_code=status.HTTP_200_OK,
+            summary="Retrieve words one letter away from being anagrams")
+async def get_near_anagrams(
+        word: str = Query(..., min_length=1, max_length=WORD_MAX_LENGTH),
+        distance: int = Query(1, ge=1, le=1, description="Letter edits allowed; only 1 is supported."),
+        limit: int = Query(100, ge=1, le=1000),
+        db: AsyncSession = Depends(get_db_session),
+        index: Optional[NearAnagramIndex] = Depends(get_near_anagram_index),
+        log_sink: Optional[RequestLogSink] = Depends(get_request_log_sink)
+):
+    """
+    Retrieve the words whose letters differ from the given word's by one inserted,
+    deleted or substituted letter.
+
+    Args:
+        word (str): The word to find near anagrams for.
+        distance (int): Number of letter edits; only 1 is supported.
+        limit (int): Maximum number of words to return.
+        db (AsyncSession): Database session.
+        index (Optional[NearAnagramIndex]): In-memory near-anagram index, if enabled.
+        log_sink (Optional[RequestLogSink]): Background request-log writer, if enabled.
+    Returns:
+        NearAnagramsResponse: Up to `limit` near anagrams, substitutions first, then insertions,
+         then deletions, each alphabetically; and the total number found.
+
+    Raises:
+        HTTPException: The index is disabled, or no near anagrams found.
+    """
+    if index is None:
+        raise HTTPException(status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                            detail="Near-anagram index is disabled or still being built")
+
+    start_time = time()
+    near, total = index.query(compute_letter_frequency(word.lower().strip()), limit=limit)
+    processing_time = (time() - start_time) * 1_000_000
+
+    if not near:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Near anagrams not found")
+
+    await log_request(
+        endpoint=f"/api/{app_config.API_VERSION}/similar/near",
+        processing_time=processing_time,
+        db=db,
+        word=word,
+        sink=log_sink
+    )
+
+    return NearAnagramsResponse(near=[NearAnagram(**match._asdict()) for match in near], total=total)
+
+
+@router.get("/subanagrams",
+            response_model=SubanagramsResponse,
+            status_code=status.HTTP_200_OK,
+            summary="Retrieve words that can be spelled from the given letters")
+async def get_subanagrams(
+        letters: str = Query(..., min_length=1, max_length=WORD_MAX_LENGTH),
+        min_len: int = Query(1, ge=1, le=WORD_MAX_LENGTH),
+        limit: int = Query(100, ge=1, le=1000),
+        db: AsyncSession = Depends(get_db_session),
+        index: Optional[SubanagramIndex] = Depends(get_subanagram_index),
+        log_sink: Optional[RequestLogSink] = Depends(get_request_log_sink)
+):
+    """
+    Retrieve the words that can be spelled from a subset of the given letters,
+    each letter used at most as many times as it is given.
+
+    Args:
+        letters (str): The available letters; characters other than a-z are ignored.
+        min_len (int): Minimum number of letters a word must use.
+        limit (int): Maximum number of words to return.
+        db (AsyncSession): Database session.
+        index (Optional[SubanagramIndex]): In-memory sub-anagram index, if enabled.
+        log_sink (Optional[RequestLogSink]): Background request-log writer, if enabled.
+    Returns:
+        SubanagramsResponse: Up to `limit` words, longest first and then alphabetically,
+         and the total number of matches.
+
+    Raises:
+        HTTPException: The index is disabled, or no words can be spelled from the letters.
+    """
+    if index is None:
+        raise HTTPException(status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                            detail="Sub-anagram index is disabled or still being built")
+
+    start_time = time()
+    subanagrams, total = index.query(compute_letter_frequency(letters), min_len=min_len, limit=limit)
+    processing_time = (time() - start_time) * 1_000_000
+
+    if not subanagrams:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Sub-anagrams not found")
+
+    await log_request(
+        endpoint=f"/api/{app_config.API_VERSION}/subanagrams",
+        processing_time=processing_time,
+        db=db,
+        word=letters,
+        sink=log_sink
+    )
+
+    return SubanagramsResponse(subanagrams=subanagrams, total=total)
+
+
+@router.post("/phrase-anagrams",
+             response_model=PhraseAnagramsResponse,
+             status_code=status.HTTP_200_OK,
+             summary="Rearrange the letters of a phrase into other phrases")
+async def get_phrase_anagrams(
+        phrase_request: PhraseAnagramsRequest,
+        db: AsyncSession = Depends(get_db_session),
+        index: Optional[SubanagramIndex] = Depends(get_subanagram_index),
+        pool: Optional[ProcessPoolExecutor] = Depends(get_phrase_anagram_pool),
+        slots: Optional[asyncio.Semaphore] = Depends(get_phrase_anagram_slots),
+        log_sink: Optional[RequestLogSink] = Depends(get_request_log_sink)
+):
+    """
+    Split the letters of a phrase into combinations of dictionary words.
+
+    The search runs in a worker process holding its own copy of the sub-anagram
+    index, within the request's time budget, so neither gathering the candidate
+    words nor the search blocks the event loop. At most PHRASE_ANAGRAM_MAX_PENDING searches run or
+    wait for a worker at once; beyond that the request is turned away rather
+    than queued behind them.
+
+    Args:
+        phrase_request (PhraseAnagramsRequest): The phrase and the search budgets.
+        db (AsyncSession): Database session.
+        index (Optional[SubanagramIndex]): In-memory sub-anagram index, if enabled.
+        pool (Optional[ProcessPoolExecutor]): Worker processes running the search, if started.
+        slots (Optional[asyncio.Semaphore]): Bounds the searches pending in the pool.
+        log_sink (Optional[RequestLogSink]): Background request-log writer, if enabled.
+    Returns:
+        PhraseAnagramsResponse: The phrases found and whether the search completed.
+
+    Raises:
+        HTTPException: The endpoint is disabled, the phrase has too many letters,
+         too many searches are pending, or the worker pool failed.
+    """
+    if index is None or pool is None or slots is None:
+        raise HTTPException(status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                            detail="Phrase anagrams are disabled or still starting")
+
+    signature = compute_letter_frequency(phrase_request.phrase)
+    if not 0 < sum(signature) <= PHRASE_MAX_LETTERS:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST,
+                            detail=f"Phrase must have between 1 and {PHRASE_MAX_LETTERS} letters")
+
+    # Nothing is awaited between the check and the acquisition, so the latter never waits.
+    if slots.locked():
+        raise HTTPException(status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                            detail="Too many phrase anagram searches pending; retry later")
+
+    start_time = time()
+    try:
+        async with slots:
+            phrases, complete = await asyncio.get_running_loop().run_in_executor(
+                pool,
+                search_phrase,
+                signature,
+                phrase_request.min_word_len,
+                index.added_since_snapshot(signature),
+                phrase_request.max_words,
+                phrase_request.limit,
+                phrase_request.time_budget_ms / 1000,
+            )
+    except BrokenProcessPool:
+        raise HTTPException(status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                            detail="Phrase anagram workers are unavailable")
+    processing_time = (time() - start_time) * 1_000_000
+
+    await log_request(
+        endpoint=f"/api/{app_config.API_VERSION}/phrase-anagrams",
+        processing_time=processing_time,
+        db=db,
+        word=phrase_request.phrase,
+        sink=log_sink
+    )
+
+    return PhraseAnagramsResponse(phrases=phrases, complete=complete)
+
+
 @router.post(
     "/add-word", response_model=AddWordResponse,
     status_code=status.HTTP_200_OK,
     summary="Add a new word to the database")
 async def add_word(
     add_word_request: AddWordRequest,
-    db: AsyncSession = Depends(get_db_session)
+    request: Request,
+    db: AsyncSession = Depends(get_db_session),
+    log_sink: Optional[RequestLogSink] = Depends(get_request_log_sink)
 ):
     """
     Adds a new word to the dictionary for future queries.
 
     Args:
         add_word_request (AddWordRequest): The word to add.
+        request (Request): FastAPI request; its app state holds the index and cache kept in sync.
         db (AsyncSession): db session.
+        log_sink (Optional[RequestLogSink]): Background request-log writer, if enabled.
 
     Returns:
         AddWordResponse: Success message.
     """
 
     word_to_store = add_word_request.word.strip().lower()
-    word_signature = compute_letter_frequency(word_to_store)
+    with span("signature"):
+        word_signature = compute_letter_frequency(word_to_store)
 
     new_word = Word(word=word_to_store, signature=word_signature)
     try:
         start_time = time()
-        db.add(new_word)
-        await db.commit()
-        await db.refresh(new_word)
+        with span("insert"):
+            db.add(new_word)
+            await increment_word_count(db, 1)
+            if app_config.WORD_EVENTS_ENABLED:
+                await notify_words_added(db, [word_to_store])
+        with span("commit"):
+            await db.commit()
+            await db.refresh(new_word)
         end_time = time()
     except IntegrityError:
         end_time = time()
@@ -93,7 +399,8 @@ async def add_word(
             endpoint=f"/api/{app_config.API_VERSION}/add-word",
             processing_time=processing_time,
             db=db,
-            word=word_to_store
+            word=word_to_store,
+            sink=log_sink
         )
 
         raise HTTPException(
@@ -106,51 +413,331 @@ async def add_word(
 
     processing_time = (end_time - start_time) * 1_000_000
 
+    with span("index.update"):
+        apply_words_added(request.app.state, [(word_to_store, word_signature)], publish=True)
+
     await log_request(
         endpoint=f"/api/{app_config.API_VERSION}/add-word",
         processing_time=processing_time,
-        db=db
+        db=db,
+        sink=log_sink
     )
 
     return AddWordResponse(message=f"Word: {add_word_request.word} added successfully")
 
 
-async def fetch_similar_words(word: str, db: AsyncSession):
+@router.post(
+    "/add-words", response_model=AddWordsResponse,
+    status_code=status.HTTP_200_OK,
+    summary="Add many words to the database")
+async def add_words(
+    add_words_request: AddWordsRequest,
+    request: Request,
+    db: AsyncSession = Depends(get_db_session),
+    log_sink: Optional[RequestLogSink] = Depends(get_request_log_sink)
+):
     """
-    Todo: add docstring
+    Adds a list of words to the dictionary, skipping words that already exist.
+
+    Args:
+        add_words_request (AddWordsRequest): The words to add.
+        request (Request): FastAPI request; its app state holds the index and cache kept in sync.
+        db (AsyncSession): db session.
+        log_sink (Optional[RequestLogSink]): Background request-log writer, if enabled.
+
+    Returns:
+        AddWordsResponse: Inserted, already-present and invalid word counts.
     """
-    word_signature = compute_letter_frequency(word.lower().strip())
+    start_time = time()
+    inserted, already_present, invalid = await insert_words(add_words_request.words, db, request.app.state)
+    processing_time = (time() - start_time) * 1_000_000
 
-    statement = (
-        select(Word.word)
-        .where(Word.signature == word_signature)
-        .where(Word.word != word)
+    await log_request(
+        endpoint=f"/api/{app_config.API_VERSION}/add-words",
+        processing_time=processing_time,
+        db=db,
+        sink=log_sink
     )
-    try:
-        start_time = time()
-        result = await db.execute(statement)
-        similar = result.scalars().all()
-        end_time = time()
-        processing_time = (end_time - start_time) * 1_000_000
-    except Exception as e:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Database query failed: {e}"
-        )
-    return similar, processing_time
 
+    return AddWordsResponse(inserted=inserted, already_present=already_present, invalid=invalid)
 
-async def log_request(endpoint, processing_time, db, word: Optional[str] = None):
-    log = RequestLog(
-        endpoint=endpoint,
+
+@router.post(
+    "/add-words/upload", response_model=AddWordsResponse,
+    status_code=status.HTTP_200_OK,
+    summary="Add the words of an uploaded file to the database")
+async def add_words_upload(
+    request: Request,
+    file: UploadFile = File(..., description="A text file with one word per line."),
+    db: AsyncSession = Depends(get_db_session),
+    log_sink: Optional[RequestLogSink] = Depends(get_request_log_sink)
+):
+    """
+    Adds the words of an uploaded file to the dictionary, skipping words that already exist.
+
+    The file is read and inserted in batches, so its size is not bounded by memory.
+
+    Args:
+        request (Request): FastAPI request; its app state holds the index and cache kept in sync.
+        file (UploadFile): A text file with one word per line.
+        db (AsyncSession): db session.
+        log_sink (Optional[RequestLogSink]): Background request-log writer, if enabled.
+
+    Returns:
+        AddWordsResponse: Inserted, already-present and invalid word counts.
+    """
+    start_time = time()
+    totals = [0, 0, 0]
+    async for batch in _read_upload_batches(file, BATCH_MAX_WORDS):
+        for position, count in enumerate(await insert_words(batch, db, request.app.state)):
+            totals[position] += count
+    inserted, already_present, invalid = totals
+    processing_time = (time() - start_time) * 1_000_000
+
+    await log_request(
+        endpoint=f"/api/{app_config.API_VERSION}/add-words/upload",
         processing_time=processing_time,
-        word=word,
+        db=db,
+        sink=log_sink
+    )
+
+    return AddWordsResponse(inserted=inserted, already_present=already_present, invalid=invalid)
+
+
+async def fetch_similar_words(
+        word: str,
+        db: AsyncSession,
+        index: Optional[AnagramIndex] = None,
+        cache: Optional[SimilarWordsCache] = None
+):
+    """
+    Find the words sharing the letter-frequency signature of the given word.
+
+    The in-memory index answers when it knows the signature. Otherwise the
+    signature cache is consulted before the database, which remains the source
+    of truth; database results are cached by signature.
+
+    Args:
+        word (str): The word to find similar words for.
+        db (AsyncSession): Database session.
+        index (Optional[AnagramIndex]): In-memory anagram index, if enabled.
+        cache (Optional[SimilarWordsCache]): Signature-keyed cache of database lookups, if enabled.
+
+    Returns:
+        Tuple[List[str], float]: The similar words (excluding the word itself) and the
+         lookup time in microseconds.
+    """
+    with span("signature"):
+        word_signature = compute_letter_frequency(word.lower().strip())
+
+    start_time = time()
+    candidates = None
+    source = "index"
+    if index is not None:
+        with span("lookup.index"):
+            candidates = index.lookup(word_signature)
+    if candidates is None and cache is not None:
+        with span("lookup.cache"):
+            candidates = cache.get(word_signature)
+        source = "cache"
+        SIMILAR_CACHE_LOOKUPS.labels(result="miss" if candidates is None else "hit").inc()
+
+    if candidates is None:
+        source = "database"
+        try:
+            with span("lookup.database"):
+                result = await db.execute(SIMILAR_STATEMENT, {"signature": word_signature})
+                candidates = result.scalars().all()
+        except Exception as e:
+            raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail=f"Database query failed: {e}"
+            )
+        if cache is not None:
+            cache.put(word_signature, candidates)
+    SIMILAR_LOOKUPS.labels(source=source).inc()
+
+    similar = [candidate for candidate in candidates if candidate != word]
+    processing_time = (time() - start_time) * 1_000_000
+    return similar, processing_time
+
+
+async def fetch_similar_words_batch(
+        words: List[str],
+        db: AsyncSession,
+        index: Optional[AnagramIndex] = None,
+        cache: Optional[SimilarWordsCache] = None
+) -> Tuple[Dict[str, List[str]], float]:
+    """
+    Find the similar words of many words, resolving all their signatures at once.
+
+    Signatures known to the in-memory index or the signature cache are answered
+    from them; the rest are fetched from the database with one
+    `signature = ANY(...)` query and cached.
+
+    Args:
+        words (List[str]): The words to find similar words for.
+        db (AsyncSession): Database session.
+        index (Optional[AnagramIndex]): In-memory anagram index, if enabled.
+        cache (Optional[SimilarWordsCache]): Signature-keyed cache of database lookups, if enabled.
+
+    Returns:
+        Tuple[Dict[str, List[str]], float]: The similar words per input word (excluding the
+         word itself) and the lookup time in microseconds.
+    """
+    signatures = dict(zip(words, compute_letter_frequencies([word.lower().strip() for word in words])))
+
+    start_time = time()
+    groups: Dict[bytes, List[str]] = {}
+    missing = set()
+    for word_signature in set(signatures.values()):
+        candidates = index.lookup(word_signature) if index is not None else None
+        source = "index"
+        if candidates is None and cache is not None:
+            candidates = cache.get(word_signature)
+            source = "cache"
+            SIMILAR_CACHE_LOOKUPS.labels(result="miss" if candidates is None else "hit").inc()
+        if candidates is None:
+            missing.add(word_signature)
+        else:
+            groups[word_signature] = candidates
+            SIMILAR_LOOKUPS.labels(source=source).inc()
+    if missing:
+        SIMILAR_LOOKUPS.labels(source="database").inc(len(missing))
+
+    if missing:
+        try:
+            result = await db.execute(SIMILAR_BATCH_STATEMENT, {"signatures": list(missing)})
+        except Exception as e:
+            raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail=f"Database query failed: {e}"
+            )
+        for word_signature in missing:
+            groups[word_signature] = []
+        for similar_word, word_signature in result:
+            groups[word_signature].append(similar_word)
+        if cache is not None:
+            for word_signature in missing:
+                cache.put(word_signature, groups[word_signature])
+
+    results = {
+        word: [candidate for candidate in groups.get(word_signature, []) if candidate != word]
+        for word, word_signature in signatures.items()
+    }
+    processing_time = (time() - start_time) * 1_000_000
+    return results, processing_time
+
+
+async def insert_words(
+        words: Iterable[str],
+        db: AsyncSession,
+        state: State
+) -> Tuple[int, int, int]:
+    """
+    Insert a batch of words in one transaction, skipping words that already exist.
+
+    Duplicates are resolved by `INSERT ... ON CONFLICT (word) DO NOTHING RETURNING word`,
+    so no extra round trip is needed to detect them. The word counter is updated and
+    the other workers are notified in the same transaction; this worker's index and
+    cache are updated after the commit.
+
+    Args:
+        words (Iterable[str]): The words to add; they are normalized before insertion, and
+         counted as invalid unless they are then letters a-z only.
+        db (AsyncSession): db session.
+        state (State): The application state holding the index and cache.
+
+    Returns:
+        Tuple[int, int, int]: Inserted, already-present and invalid word counts.
+    """
+    invalid = 0
+    words_to_store: Dict[str, None] = {}
+    for word in words:
+        word_to_store = word.strip().lower()
+        if not is_valid_word(word_to_store):
+            invalid += 1
+            continue
+        words_to_store[word_to_store] = None
+    rows = dict(zip(words_to_store, compute_letter_frequencies(list(words_to_store))))
+
+    if not rows:
+        return 0, 0, invalid
+
+    statement = (
+        insert(Word)
+        .values([{"word": word, "signature": signature} for word, signature in rows.items()])
+        .on_conflict_do_nothing(index_elements=[Word.word])
+        .returning(Word.word)
     )
     try:
-        db.add(log)
+        result = await db.execute(statement)
+        inserted = result.scalars().all()
+        await increment_word_count(db, len(inserted))
+        if app_config.WORD_EVENTS_ENABLED:
+            await notify_words_added(db, inserted)
         await db.commit()
-        await db.refresh(log)
-        print(f"log_request: {endpoint} successfully")
     except Exception as e:
-        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                            detail=f"Failed to log the request: {e}")
+        await db.rollback()
+        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=f"Failed to add words: {e}")
+
+    apply_words_added(state, ((word, rows[word]) for word in inserted), publish=True)
+
+    return len(inserted), len(rows) - len(inserted), invalid
+
+
+async def _read_upload_batches(file: UploadFile, batch_size: int) -> AsyncIterator[List[str]]:
+    """
+    Yield the non-empty lines of an uploaded file in batches, reading it in blocks.
+    """
+    decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+    remainder = ""
+    batch: List[str] = []
+    while True:
+        block = await file.read(UPLOAD_READ_SIZE)
+        lines = (remainder + decoder.decode(block, final=not block)).split("\n")
+        remainder = lines.pop()
+        batch.extend(line for line in lines if line.strip())
+        while len(batch) >= batch_size:
+            yield batch[:batch_size]
+            batch = batch[batch_size:]
+        if not block:
+            break
+    if remainder.strip():
+        batch.append(remainder)
+    if batch:
+        yield batch
+
+
+async def log_request(endpoint, processing_time, db, word: Optional[str] = None,
+                      sink: Optional[RequestLogSink] = None):
+    """
+    Record a request in the request_log table.
+
+    With a sink the entry is queued for the background writer and the request
+    does not wait for the insert; otherwise it is committed on the request's session.
+    """
+    with span("log_request"):
+        if sink is not None:
+            sink.submit(endpoint=endpoint, processing_time=processing_time, word=word)
+            return
+
+        log = RequestLog(
+            endpoint=endpoint,
+            processing_time=processing_time,
+            word=word,
+            timestamp=datetime.now(tz=timezone.utc),
+        )
+        try:
+            db.add(log)
+            await record_rollups(db, [{
+                "endpoint": endpoint,
+                "processing_time": processing_time,
+                "timestamp": log.timestamp,
+            }])
+            await db.commit()
+            await db.refresh(log)
+            logger.debug(f"Request logged: {endpoint}")
+        except Exception as e:
+            raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                                detail=f"Failed to log the request: {e}")
@@ -0,0 +1,53 @@
+"""
+Compare the per-word and batch signature functions on the words dataset.
+
+Run from the backend directory:
+    python -m benchmarks.bench_signatures [--repeat 3]
+"""
+import argparse
+import json
+from pathlib import Path
+from time import perf_counter
+from typing import Callable, List
+
+from utils import string_utils
+from utils.string_utils import compute_letter_frequency, compute_letter_frequencies
+
+DATASET_PATH = Path(__file__).resolve().parent.parent / "dataset" / "words_dataset.txt"
+
+
+def _best_of(repeat: int, func: Callable[[], List[bytes]]) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = perf_counter()
+        func()
+        best = min(best, perf_counter() - start)
+    return best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--dataset", type=Path, default=DATASET_PATH)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    words = [line.strip().lower() for line in args.dataset.read_text(encoding="utf-8").splitlines() if line.strip()]
+
+    expected = [compute_letter_frequency(word) for word in words]
+    if compute_letter_frequencies(words) != expected:
+        raise SystemExit("Batch signatures differ from compute_letter_frequency.")
+
+    scalar = _best_of(args.repeat, lambda: [compute_letter_frequency(word) for word in words])
+    batch = _best_of(args.repeat, lambda: compute_letter_frequencies(words))
+    print(json.dumps({
+        "words": len(words),
+        "numpy": string_utils.np is not None,
+        "scalar_seconds": round(scalar, 4),
+        "batch_seconds": round(batch, 4),
+        "speedup": round(scalar / batch, 2),
+        "batch_words_per_second": round(len(words) / batch),
+    }, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,168 @@
+"""
+Resolve the anagrams of every word in a file, offline, across a process pool.
+
+Reads one word per line from a file or stdin and writes, for each one, the
+dictionary words sharing its letter-frequency signature (excluding the word
+itself, as `/similar` does) as NDJSON or CSV, in input order. The dictionary is
+the dataset file, or an index file prebuilt with `cli.build_index`; neither the
+settings nor a database are needed.
+
+    python -m cli.anagrams words.txt --output anagrams.ndjson
+    cat words.txt | python -m cli.anagrams --format csv --workers 8 > anagrams.csv
+
+Run from the backend directory.
+"""
+import argparse
+import csv
+import io
+import json
+import os
+import sys
+import tempfile
+from collections import deque
+from itertools import islice
+from multiprocessing import Pool
+from pathlib import Path
+from time import perf_counter
+from typing import IO, Iterable, Iterator, List, Optional
+
+from cli.build_index import DATASET_PATH, buckets_from_dataset
+from lib.index_file import IndexFile, write_index_file
+from utils.dataset_utils import file_digest, iter_words
+from utils.string_utils import compute_letter_frequencies
+
+CHUNK_SIZE = 10_000
+# Chunks queued per worker; bounds memory however large the input is.
+CHUNKS_IN_FLIGHT_PER_WORKER = 2
+CSV_HEADER = ("word", "similar")
+
+# The index file mapped by this process; pool workers map it once, in `_open_index`.
+_index_file: Optional[IndexFile] = None
+
+
+def _open_index(index_path: str) -> None:
+    global _index_file
+    _index_file = IndexFile(index_path)
+
+
+def resolve_chunk(words: List[str], output_format: str) -> str:
+    """
+    Look up the anagrams of a chunk of words in the mapped index file and render them.
+
+    Args:
+        words (List[str]): Normalized words.
+        output_format (str): "ndjson", or "csv" with the similar words space-separated.
+
+    Returns:
+        str: The rendered rows, one per word.
+    """
+    groups = _index_file.lookup_many(compute_letter_frequencies(words))
+    rows = [(word, [candidate for candidate in group if candidate != word] if group else [])
+            for word, group in zip(words, groups)]
+
+    if output_format == "ndjson":
+        return "".join(json.dumps({"word": word, "similar": similar}, ensure_ascii=False) + "\n"
+                       for word, similar in rows)
+    buffer = io.StringIO()
+    writer = csv.writer(buffer, lineterminator="\n")
+    writer.writerows((word, " ".join(similar)) for word, similar in rows)
+    return buffer.getvalue()
+
+
+def _chunks(words: Iterable[str], chunk_size: int) -> Iterator[List[str]]:
+    words = iter(words)
+    while chunk := list(islice(words, chunk_size)):
+        yield chunk
+
+
+def resolve(
+        words: Iterable[str],
+        index_path: str,
+        output: IO[str],
+        output_format: str = "ndjson",
+        workers: int = 1,
+        chunk_size: int = CHUNK_SIZE,
+) -> int:
+    """
+    Resolve the anagrams of a stream of words, writing the rows in input order.
+
+    With more than one worker the chunks are resolved by a process pool; each
+    worker maps the same index file, so the dictionary is held once in the
+    page cache however many workers there are.
+
+    Args:
+        words (Iterable[str]): Normalized words.
+        index_path (str): Index file holding the dictionary.
+        output (IO[str]): Where to write the rows.
+        output_format (str): "ndjson" or "csv".
+        workers (int): Number of worker processes; 1 resolves in this process.
+        chunk_size (int): Words per task.
+
+    Returns:
+        int: The number of words resolved.
+    """
+    if output_format == "csv":
+        csv.writer(output, lineterminator="\n").writerow(CSV_HEADER)
+
+    count = 0
+    if workers <= 1:
+        _open_index(index_path)
+        try:
+            for chunk in _chunks(words, chunk_size):
+                output.write(resolve_chunk(chunk, output_format))
+                count += len(chunk)
+        finally:
+            _index_file.close()
+        return count
+
+    with Pool(workers, initializer=_open_index, initargs=(index_path,)) as pool:
+        # apply_async rather than imap: imap drains the input up front, this keeps it streaming.
+        pending = deque()
+        for chunk in _chunks(words, chunk_size):
+            pending.append(pool.apply_async(resolve_chunk, (chunk, output_format)))
+            count += len(chunk)
+            if len(pending) >= workers * CHUNKS_IN_FLIGHT_PER_WORKER:
+                output.write(pending.popleft().get())
+        while pending:
+            output.write(pending.popleft().get())
+    return count
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("input", nargs="?", default="-", help="File with one word per line; - for stdin.")
+    parser.add_argument("--output", type=Path, help="Where to write the results; stdout by default.")
+    parser.add_argument("--format", choices=("ndjson", "csv"), default="ndjson")
+    parser.add_argument("--dataset", type=Path, default=DATASET_PATH, help="Dictionary to resolve against.")
+    parser.add_argument("--index", type=Path,
+                        help="Index file prebuilt with cli.build_index, instead of indexing --dataset.")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--chunk-size", type=int, default=CHUNK_SIZE)
+    args = parser.parse_args()
+
+    start = perf_counter()
+    index_path = str(args.index) if args.index else None
+    if index_path is None:
+        fd, index_path = tempfile.mkstemp(suffix=".anagram_index")
+        os.close(fd)
+        write_index_file(index_path, buckets_from_dataset(args.dataset), dataset_digest=file_digest(args.dataset))
+
+    source = sys.stdin if args.input == "-" else open(args.input, "r", encoding="utf-8")
+    output = sys.stdout if args.output is None else open(args.output, "w", encoding="utf-8", newline="")
+    try:
+        count = resolve(iter_words(source), index_path, output, args.format, args.workers, args.chunk_size)
+    finally:
+        if source is not sys.stdin:
+            source.close()
+        if output is not sys.stdout:
+            output.close()
+        if not args.index:
+            os.unlink(index_path)
+
+    elapsed = perf_counter() - start
+    print(f"Resolved {count} words in {elapsed:.2f}s ({count / elapsed:.0f} words/s, {args.workers} workers)",
+          file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,129 @@
+"""
+Build the anagram index file that the service maps with ANAGRAM_INDEX_SHARED=true.
+
+Workers starting with a matching file at ANAGRAM_INDEX_PATH map it in
+milliseconds instead of building the index from the words table.
+
+From the dataset file, without the settings or a database (e.g. at image build time):
+    python -m cli.build_index --source dataset --output /tmp/anagram_index.bin
+
+From the words table configured in `.env`, including words added through the API:
+    python -m cli.build_index --source database --output /tmp/anagram_index.bin
+
+Check an existing file against the current dataset:
+    python -m cli.build_index --check /tmp/anagram_index.bin
+
+Run from the backend directory.
+"""
+import argparse
+import asyncio
+import sys
+from pathlib import Path
+from time import perf_counter
+from typing import Dict, List, Tuple
+
+from lib.index_file import IndexFile, IndexFileError, write_index_file
+from utils.dataset_utils import file_digest, iter_dataset_words
+from utils.string_utils import WORD_MAX_LENGTH, compute_letter_frequencies
+
+BACKEND_DIR = Path(__file__).resolve().parent.parent
+DATASET_PATH = BACKEND_DIR / "dataset" / "words_dataset.txt"
+SIGNATURE_BATCH_SIZE = 10_000
+
+
+def buckets_from_dataset(dataset_path: Path) -> Dict[bytes, List[str]]:
+    """
+    Group the dataset's storable words by signature, as the dataset loader would store them.
+    """
+    buckets: Dict[bytes, List[str]] = {}
+    seen = set()
+    batch: List[str] = []
+
+    def flush() -> None:
+        for word, signature in zip(batch, compute_letter_frequencies(batch)):
+            buckets.setdefault(signature, []).append(word)
+        batch.clear()
+
+    for word in iter_dataset_words(dataset_path):
+        if len(word) > WORD_MAX_LENGTH or word in seen:
+            continue
+        seen.add(word)
+        batch.append(word)
+        if len(batch) >= SIGNATURE_BATCH_SIZE:
+            flush()
+    flush()
+    return buckets
+
+
+async def buckets_from_database() -> Tuple[Dict[bytes, List[str]], int]:
+    """
+    Group the words table by signature.
+
+    Returns:
+        Tuple[Dict[bytes, List[str]], int]: The buckets, and the highest word id they hold.
+    """
+    from sqlalchemy import func, select
+    from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+
+    from lib.anagram_index import AnagramIndex
+    from models.word import Word
+    from settings import settings
+
+    engine = create_async_engine(str(settings.SQLALCHEMY_DATABASE_URI))
+    try:
+        async with AsyncSession(engine) as db_session:
+            index = await AnagramIndex.build(db_session)
+            # Taken after the scan, so every word the build read is at or below it.
+            watermark = (await db_session.execute(select(func.max(Word.id)))).scalar_one() or 0
+    finally:
+        await engine.dispose()
+    return index._buckets, watermark
+
+
+def check(path: Path, dataset_path: Path) -> int:
+    try:
+        index_file = IndexFile(str(path))
+    except (FileNotFoundError, IndexFileError) as e:
+        print(f"{path}: unusable: {e}", file=sys.stderr)
+        return 1
+    try:
+        current = index_file.dataset_digest == file_digest(dataset_path)
+        print(f"{path}: generation {index_file.generation}, {index_file.word_count} words, "
+              f"{index_file.signature_count} signatures, word id watermark {index_file.word_id_watermark}, "
+              f"{'built from' if current else 'stale for'} {dataset_path}")
+        return 0 if current else 1
+    finally:
+        index_file.close()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--source", choices=("dataset", "database"), default="dataset",
+                        help="Build from the dataset file or from the words table.")
+    parser.add_argument("--dataset", type=Path, default=DATASET_PATH,
+                        help="Dataset file the words table is loaded from.")
+    parser.add_argument("--output", type=Path, help="Where to write the index file.")
+    parser.add_argument("--check", type=Path, metavar="INDEX",
+                        help="Validate an index file and its dataset digest instead of building one.")
+    args = parser.parse_args()
+
+    if args.check:
+        sys.exit(check(args.check, args.dataset))
+    if args.output is None:
+        parser.error("--output is required to build an index")
+
+    start = perf_counter()
+    if args.source == "dataset":
+        buckets, watermark = buckets_from_dataset(args.dataset), 0
+    else:
+        buckets, watermark = asyncio.run(buckets_from_database())
+    write_index_file(str(args.output), buckets, generation=1, dataset_digest=file_digest(args.dataset),
+                     word_id_watermark=watermark)
+
+    word_count = sum(len(words) for words in buckets.values())
+    print(f"Wrote {args.output}: {word_count} words, {len(buckets)} signatures, "
+          f"{args.output.stat().st_size} bytes in {perf_counter() - start:.2f}s", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,12 +1,18 @@
+import asyncio
+from typing import Awaitable, Callable, Dict, Optional
+
 from settings import settings
 from sqlalchemy.ext.asyncio import  (
     create_async_engine,
     async_sessionmaker,
+    AsyncConnection,
+    AsyncEngine,
     AsyncSession
 )
 from sqlalchemy.exc import SQLAlchemyError
 from fastapi import FastAPI
 from sqlalchemy.orm import DeclarativeBase
+from lib.metrics import TimedAsyncAdaptedQueuePool, instrument_engine
 import logging
 
 logger = logging.getLogger(__name__)
@@ -16,22 +22,53 @@ class Base(DeclarativeBase):
     pass
 
 
-async def setup_db_engine(app: FastAPI) -> None:
+def _create_engine(uri: str, read_only: bool = False) -> AsyncEngine:
     """
-    Set up the database engine and session factory.
+    Create an asynchronous engine with the configured connection pool.
 
-    This function configures the SQLAlchemy asynchronous engine and session factory
-    and stores them in the application state.
+    Args:
+        uri (str): Database URI.
+        read_only (bool): Run every transaction as READ ONLY, so a write routed
+         to a replica fails loudly even when the replica is the primary itself.
     """
-    from sqlalchemy.sql import text
-
+    # Pool checkout and statement timings feed both the metrics and the trace spans.
+    instrumented = settings.METRICS_ENABLED or settings.TRACING_ENABLED
     engine = create_async_engine(
-        str(settings.SQLALCHEMY_DATABASE_URI),
-        pool_size=5,  # Max 5 connections per worker
-        max_overflow=10,
+        uri,
+        pool_size=settings.DB_POOL_SIZE,
+        max_overflow=settings.DB_MAX_OVERFLOW,
+        pool_timeout=settings.DB_POOL_TIMEOUT,
+        pool_recycle=settings.DB_POOL_RECYCLE,
+        connect_args={"prepared_statement_cache_size": settings.DB_STATEMENT_CACHE_SIZE},
         echo=False,
+        **({"poolclass": TimedAsyncAdaptedQueuePool} if instrumented else {}),
     )
+    if instrumented:
+        instrument_engine(engine.sync_engine)
+    if read_only:
+        engine = engine.execution_options(postgresql_readonly=True)
+    return engine
+
+
+async def _test_connection(engine: AsyncEngine, name: str) -> None:
+    from sqlalchemy.sql import text
+
+    async with engine.connect() as conn:
+        logger.info(f"Testing {name} connection...")
+        await conn.execute(text("SELECT 1"))
+        logger.info(f"{name.capitalize()} connection successful!")
 
+
+async def setup_db_engine(app: FastAPI) -> None:
+    """
+    Set up the database engines and session factories.
+
+    This function configures the SQLAlchemy asynchronous engine and session factory
+    and stores them in the application state. Read-only handlers get a second
+    engine and session factory for DB_READ_REPLICA_URI; without a replica, or if
+    it cannot be reached at startup, they fall back to the primary ones.
+    """
+    engine = _create_engine(str(settings.SQLALCHEMY_DATABASE_URI))
     session_factory = async_sessionmaker(
         engine,
         class_=AsyncSession,
@@ -39,16 +76,72 @@ async def setup_db_engine(app: FastAPI) -> None:
     )
 
     try:
-        async with engine.connect() as conn:
-            logger.info("Testing database connection...")
-            await conn.execute(text("SELECT 1"))
-            logger.info("Database connection successful!")
+        await _test_connection(engine, "database")
     except SQLAlchemyError as e:
         logger.error(f"Database connection failed: {e}")
         raise
 
     app.state.db_engine = engine
     app.state.db_session_factory = session_factory
+    app.state.db_read_engine = engine
+    app.state.db_read_session_factory = session_factory
+
+    if settings.DB_READ_REPLICA_URI is None:
+        return
+
+    read_engine = _create_engine(str(settings.DB_READ_REPLICA_URI), read_only=True)
+    try:
+        await _test_connection(read_engine, "read replica")
+    except (SQLAlchemyError, OSError) as e:
+        logger.error(f"Read replica connection failed, reading from the primary: {e}")
+        await read_engine.dispose()
+        return
+
+    app.state.db_read_engine = read_engine
+    app.state.db_read_session_factory = async_sessionmaker(
+        read_engine,
+        class_=AsyncSession,
+        expire_on_commit=False,
+    )
+
+
+async def warm_up_pool(
+        engine: AsyncEngine,
+        size: int,
+        prepare: Optional[Callable[[AsyncConnection], Awaitable[None]]] = None
+) -> None:
+    """
+    Open `size` connections at once and return them to the pool, so the first
+    requests do not pay for connection setup.
+
+    Args:
+        engine (AsyncEngine): The engine whose pool is warmed up.
+        size (int): Number of connections to open.
+        prepare: Called on each connection before it is returned, e.g. to
+         prepare the hot statements in its statement cache.
+    """
+    connections = await asyncio.gather(*(engine.connect() for _ in range(size)))
+    try:
+        if prepare is not None:
+            for conn in connections:
+                await prepare(conn)
+    finally:
+        for conn in connections:
+            await conn.close()
+
+
+def pool_status(engine: AsyncEngine) -> Dict[str, int]:
+    """
+    Return how saturated the engine's connection pool is.
+    """
+    pool = engine.pool
+    return {
+        "size": pool.size(),
+        "checkedOut": pool.checkedout(),
+        "checkedIn": pool.checkedin(),
+        "overflow": max(pool.overflow(), 0),
+        "maxOverflow": settings.DB_MAX_OVERFLOW,
+    }
 
 
 def get_connection():
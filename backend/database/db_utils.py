@@ -1,20 +1,37 @@
+import asyncio
+import hashlib
+import zlib
+from datetime import datetime, timezone
 from pathlib import Path
+from time import time
+from typing import AsyncIterator, Callable, List, Optional, Tuple
 
 import aiofiles
-from sqlalchemy.ext.asyncio import AsyncEngine
-from sqlalchemy import select, func
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession
+from sqlalchemy import func, select, text
 from fastapi import Depends
-from models.word import Word
+from models.dataset_manifest import DatasetManifest, DatasetManifestChunk
+from models.word import Word, WORD_MAX_LENGTH
 from dependencies import get_db_session
 from models.word import Base
+from settings import settings
+from database.stats_utils import ensure_word_count, get_word_count, increment_word_count
 import logging
 
-from utils.string_utils import compute_letter_frequency
+from utils.dataset_utils import file_digest
+from utils.string_utils import compute_letter_frequencies
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 CHUNK_SIZE = 1000
+READ_BLOCK_SIZE = 1 << 20
+PROGRESS_LOG_INTERVAL = 5.0
+# Dataset chunks average CHUNK_BOUNDARY_MASK + 1 lines
+CHUNK_BOUNDARY_MASK = 0x3FF
+MAX_CHUNK_LINES = 8192
+STAGING_TABLE = "words_staging"
 
 
 async def initialize_tables(engine: AsyncEngine) -> None:
@@ -31,61 +48,266 @@ async def initialize_tables(engine: AsyncEngine) -> None:
         print("Connection test successful")
 
 
-async def load_word_dataset(dataset_path: Path, db_session = Depends(get_db_session)):
+async def load_word_dataset(
+        dataset_path: Path,
+        db_session = Depends(get_db_session),
+        progress: Optional[Callable[[float], None]] = None
+):
     """
-    Load a dataset of words into the Word table.
+    Sync the Word table with a dataset of words.
 
-    This function reads a file containing a list of words, sort each word alphabetically,
-    and stores the original word along with its sorted version in the db.
+    The file is split into content-defined chunks of lines, and the hashes of
+    the chunks whose words are loaded are kept in a manifest together with the
+    digest of the whole file. An unchanged file is recognized by its digest
+    alone; otherwise only the words of chunks missing from the manifest are
+    signed and stored. Words are only ever added: words that leave the dataset
+    stay in the Word table, like words added through the API.
+
+    Changed chunks are loaded in batches of about DATASET_BATCH_SIZE words. With
+    the asyncpg driver each batch goes through COPY into a staging table
+    (DATASET_LOADER="copy"); otherwise the ORM path is used. Each batch commits
+    with the hashes of its chunks, so a sync interrupted part-way resumes after
+    the last committed batch instead of starting over.
 
     Args:
         dataset_path (Path): Path to the dataset.
         db_session: db session dependency
+        progress (Optional[Callable[[float], None]]): Called with the fraction of the file synced so far.
 
     Raises:
         Exception: If an error occurs while loading the dataset.
     """
     try:
-        async with aiofiles.open(dataset_path, 'r') as f:
-            words = [line.strip().lower() async for line in f if line.strip()]  # type: ignore
-
-        total_words = len(words)
-
-        # similar to sql: SELECT COUNT(*) FROM Word;
-        stmt = select(func.count()).select_from(Word)
-        result = await db_session.execute(stmt)
-        word_count = result.scalar_one()
+        await ensure_word_count(db_session)
+        dataset = dataset_path.name
+        digest = await asyncio.to_thread(file_digest, dataset_path)
+        word_count = await get_word_count(db_session)
 
-        if word_count >= total_words:
-            logger.info("Word table already populated. Skipping dataset load.")
+        result = await db_session.execute(
+            select(DatasetManifest.digest, DatasetManifest.last_word_id).where(DatasetManifest.dataset == dataset)
+        )
+        manifest = result.one_or_none()
+        # An emptied Word table voids the manifest.
+        if word_count and manifest is not None and manifest.digest == digest:
+            if manifest.last_word_id is None:
+                # Synced before the manifest recorded it; the file is loaded, so the current highest id bounds it.
+                await db_session.execute(
+                    DatasetManifest.__table__.update()
+                    .where(DatasetManifest.dataset == dataset)
+                    .values(last_word_id=select(func.max(Word.id)).scalar_subquery())
+                )
+                await db_session.commit()
+            logger.info("Words dataset unchanged since the last sync. Skipping dataset load.")
             return
 
-        logger.info(f"Loading words dataset from: {dataset_path}")
+        loaded_chunks = set()
+        if word_count:
+            result = await db_session.execute(
+                select(DatasetManifestChunk.chunk_hash).where(DatasetManifestChunk.dataset == dataset)
+            )
+            loaded_chunks.update(result.scalars().all())
+        logger.info(f"Syncing words dataset from {dataset_path} ({len(loaded_chunks)} chunks already loaded).")
 
-        # Fetch existing words from the database
-        existing_words = set()
-        for i in range(0, len(words), CHUNK_SIZE):
-            chunk = words[i:i + CHUNK_SIZE]
-            stmt = select(Word.word).where(Word.word.in_(chunk))
-            result = await db_session.execute(stmt)
-            existing_words.update(result.scalars().all())
+        if settings.DATASET_LOADER == "copy" and _supports_copy(db_session):
+            load_batch = _copy_word_batch
+        else:
+            load_batch = _orm_load_word_batch
+        dataset_size = dataset_path.stat().st_size
+        start_time = time()
+        next_progress_log = start_time + PROGRESS_LOG_INTERVAL
+        rows_read = rows_added = 0
+        file_chunks = set()
+        pending_words: List[str] = []
+        pending_chunks: List[bytes] = []
 
-        new_words = [
-            Word(word=word,
-                 signature=compute_letter_frequency(word)
+        async def flush() -> None:
+            nonlocal rows_read, rows_added
+            batch = list(zip(pending_words, compute_letter_frequencies(pending_words)))
+            added = await load_batch(batch, db_session) if batch else 0
+            await increment_word_count(db_session, added)
+            await db_session.execute(
+                insert(DatasetManifestChunk)
+                .values([{"dataset": dataset, "chunk_hash": chunk_hash} for chunk_hash in pending_chunks])
+                .on_conflict_do_nothing()
             )
-            for word in words
-            if word not in existing_words
-        ]
-
-        if new_words:
-            db_session.add_all(new_words)
             await db_session.commit()
-            logger.info(f"{len(new_words)} new words added to the Word table.")
+            rows_read += len(batch)
+            rows_added += added
+            pending_words.clear()
+            pending_chunks.clear()
+
+        async for chunk_hash, words, end_offset in read_dataset_chunks(dataset_path):
+            file_chunks.add(chunk_hash)
+            if progress is not None:
+                progress(end_offset / dataset_size)
+            if chunk_hash in loaded_chunks:
+                continue
+            loaded_chunks.add(chunk_hash)
+            pending_words.extend(words)
+            pending_chunks.append(chunk_hash)
+            if len(pending_words) >= settings.DATASET_BATCH_SIZE:
+                await flush()
+            if time() >= next_progress_log:
+                next_progress_log = time() + PROGRESS_LOG_INTERVAL
+                logger.info(f"Dataset sync: {end_offset / dataset_size:.0%} of the file, "
+                            f"{rows_read} rows read, {rows_added} words added.")
+        if pending_chunks:
+            await flush()
+
+        # Chunks no longer in the file; their words stay.
+        await db_session.execute(
+            text(f"DELETE FROM {DatasetManifestChunk.__tablename__} "
+                 f"WHERE dataset = :dataset AND NOT (chunk_hash = ANY(:chunk_hashes))"),
+            {"dataset": dataset, "chunk_hashes": list(file_chunks)}
+        )
+        last_word_id = (await db_session.execute(select(func.max(Word.id)))).scalar_one()
+        values = {"digest": digest, "updated_at": datetime.now(tz=timezone.utc), "last_word_id": last_word_id}
+        statement = insert(DatasetManifest).values(dataset=dataset, **values)
+        await db_session.execute(
+            statement.on_conflict_do_update(index_elements=[DatasetManifest.dataset], set_=values)
+        )
+        await db_session.commit()
+        elapsed = max(time() - start_time, 1e-9)
+
+        if rows_added:
+            logger.info(f"{rows_added} new words added to the Word table.")
         else:
             logger.info("No new words to add. All words already exist.")
+        logger.info(f"Dataset sync: {rows_read} rows from changed chunks in {elapsed:.2f}s "
+                    f"({rows_read / elapsed:,.0f} rows/sec).")
 
     except Exception as e:
         await db_session.rollback()
         print(f"Error loading word dataset: {e}")
-        raise
\ No newline at end of file
+        raise
+
+
+async def read_dataset_chunks(
+        dataset_path: Path,
+        boundary_mask: int = CHUNK_BOUNDARY_MASK,
+        max_chunk_lines: int = MAX_CHUNK_LINES
+) -> AsyncIterator[Tuple[bytes, List[str], int]]:
+    """
+    Split the dataset into content-defined chunks of lines.
+
+    A chunk ends after a line whose CRC32 has none of the `boundary_mask` bits
+    set, or after `max_chunk_lines` lines. Boundaries depend only on the lines
+    themselves, so inserting or removing lines changes the chunks around the
+    edit and leaves the others, and their hashes, as they were.
+
+    Args:
+        dataset_path (Path): Path to the dataset.
+        boundary_mask (int): CRC32 bits that must be clear at a boundary; chunks
+         average `boundary_mask + 1` lines.
+        max_chunk_lines (int): Upper bound on the lines of a chunk.
+
+    Yields:
+        Tuple[bytes, List[str], int]: The SHA-256 of the chunk's lines, its
+         normalized words no longer than WORD_MAX_LENGTH, and the file offset
+         just past it.
+    """
+    chunk_hash = hashlib.sha256()
+    words: List[str] = []
+    chunk_lines = 0
+    position = 0
+    remainder = b""
+    async with aiofiles.open(dataset_path, 'rb') as f:
+        while True:
+            block = await f.read(READ_BLOCK_SIZE)
+            if not block:
+                break
+            lines = (remainder + block).split(b"\n")
+            remainder = lines.pop()
+            for line in lines:
+                position += len(line) + 1
+                chunk_hash.update(line + b"\n")
+                chunk_lines += 1
+                word = line.decode("utf-8").strip().lower()
+                if word and len(word) <= WORD_MAX_LENGTH:
+                    words.append(word)
+                if zlib.crc32(line) & boundary_mask == 0 or chunk_lines >= max_chunk_lines:
+                    yield chunk_hash.digest(), words, position
+                    chunk_hash = hashlib.sha256()
+                    words = []
+                    chunk_lines = 0
+    if remainder:
+        position += len(remainder)
+        chunk_hash.update(remainder)
+        chunk_lines += 1
+        word = remainder.decode("utf-8").strip().lower()
+        if word and len(word) <= WORD_MAX_LENGTH:
+            words.append(word)
+    if chunk_lines:
+        yield chunk_hash.digest(), words, position
+
+
+def _supports_copy(db_session: AsyncSession) -> bool:
+    """
+    COPY is only reachable through the asyncpg driver connection.
+    """
+    return db_session.get_bind().dialect.driver == "asyncpg"
+
+
+async def _copy_word_batch(batch: List[Tuple[str, bytes]], db_session: AsyncSession) -> int:
+    """
+    Copy a batch of words into a staging table with COPY, then merge it into the Word table.
+
+    Words already present (or repeated in the file) are skipped by
+    INSERT ... ON CONFLICT DO NOTHING. The staging table is temporary and is
+    dropped when the batch's transaction commits.
+
+    Args:
+        batch (List[Tuple[str, bytes]]): Words with their signatures.
+        db_session (AsyncSession): db session.
+
+    Returns:
+        int: Rows added to the Word table.
+    """
+    # Executing through the session opens the transaction the COPY joins.
+    await db_session.execute(text(
+        f"CREATE TEMP TABLE {STAGING_TABLE} (word text NOT NULL, signature bytea NOT NULL) ON COMMIT DROP"
+    ))
+    connection = await db_session.connection()
+    raw_connection = await connection.get_raw_connection()
+    await raw_connection.driver_connection.copy_records_to_table(
+        STAGING_TABLE, records=batch, columns=("word", "signature")
+    )
+
+    result = await db_session.execute(text(
+        f"INSERT INTO {Word.__tablename__} (word, signature) "
+        f"SELECT word, signature FROM {STAGING_TABLE} "
+        f"ON CONFLICT (word) DO NOTHING"
+    ))
+    return result.rowcount
+
+
+async def _orm_load_word_batch(batch: List[Tuple[str, bytes]], db_session: AsyncSession) -> int:
+    """
+    Load a batch of words through ORM Word objects, skipping words that already exist.
+
+    Args:
+        batch (List[Tuple[str, bytes]]): Words with their signatures.
+        db_session (AsyncSession): db session.
+
+    Returns:
+        int: Rows added to the Word table.
+    """
+    # Fetch existing words from the database
+    existing_words = set()
+    for i in range(0, len(batch), CHUNK_SIZE):
+        chunk = [word for word, _ in batch[i:i + CHUNK_SIZE]]
+        stmt = select(Word.word).where(Word.word.in_(chunk))
+        result = await db_session.execute(stmt)
+        existing_words.update(result.scalars().all())
+
+    new_words = []
+    for word, signature in batch:
+        if word not in existing_words:
+            # Also skips repeats within the batch.
+            existing_words.add(word)
+            new_words.append(Word(word=word, signature=signature))
+
+    if new_words:
+        db_session.add_all(new_words)
+        await db_session.flush()
+    return len(new_words)
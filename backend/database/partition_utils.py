@@ -0,0 +1,258 @@
+import logging
+from datetime import date, datetime, time, timedelta, timezone
+from typing import Dict, List, Literal, Optional
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncEngine
+
+from models.request_log import RequestLog
+from models.request_log_rollup import RequestLogRollup
+
+logger = logging.getLogger(__name__)
+
+RetentionMode = Literal["drop", "summarize"]
+
+PARENT_TABLE = RequestLog.__tablename__
+PARTITION_PREFIX = f"{PARENT_TABLE}_p"
+# Catches rows no daily partition covers, e.g. if maintenance fell behind,
+# rather than failing the insert; partition_day ignores it.
+DEFAULT_PARTITION = f"{PARTITION_PREFIX}default"
+ROLLUP_TABLE = RequestLogRollup.__tablename__
+# Advisory lock serializing partition maintenance between workers.
+MAINTENANCE_LOCK_ID = 0x72657131
+
+
+def partition_name(day: date) -> str:
+    """
+    Return the name of the request_log partition holding a UTC day, e.g. request_log_p20261018.
+    """
+    return f"{PARTITION_PREFIX}{day:%Y%m%d}"
+
+
+def partition_day(name: str) -> Optional[date]:
+    """
+    Return the UTC day held by a request_log partition, or None for a table not named by partition_name.
+    """
+    if not name.startswith(PARTITION_PREFIX):
+        return None
+    try:
+        return datetime.strptime(name[len(PARTITION_PREFIX):], "%Y%m%d").date()
+    except ValueError:
+        return None
+
+
+def _day_start(day: date) -> str:
+    return datetime.combine(day, time.min, tzinfo=timezone.utc).isoformat()
+
+
+async def is_partitioned(conn: AsyncConnection) -> bool:
+    """
+    Return whether request_log is a partitioned table, i.e. its migration has been applied.
+    """
+    result = await conn.execute(
+        text("SELECT relkind = 'p' FROM pg_class WHERE oid = to_regclass(:parent)"),
+        {"parent": PARENT_TABLE},
+    )
+    return bool(result.scalar_one_or_none())
+
+
+async def list_partitions(conn: AsyncConnection) -> List[str]:
+    """
+    Return the names of the partitions currently attached to request_log.
+    """
+    result = await conn.execute(
+        text(
+            "SELECT child.relname FROM pg_inherits "
+            "JOIN pg_class child ON child.oid = pg_inherits.inhrelid "
+            "WHERE pg_inherits.inhparent = CAST(:parent AS regclass)"
+        ),
+        {"parent": PARENT_TABLE},
+    )
+    return list(result.scalars())
+
+
+async def create_default_partition(conn: AsyncConnection) -> bool:
+    """
+    Create the default partition of request_log if it is missing.
+
+    Returns:
+        bool: True if it was created.
+    """
+    if DEFAULT_PARTITION in await list_partitions(conn):
+        return False
+    await conn.execute(text(f'CREATE TABLE "{DEFAULT_PARTITION}" PARTITION OF {PARENT_TABLE} DEFAULT'))
+    return True
+
+
+async def create_partitions(conn: AsyncConnection, first_day: date, days: int) -> List[str]:
+    """
+    Create the missing daily partitions from `first_day` for `days` days.
+
+    Rows of those days that landed in the default partition are moved to the
+    new partition: Postgres refuses to create it while the default holds any.
+
+    Returns:
+        List[str]: The names of the partitions created.
+    """
+    existing = set(await list_partitions(conn))
+    created = []
+    for offset in range(days):
+        day = first_day + timedelta(days=offset)
+        name = partition_name(day)
+        if name in existing:
+            continue
+        # DDL takes no bind parameters; the bounds are generated here, not user input.
+        bounds = f"timestamp >= '{_day_start(day)}' AND timestamp < '{_day_start(day + timedelta(days=1))}'"
+        stranded = DEFAULT_PARTITION in existing and (await conn.execute(
+            text(f'SELECT EXISTS (SELECT 1 FROM "{DEFAULT_PARTITION}" WHERE {bounds})')
+        )).scalar_one()
+        if stranded:
+            await conn.execute(text(
+                f'CREATE TEMPORARY TABLE request_log_stranded ON COMMIT DROP AS '
+                f'SELECT * FROM "{DEFAULT_PARTITION}" WHERE {bounds}'
+            ))
+            await conn.execute(text(f'DELETE FROM "{DEFAULT_PARTITION}" WHERE {bounds}'))
+        await conn.execute(text(
+            f'CREATE TABLE "{name}" PARTITION OF {PARENT_TABLE} '
+            f"FOR VALUES FROM ('{_day_start(day)}') TO ('{_day_start(day + timedelta(days=1))}')"
+        ))
+        if stranded:
+            await conn.execute(text(f"INSERT INTO {PARENT_TABLE} SELECT * FROM request_log_stranded"))
+            await conn.execute(text("DROP TABLE request_log_stranded"))
+        created.append(name)
+    return created
+
+
+async def summarize_partition(conn: AsyncConnection, name: str, before: Optional[date] = None) -> None:
+    """
+    Fold a partition's rows into request_log_rollup, keeping the buckets that already exist.
+
+    Rollups are written together with the request logs, so this only fills in
+    buckets for rows that were inserted without them.
+
+    Args:
+        conn (AsyncConnection): Connection, in a transaction.
+        name (str): The partition.
+        before (Optional[date]): Only fold the rows of the UTC days before this one.
+    """
+    before_clause = f"AND timestamp < '{_day_start(before)}'" if before is not None else ""
+    await conn.execute(text(f"""
+        INSERT INTO {ROLLUP_TABLE} (bucket_start, endpoint, request_count, processing_time_sum,
+                                    processing_time_min, processing_time_max)
+        SELECT date_trunc('minute', timestamp), endpoint, count(*), coalesce(sum(processing_time), 0),
+               min(processing_time), max(processing_time)
+        FROM "{name}"
+        WHERE endpoint IS NOT NULL {before_clause}
+        GROUP BY 1, 2
+        ON CONFLICT (bucket_start, endpoint) DO NOTHING
+    """))
+
+
+async def drop_partitions_before(conn: AsyncConnection, cutoff: date, mode: RetentionMode = "drop") -> List[str]:
+    """
+    Drop the daily partitions holding days before `cutoff`.
+
+    Args:
+        conn (AsyncConnection): Connection, in a transaction.
+        cutoff (date): First UTC day to keep.
+        mode (RetentionMode): "summarize" folds each partition into the rollups before dropping it.
+
+    Returns:
+        List[str]: The names of the partitions dropped.
+    """
+    dropped = []
+    partitions = sorted(await list_partitions(conn))
+    for name in partitions:
+        day = partition_day(name)
+        if day is None or day >= cutoff:
+            continue
+        if mode == "summarize":
+            await summarize_partition(conn, name)
+        await conn.execute(text(f'DROP TABLE "{name}"'))
+        dropped.append(name)
+
+    if DEFAULT_PARTITION in partitions:
+        # Its rows of the expired days go too, the same way.
+        if mode == "summarize":
+            await summarize_partition(conn, DEFAULT_PARTITION, before=cutoff)
+        await conn.execute(text(f"""DELETE FROM "{DEFAULT_PARTITION}" WHERE timestamp < '{_day_start(cutoff)}'"""))
+    return dropped
+
+
+async def compact_rollups_before(conn: AsyncConnection, cutoff: date) -> int:
+    """
+    Merge the per-minute rollup buckets of the UTC days before `cutoff` into one bucket per day and endpoint.
+
+    The totals are unchanged; only their granularity is lost, so the rollups
+    grow by a few rows per day instead of one per minute and endpoint.
+
+    Returns:
+        int: The number of per-minute buckets merged.
+    """
+    result = await conn.execute(text(f"""
+        WITH merged AS (
+            DELETE FROM {ROLLUP_TABLE}
+            WHERE bucket_start < :cutoff AND bucket_start <> date_trunc('day', bucket_start, 'UTC')
+            RETURNING bucket_start, endpoint, request_count, processing_time_sum,
+                      processing_time_min, processing_time_max
+        ), inserted AS (
+            INSERT INTO {ROLLUP_TABLE} AS rollup (bucket_start, endpoint, request_count, processing_time_sum,
+                                                  processing_time_min, processing_time_max)
+            SELECT date_trunc('day', bucket_start, 'UTC'), endpoint, sum(request_count), sum(processing_time_sum),
+                   min(processing_time_min), max(processing_time_max)
+            FROM merged
+            GROUP BY 1, 2
+            ON CONFLICT (bucket_start, endpoint) DO UPDATE SET
+                request_count = rollup.request_count + excluded.request_count,
+                processing_time_sum = rollup.processing_time_sum + excluded.processing_time_sum,
+                processing_time_min = least(rollup.processing_time_min, excluded.processing_time_min),
+                processing_time_max = greatest(rollup.processing_time_max, excluded.processing_time_max)
+        )
+        SELECT count(*) FROM merged
+    """), {"cutoff": datetime.combine(cutoff, time.min, tzinfo=timezone.utc)})
+    return result.scalar_one()
+
+
+async def maintain_partitions(
+        engine: AsyncEngine,
+        premake_days: int,
+        retention_days: int,
+        mode: RetentionMode = "drop",
+        today: Optional[date] = None,
+        rollup_retention_days: int = 0,
+) -> Dict[str, List[str]]:
+    """
+    Create the partitions for today and the next days, and apply the retention periods.
+
+    Runs in one transaction under an advisory lock, so workers doing it at the
+    same time wait for each other instead of racing on the same partitions.
+
+    Args:
+        engine (AsyncEngine): The primary engine.
+        premake_days (int): Days after today to create partitions for.
+        retention_days (int): Days of request logs to keep, today included; 0 keeps everything.
+        mode (RetentionMode): What happens to the partitions past the retention period.
+        today (Optional[date]): The current UTC day; defaults to now.
+        rollup_retention_days (int): Days of per-minute rollups to keep, today included;
+         older ones are merged into daily buckets. 0 keeps them all.
+
+    Returns:
+        Dict[str, List[str]]: The partitions created and dropped.
+    """
+    today = today or datetime.now(tz=timezone.utc).date()
+    async with engine.begin() as conn:
+        await conn.execute(text("SELECT pg_advisory_xact_lock(:lock_id)"), {"lock_id": MAINTENANCE_LOCK_ID})
+        if not await is_partitioned(conn):
+            logger.warning(f"{PARENT_TABLE} is not partitioned; run `alembic upgrade head` to partition it.")
+            return {"created": [], "dropped": []}
+        created = await create_partitions(conn, today, premake_days + 1)
+        if await create_default_partition(conn):
+            created.append(DEFAULT_PARTITION)
+        dropped = []
+        if retention_days > 0:
+            dropped = await drop_partitions_before(conn, today - timedelta(days=retention_days - 1), mode)
+        if rollup_retention_days > 0:
+            compacted = await compact_rollups_before(conn, today - timedelta(days=rollup_retention_days - 1))
+            if compacted:
+                logger.info(f"Merged {compacted} per-minute request log rollups into daily ones.")
+    return {"created": created, "dropped": dropped}
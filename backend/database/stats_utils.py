@@ -0,0 +1,150 @@
+from datetime import datetime
+from typing import Any, Dict, Iterable, Optional, Tuple
+
+from sqlalchemy import select, func, literal
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from models.request_log_rollup import RequestLogRollup
+from models.service_counter import ServiceCounter
+from models.word import Word
+
+WORD_COUNTER = "words"
+
+
+def rollup_bucket(timestamp: datetime) -> datetime:
+    """
+    Return the start of the one-minute rollup bucket holding the timestamp.
+    """
+    return timestamp.replace(second=0, microsecond=0)
+
+
+async def record_rollups(db_session: AsyncSession, entries: Iterable[Dict[str, Any]]) -> None:
+    """
+    Fold request log entries into their per-minute, per-endpoint rollup buckets.
+
+    Runs in the caller's transaction so the rollups commit together with the
+    request_log rows they summarize.
+
+    Args:
+        db_session (AsyncSession): db session.
+        entries: Request log entries with endpoint, timestamp and processing_time.
+    """
+    buckets: Dict[Tuple[datetime, str], Dict[str, Any]] = {}
+    for entry in entries:
+        key = (rollup_bucket(entry["timestamp"]), entry["endpoint"])
+        processing_time = entry["processing_time"]
+        bucket = buckets.get(key)
+        if bucket is None:
+            buckets[key] = {
+                "bucket_start": key[0],
+                "endpoint": key[1],
+                "request_count": 1,
+                "processing_time_sum": processing_time,
+                "processing_time_min": processing_time,
+                "processing_time_max": processing_time,
+            }
+        else:
+            bucket["request_count"] += 1
+            bucket["processing_time_sum"] += processing_time
+            bucket["processing_time_min"] = min(bucket["processing_time_min"], processing_time)
+            bucket["processing_time_max"] = max(bucket["processing_time_max"], processing_time)
+
+    if not buckets:
+        return
+
+    # Sorted keys keep concurrent writers locking bucket rows in the same order.
+    rows = [buckets[key] for key in sorted(buckets)]
+    statement = insert(RequestLogRollup).values(rows)
+    statement = statement.on_conflict_do_update(
+        index_elements=[RequestLogRollup.bucket_start, RequestLogRollup.endpoint],
+        set_={
+            "request_count": RequestLogRollup.request_count + statement.excluded.request_count,
+            "processing_time_sum": RequestLogRollup.processing_time_sum + statement.excluded.processing_time_sum,
+            "processing_time_min": func.least(RequestLogRollup.processing_time_min,
+                                              statement.excluded.processing_time_min),
+            "processing_time_max": func.greatest(RequestLogRollup.processing_time_max,
+                                                 statement.excluded.processing_time_max),
+        },
+    )
+    await db_session.execute(statement)
+
+
+async def get_rollup_totals(
+        db_session: AsyncSession,
+        endpoint: Optional[str] = None,
+        from_date: Optional[datetime] = None,
+        to_date: Optional[datetime] = None,
+) -> Tuple[int, float]:
+    """
+    Sum the rollup buckets in a time frame, at one-minute granularity.
+
+    Args:
+        db_session (AsyncSession): db session.
+        endpoint (Optional[str]): Restrict to one endpoint.
+        from_date (Optional[datetime]): Include buckets covering this time onwards.
+        to_date (Optional[datetime]): Include buckets starting up to this time.
+
+    Returns:
+        Tuple[int, float]: The request count and the summed processing time.
+    """
+    statement = select(
+        func.coalesce(func.sum(RequestLogRollup.request_count), 0),
+        func.coalesce(func.sum(RequestLogRollup.processing_time_sum), 0.0),
+    )
+    if endpoint is not None:
+        statement = statement.where(RequestLogRollup.endpoint == endpoint)
+    if from_date is not None:
+        statement = statement.where(RequestLogRollup.bucket_start >= rollup_bucket(from_date))
+    if to_date is not None:
+        statement = statement.where(RequestLogRollup.bucket_start <= to_date)
+
+    result = await db_session.execute(statement)
+    request_count, processing_time_sum = result.one()
+    return int(request_count), float(processing_time_sum)
+
+
+async def ensure_word_count(db_session: AsyncSession) -> None:
+    """
+    Seed the word counter from the Word table the first time it is needed.
+    """
+    result = await db_session.execute(
+        select(ServiceCounter.value).where(ServiceCounter.name == WORD_COUNTER)
+    )
+    if result.scalar_one_or_none() is not None:
+        return
+
+    statement = insert(ServiceCounter).from_select(
+        [ServiceCounter.name, ServiceCounter.value],
+        select(literal(WORD_COUNTER, ServiceCounter.name.type), func.count()).select_from(Word),
+    ).on_conflict_do_nothing(index_elements=[ServiceCounter.name])
+    await db_session.execute(statement)
+    await db_session.commit()
+
+
+async def increment_word_count(db_session: AsyncSession, delta: int) -> None:
+    """
+    Adjust the word counter in the caller's transaction.
+    """
+    if not delta:
+        return
+    statement = insert(ServiceCounter).values(name=WORD_COUNTER, value=delta)
+    statement = statement.on_conflict_do_update(
+        index_elements=[ServiceCounter.name],
+        set_={"value": ServiceCounter.value + statement.excluded.value},
+    )
+    await db_session.execute(statement)
+
+
+async def get_word_count(db_session: AsyncSession) -> int:
+    """
+    Return the cached word count, counting the Word table only if the counter is missing.
+    """
+    result = await db_session.execute(
+        select(ServiceCounter.value).where(ServiceCounter.name == WORD_COUNTER)
+    )
+    count = result.scalar_one_or_none()
+    if count is None:
+        result = await db_session.execute(select(func.count()).select_from(Word))
+        count = result.scalar_one()
+    return int(count)
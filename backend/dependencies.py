@@ -1,10 +1,25 @@
 from fastapi import FastAPI
 
+import asyncio
+import logging
+from concurrent.futures import ProcessPoolExecutor
 from contextlib import asynccontextmanager
-from typing import AsyncGenerator
+from time import monotonic
+from typing import AsyncGenerator, Optional
 from fastapi import Request
+from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from lib.anagram_index import AnagramIndex
+from lib.near_anagram_index import NearAnagramIndex
+from lib.request_log_sink import RequestLogSink
+from lib.similar_cache import SimilarWordsCache
+from lib.subanagram_index import SubanagramIndex
+from lib.tracing import span
+from settings import settings
+
+logger = logging.getLogger(__name__)
+
 
 async def get_db_session(request: Request) -> AsyncGenerator[AsyncSession, None]:
     """
@@ -24,26 +39,163 @@ async def get_db_session(request: Request) -> AsyncGenerator[AsyncSession, None]
         await session.rollback()
         raise e
     finally:
-        await session.close()
+        with span("db.session.close"):
+            await session.close()
+
+
+async def get_read_db_session(request: Request) -> AsyncGenerator[AsyncSession, None]:
+    """
+    Dependency that provides a read-only database session for handlers that only query.
+
+    The session is bound to the read replica when one is configured, and to the
+    primary otherwise, or when the replica cannot be connected to (see
+    `_read_session`). Writes, including inline request logs, must use `get_db_session`.
+
+    Args:
+        request (Request): FastAPI request object.
+
+    Yields:
+        AsyncSession: An instance of the SQLAlchemy asynchronous session.
+    """
+    session = await _read_session(request.app)
+    try:
+        yield session
+    finally:
+        with span("db.session.close"):
+            await session.close()
+
+
+def get_anagram_index(request: Request) -> Optional[AnagramIndex]:
+    """
+    Dependency that provides the in-memory anagram index, if it was built.
+
+    Args:
+        request (Request): FastAPI request object.
+
+    Returns:
+        Optional[AnagramIndex]: The index, or None when it is disabled.
+    """
+    return getattr(request.app.state, "anagram_index", None)
+
+
+def get_subanagram_index(request: Request) -> Optional[SubanagramIndex]:
+    """
+    Dependency that provides the in-memory sub-anagram index, if it was built.
+
+    Args:
+        request (Request): FastAPI request object.
+
+    Returns:
+        Optional[SubanagramIndex]: The index, or None when it is disabled.
+    """
+    return getattr(request.app.state, "subanagram_index", None)
+
+
+def get_near_anagram_index(request: Request) -> Optional[NearAnagramIndex]:
+    """
+    Dependency that provides the in-memory near-anagram index, if it was built.
+
+    Args:
+        request (Request): FastAPI request object.
+
+    Returns:
+        Optional[NearAnagramIndex]: The index, or None when it is disabled.
+    """
+    return getattr(request.app.state, "near_anagram_index", None)
+
+
+def get_phrase_anagram_pool(request: Request) -> Optional[ProcessPoolExecutor]:
+    """
+    Dependency that provides the process pool running phrase anagram searches, if started.
+
+    Args:
+        request (Request): FastAPI request object.
+
+    Returns:
+        Optional[ProcessPoolExecutor]: The pool, or None when the endpoint is disabled.
+    """
+    return getattr(request.app.state, "phrase_anagram_pool", None)
+
+
+def get_phrase_anagram_slots(request: Request) -> Optional[asyncio.Semaphore]:
+    """
+    Dependency that provides the semaphore bounding the pending phrase anagram searches.
+
+    Args:
+        request (Request): FastAPI request object.
+
+    Returns:
+        Optional[asyncio.Semaphore]: The semaphore, or None when the endpoint is disabled.
+    """
+    return getattr(request.app.state, "phrase_anagram_slots", None)
+
+
+def get_request_log_sink(request: Request) -> Optional[RequestLogSink]:
+    """
+    Dependency that provides the background request-log writer, if it is running.
+
+    Args:
+        request (Request): FastAPI request object.
+
+    Returns:
+        Optional[RequestLogSink]: The sink, or None when request logs are written inline.
+    """
+    return getattr(request.app.state, "request_log_sink", None)
+
+
+def get_similar_cache(request: Request) -> Optional[SimilarWordsCache]:
+    """
+    Dependency that provides the signature-keyed cache of /similar lookups, if enabled.
+
+    Args:
+        request (Request): FastAPI request object.
+
+    Returns:
+        Optional[SimilarWordsCache]: The cache, or None when it is disabled.
+    """
+    return getattr(request.app.state, "similar_cache", None)
 
 
 @asynccontextmanager
-async def get_db_session_app(app: FastAPI) -> AsyncGenerator[AsyncSession, None]:
+async def get_db_session_app(app: FastAPI, read_only: bool = False) -> AsyncGenerator[AsyncSession, None]:
     """
     Dependency that provides a database session using the FastAPI application instance.
 
     Args:
         app (FastAPI): FastAPI application instance.
+        read_only (bool): Use the read replica's session factory (the primary's without a replica).
 
     Yields:
         AsyncSession: An instance of the SQLAlchemy asynchronous session.
     """
-    session_factory = app.state.db_session_factory
-    session: AsyncSession = session_factory()
+    session: AsyncSession = await _read_session(app) if read_only else app.state.db_session_factory()
     try:
         yield session
     except Exception as e:
         await session.rollback()
         raise e
     finally:
-        await session.close()
\ No newline at end of file
+        await session.close()
+
+
+async def _read_session(app: FastAPI) -> AsyncSession:
+    """
+    Open a session on the read replica, or on the primary if the replica connection fails.
+
+    The connection is checked out up front, so a replica that went down is
+    noticed before the handler runs; reads then stay on the primary for
+    DB_READ_REPLICA_RETRY_SECONDS before the replica is tried again.
+    """
+    state = app.state
+    has_replica = state.db_read_session_factory is not state.db_session_factory
+    if has_replica and monotonic() >= getattr(state, "db_read_replica_retry_at", 0.0):
+        session: AsyncSession = state.db_read_session_factory()
+        try:
+            await session.connection()
+            return session
+        except (SQLAlchemyError, OSError) as e:
+            await session.close()
+            state.db_read_replica_retry_at = monotonic() + settings.DB_READ_REPLICA_RETRY_SECONDS
+            logger.error(f"Read replica connection failed, reading from the primary "
+                         f"for {settings.DB_READ_REPLICA_RETRY_SECONDS:g}s: {e}")
+    return state.db_session_factory()
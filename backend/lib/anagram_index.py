@@ -0,0 +1,71 @@
+import logging
+from typing import Dict, List, Optional
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from models.word import Word
+
+logger = logging.getLogger(__name__)
+
+INDEX_FETCH_SIZE = 10_000
+
+
+class AnagramIndex:
+    """
+    In-memory mapping of letter-frequency signature -> words sharing it.
+
+    The words table stays the source of truth: the index is built from it on
+    startup and kept current by the endpoints that insert words.
+    """
+
+    def __init__(self) -> None:
+        self._buckets: Dict[bytes, List[str]] = {}
+        self._size = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    def add(self, word: str, signature: bytes) -> bool:
+        """
+        Add a word to the index.
+
+        Returns:
+            bool: True if the word was added, False if it was already indexed.
+        """
+        bucket = self._buckets.setdefault(signature, [])
+        if word in bucket:
+            return False
+        bucket.append(word)
+        self._size += 1
+        return True
+
+    def lookup(self, signature: bytes) -> Optional[List[str]]:
+        """
+        Return the words sharing a signature, or None if the signature is not indexed.
+        """
+        return self._buckets.get(signature)
+
+    @classmethod
+    async def build(cls, db_session: AsyncSession) -> "AnagramIndex":
+        """
+        Build the index by streaming the words table through a server-side cursor.
+
+        Args:
+            db_session (AsyncSession): db session.
+
+        Returns:
+            AnagramIndex: The populated index.
+        """
+        index = cls()
+        statement = (
+            select(Word.word, Word.signature)
+            .execution_options(yield_per=INDEX_FETCH_SIZE)
+        )
+        result = await db_session.stream(statement)
+        async for rows in result.partitions():
+            for word, signature in rows:
+                index.add(word, signature)
+
+        logger.info(f"Anagram index built: {len(index)} words, {len(index._buckets)} signatures.")
+        return index
@@ -0,0 +1,196 @@
+"""
+Binary anagram index file, memory-mapped for zero-copy lookups.
+
+Layout: a fixed header, the signatures sorted as fixed-width keys, one offset
+per signature (plus an end offset) into the blob, and the blob holding each
+signature's words newline-separated. The header carries a CRC32 of everything
+after it, to reject truncated or corrupt files, the SHA-256 of the dataset
+file the words came from, to recognize artifacts built for another dataset,
+and, for a file built from the words table, the highest word id it holds, so
+that only the words added since are read from the table.
+
+Only the standard library and utils are imported here, so the builder CLI
+runs without the settings or the database.
+"""
+import mmap
+import os
+import struct
+import zlib
+from typing import Dict, List, Optional, Sequence
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional: lookup_many falls back to one binary search per signature.
+    np = None
+
+from utils.string_utils import ALPHABET_SIZE
+
+MAGIC = b"ANAGIDX\x00"
+FORMAT_VERSION = 3
+# magic, format version, signature size, generation, signature count, word count, blob size,
+# CRC32 of the body, SHA-256 of the dataset, highest word id; padded to 96 bytes.
+HEADER = struct.Struct("<8sHHQIIQI32sQ16x")
+OFFSET = struct.Struct("<I")
+CHECKSUM_BLOCK_SIZE = 1 << 20
+
+
+class IndexFileError(Exception):
+    """
+    The file is not a usable index: wrong format, truncated or corrupt.
+    """
+
+
+def write_index_file(
+        path: str,
+        buckets: Dict[bytes, List[str]],
+        generation: int = 1,
+        dataset_digest: bytes = b"",
+        word_id_watermark: int = 0,
+) -> None:
+    """
+    Write signature -> words buckets as an index file, replacing `path` atomically.
+
+    Args:
+        path (str): Where to write the index.
+        buckets (Dict[bytes, List[str]]): Words per signature.
+        generation (int): Generation number of the file.
+        dataset_digest (bytes): SHA-256 of the dataset file the words came from, if any.
+        word_id_watermark (int): Highest words.id the buckets hold; 0 when built from the dataset file.
+    """
+    signatures = sorted(buckets)
+    blob = bytearray()
+    offsets = bytearray()
+    for signature in signatures:
+        offsets += OFFSET.pack(len(blob))
+        blob += "\n".join(buckets[signature]).encode("utf-8")
+    offsets += OFFSET.pack(len(blob))
+    word_count = sum(len(words) for words in buckets.values())
+
+    body = [b"".join(signatures), offsets, blob]
+    checksum = 0
+    for part in body:
+        checksum = zlib.crc32(part, checksum)
+
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(HEADER.pack(MAGIC, FORMAT_VERSION, ALPHABET_SIZE, generation, len(signatures),
+                            word_count, len(blob), checksum, dataset_digest, word_id_watermark))
+        for part in body:
+            f.write(part)
+    os.replace(tmp_path, path)
+
+
+def read_generation(path: str) -> int:
+    """
+    Read the generation of an index file from its header, without validating the rest of the file.
+
+    Raises:
+        FileNotFoundError: The file does not exist.
+        IndexFileError: The file is not an index.
+    """
+    with open(path, "rb") as f:
+        header = f.read(HEADER.size)
+    if len(header) < HEADER.size:
+        raise IndexFileError(f"{path} is too short to be an index")
+    magic, version, signature_size, generation = HEADER.unpack(header)[:4]
+    if magic != MAGIC or version != FORMAT_VERSION or signature_size != ALPHABET_SIZE:
+        raise IndexFileError(f"{path} is not a version {FORMAT_VERSION} index")
+    return generation
+
+
+class IndexFile:
+    """
+    A read-only mapping of an index file, validated when opened.
+
+    Raises:
+        FileNotFoundError: The file does not exist.
+        IndexFileError: The file is not a usable index.
+    """
+
+    def __init__(self, path: str) -> None:
+        with open(path, "rb") as f:
+            stat = os.fstat(f.fileno())
+            if stat.st_size < HEADER.size:
+                raise IndexFileError(f"{path} is too short to be an index")
+            mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        try:
+            (magic, version, signature_size, self.generation, self.signature_count, self.word_count,
+             blob_size, checksum, self.dataset_digest, self.word_id_watermark) = HEADER.unpack_from(mm)
+            if magic != MAGIC or version != FORMAT_VERSION or signature_size != ALPHABET_SIZE:
+                raise IndexFileError(f"{path} is not a version {FORMAT_VERSION} index")
+
+            self._offsets_start = HEADER.size + self.signature_count * ALPHABET_SIZE
+            self._blob_start = self._offsets_start + (self.signature_count + 1) * OFFSET.size
+            if len(mm) != self._blob_start + blob_size:
+                raise IndexFileError(f"{path} is truncated")
+            if self._checksum(mm) != checksum:
+                raise IndexFileError(f"{path} fails its checksum")
+        except (IndexFileError, struct.error):
+            mm.close()
+            raise
+
+        self._mm = mm
+        # Signatures as a NumPy array over the mapping, created by the first lookup_many.
+        self._keys = None
+        # Identifies the file, to notice when it is replaced by a new generation.
+        self.file_id = (stat.st_dev, stat.st_ino)
+
+    @staticmethod
+    def _checksum(mm: mmap.mmap) -> int:
+        checksum = 0
+        view = memoryview(mm)
+        try:
+            for start in range(HEADER.size, len(mm), CHECKSUM_BLOCK_SIZE):
+                checksum = zlib.crc32(view[start:start + CHECKSUM_BLOCK_SIZE], checksum)
+        finally:
+            view.release()
+        return checksum
+
+    def lookup(self, signature: bytes) -> Optional[List[str]]:
+        """
+        Return the words sharing a signature, or None if the signature is not in the file.
+        """
+        low, high = 0, self.signature_count
+        while low < high:
+            mid = (low + high) // 2
+            key = self._key(mid)
+            if key < signature:
+                low = mid + 1
+            elif key > signature:
+                high = mid
+            else:
+                return self._words(mid)
+        return None
+
+    def lookup_many(self, signatures: Sequence[bytes]) -> List[Optional[List[str]]]:
+        """
+        Look up many signatures at once; with NumPy, the searches run as one vectorized call.
+
+        Returns:
+            List[Optional[List[str]]]: The words per signature, None where it is not in the file.
+        """
+        if np is None or not signatures:
+            return [self.lookup(signature) for signature in signatures]
+        if self._keys is None:
+            self._keys = np.frombuffer(self._mm, dtype=f"S{ALPHABET_SIZE}",
+                                       count=self.signature_count, offset=HEADER.size)
+        positions = np.searchsorted(self._keys, np.array(signatures, dtype=self._keys.dtype)).tolist()
+        return [
+            self._words(position)
+            if position < self.signature_count and self._key(position) == signature else None
+            for signature, position in zip(signatures, positions)
+        ]
+
+    def _key(self, position: int) -> bytes:
+        start = HEADER.size + position * ALPHABET_SIZE
+        return self._mm[start:start + ALPHABET_SIZE]
+
+    def _words(self, position: int) -> List[str]:
+        begin, end = struct.unpack_from("<II", self._mm, self._offsets_start + position * OFFSET.size)
+        return self._mm[self._blob_start + begin:self._blob_start + end].decode("utf-8").split("\n")
+
+    def close(self) -> None:
+        # The NumPy view must go before the mapping can be closed.
+        self._keys = None
+        self._mm.close()
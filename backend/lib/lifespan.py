@@ -1,23 +1,55 @@
+import asyncio
+import multiprocessing
 from collections.abc import AsyncGenerator
-from contextlib import asynccontextmanager
-from typing import Optional
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import asynccontextmanager, suppress
+from time import sleep
+from typing import Callable, List, Optional
 
 from fastapi import FastAPI
 from sqlalchemy.ext.asyncio import async_sessionmaker, AsyncEngine
 
 from settings import settings
-from database.connection import setup_db_engine
+from database.connection import pool_status, setup_db_engine, warm_up_pool
 from database.db_utils import initialize_tables, load_word_dataset
+from database.stats_utils import get_word_count
+from lib.anagram_index import AnagramIndex
+from lib.metrics import mark_process_dead
+from lib.near_anagram_index import NearAnagramIndex
+from lib.partition_maintenance import PartitionMaintainer
+from lib.phrase_anagrams import init_worker
+from lib.request_log_sink import RequestLogSink
+from lib.shared_anagram_index import SharedAnagramIndex
+from lib.similar_cache import SimilarWordsCache
+from lib.subanagram_index import SubanagramIndex
+from lib.warmup import WarmupStatus
+from lib.word_events import WordEventListener, apply_words_added
+from utils.dataset_utils import file_digest
 
 from dependencies import get_db_session_app
 import logging
 
 logger = logging.getLogger(__name__)
 
+WORDS_DATASET_PATH = settings.CURRENT_FILE.parent / "dataset/words_dataset.txt"
+
 
 class AppState:
     db_engine: Optional[AsyncEngine] = None
     db_session_factory: Optional[async_sessionmaker] = None
+    db_read_engine: Optional[AsyncEngine] = None
+    db_read_session_factory: Optional[async_sessionmaker] = None
+    anagram_index: Optional[AnagramIndex] = None
+    subanagram_index: Optional[SubanagramIndex] = None
+    near_anagram_index: Optional[NearAnagramIndex] = None
+    request_log_sink: Optional[RequestLogSink] = None
+    similar_cache: Optional[SimilarWordsCache] = None
+    word_event_listener: Optional[WordEventListener] = None
+    phrase_anagram_pool: Optional[ProcessPoolExecutor] = None
+    phrase_anagram_slots: Optional[asyncio.Semaphore] = None
+    partition_maintainer: Optional[PartitionMaintainer] = None
+    warmup: Optional[WarmupStatus] = None
+    warmup_task: Optional[asyncio.Task] = None
 
 
 @asynccontextmanager
@@ -42,36 +74,265 @@ async def _startup_db(app: FastAPI) -> None:
     """
     Perform startup tasks related to the db.
 
+    Only what requests need is awaited here; the dataset sync and the index
+    builds run in the background (see `_warm_up`), tracked by
+    app.state.warmup for /health/ready.
+
     Args:
         app (FastAPI): The FastAPI application instance.
     """
     try:
         await setup_db_engine(app=app)
         await initialize_tables(engine=app.state.db_engine)
-        await _load_words_dataset(app=app)
+        await _start_partition_maintainer(app=app)
+        if settings.DB_POOL_WARMUP:
+            await _warm_up_db_pool(app=app)
+        if settings.REQUEST_LOG_ASYNC:
+            _start_request_log_sink(app=app)
+        if settings.SIMILAR_CACHE_ENABLED:
+            app.state.similar_cache = SimilarWordsCache(
+                max_entries=settings.SIMILAR_CACHE_MAX_ENTRIES,
+                ttl_seconds=settings.SIMILAR_CACHE_TTL_SECONDS,
+            )
+        app.state.warmup = WarmupStatus(_warm_up_phases())
+        if settings.WORD_EVENTS_ENABLED:
+            await _start_word_event_listener(app=app)
+        app.state.warmup_task = asyncio.create_task(_warm_up(app=app))
     except Exception as e:
         # todo: logging
         raise
 
 
+def _warm_up_phases() -> List[str]:
+    phases = ["dataset"]
+    if settings.ANAGRAM_INDEX_ENABLED:
+        phases.append("anagram_index")
+    if settings.SUBANAGRAM_INDEX_ENABLED:
+        phases.append("subanagram_index")
+    if settings.NEAR_ANAGRAM_INDEX_ENABLED:
+        phases.append("near_anagram_index")
+    return phases
+
+
+async def _warm_up(app: FastAPI) -> None:
+    """
+    Sync the words dataset and build the in-memory indexes while the app serves requests.
+
+    Each index is published on app.state once built; until then its endpoints
+    fall back to the database or answer 503. Words added in the meantime are
+    replayed into the indexes at the end, even if the warm-up fails or is cancelled.
+    """
+    warmup: WarmupStatus = app.state.warmup
+    try:
+        async with get_db_session_app(app) as db_session:
+            # Words already there are served while the dataset syncs.
+            warmup.words_available = await get_word_count(db_session) > 0
+        try:
+            with warmup.phase("dataset"):
+                await _load_words_dataset(app=app, progress=lambda fraction: warmup.progress("dataset", fraction))
+        finally:
+            # /similar was answered from the table while it synced: drop the partial and empty results cached.
+            cache = getattr(app.state, "similar_cache", None)
+            if cache is not None:
+                cache.clear()
+        warmup.words_available = True
+
+        if settings.ANAGRAM_INDEX_ENABLED:
+            with warmup.phase("anagram_index"):
+                await _build_anagram_index(app=app)
+        if settings.SUBANAGRAM_INDEX_ENABLED:
+            with warmup.phase("subanagram_index"):
+                await _build_subanagram_index(app=app)
+        if settings.NEAR_ANAGRAM_INDEX_ENABLED:
+            with warmup.phase("near_anagram_index"):
+                await _build_near_anagram_index(app=app)
+        if settings.PHRASE_ANAGRAM_WORKERS > 0:
+            await _start_phrase_anagram_pool(app=app)
+    except Exception:
+        logger.exception("Warm-up failed; endpoints keep falling back to the database where they can.")
+    finally:
+        # Also after a failure or a cancellation: the indexes that were built get
+        # the words, and words stop being collected. Not published again: those
+        # inserted once the shared index was attached went to its delta then, and
+        # the ones before are read from the table by every worker attaching to it.
+        pending_words = warmup.take_pending_words()
+        if pending_words:
+            apply_words_added(app.state, pending_words)
+            logger.info(f"Warm-up: {len(pending_words)} words added during warm-up replayed into the indexes.")
+
+
 async def _shutdown_db(app: FastAPI) -> None:
     """
     Perform shutdown tasks related to the db.
     Args:
         app: The FastAPI application instance.
     """
+    warmup_task = getattr(app.state, "warmup_task", None)
+    if warmup_task is not None and not warmup_task.done():
+        warmup_task.cancel()
+        with suppress(asyncio.CancelledError):
+            await warmup_task
+
+    pool = getattr(app.state, "phrase_anagram_pool", None)
+    if pool is not None:
+        pool.shutdown(wait=False, cancel_futures=True)
+
+    maintainer = getattr(app.state, "partition_maintainer", None)
+    if maintainer is not None:
+        await maintainer.close()
+
     try:
+        listener = getattr(app.state, "word_event_listener", None)
+        if listener is not None:
+            await listener.close()
+    except Exception:
+        logger.exception("Error while closing the word event listener")
+
+    index = getattr(app.state, "anagram_index", None)
+    if isinstance(index, SharedAnagramIndex):
+        await index.stop()
+        index.close()
+
+    cache = getattr(app.state, "similar_cache", None)
+    if cache is not None:
+        logger.info(f"Similar words cache: {cache.stats()}")
+
+    try:
+        sink = getattr(app.state, "request_log_sink", None)
+        if sink:
+            await sink.close()
+    except Exception:
+        logger.exception("Error while flushing request logs")
+
+    try:
+        read_engine = getattr(app.state, "db_read_engine", None)
+        if read_engine is not None and read_engine is not app.state.db_engine:
+            await read_engine.dispose()
         if app.state.db_engine:
             await app.state.db_engine.dispose()
     except Exception as e:
         print(f"Error during database shutdown: {e}")
 
+    mark_process_dead()
+
+
+async def _warm_up_db_pool(app: FastAPI) -> None:
+    """
+    Pre-open the connection pool and prepare the hot statements on every connection.
+    """
+    from api.word_router import prepare_hot_statements, prepare_lookup_statements
+
+    engine = app.state.db_engine
+    await warm_up_pool(engine, size=settings.DB_POOL_SIZE, prepare=prepare_hot_statements)
+    logger.info(f"Database pool warmed up: {pool_status(engine)}")
+
+    read_engine = app.state.db_read_engine
+    if read_engine is not engine:
+        await warm_up_pool(read_engine, size=settings.DB_POOL_SIZE, prepare=prepare_lookup_statements)
+        logger.info(f"Read replica pool warmed up: {pool_status(read_engine)}")
+
+
+async def _load_words_dataset(app: FastAPI, progress: Optional[Callable[[float], None]] = None) -> None:
+    """
+    Sync the Word table with the words dataset.
+    """
+    async with get_db_session_app(app) as db_session:
+        await load_word_dataset(dataset_path=WORDS_DATASET_PATH, db_session=db_session, progress=progress)
+
 
-async def _load_words_dataset(app: FastAPI) -> None:
+async def _build_anagram_index(app: FastAPI) -> None:
     """
-    Load the words dataset into the database if the Word table is empty.
+    Build the in-memory anagram index from the Word table, or attach to the
+    index file shared by the workers.
     """
-    words_dataset_path = settings.CURRENT_FILE.parent / "dataset/words_dataset.txt"
+    async with get_db_session_app(app) as db_session:
+        if settings.ANAGRAM_INDEX_SHARED:
+            dataset_digest = await asyncio.to_thread(file_digest, WORDS_DATASET_PATH)
+            app.state.anagram_index = await SharedAnagramIndex.attach(
+                settings.ANAGRAM_INDEX_PATH, db_session, dataset_digest=dataset_digest
+            )
+            app.state.anagram_index.start()
+        else:
+            app.state.anagram_index = await AnagramIndex.build(db_session)
+
 
+async def _build_subanagram_index(app: FastAPI) -> None:
+    """
+    Build the in-memory sub-anagram index from the Word table.
+    """
     async with get_db_session_app(app) as db_session:
-        await load_word_dataset(dataset_path=words_dataset_path, db_session=db_session)
+        app.state.subanagram_index = await SubanagramIndex.build(db_session)
+
+
+async def _build_near_anagram_index(app: FastAPI) -> None:
+    """
+    Build the in-memory near-anagram index from the Word table.
+    """
+    async with get_db_session_app(app) as db_session:
+        app.state.near_anagram_index = await NearAnagramIndex.build(db_session)
+
+
+async def _start_phrase_anagram_pool(app: FastAPI) -> None:
+    """
+    Start the worker processes that run phrase anagram searches off the event loop,
+    each with a copy of the sub-anagram index.
+    """
+    index = getattr(app.state, "subanagram_index", None)
+    if index is None:
+        logger.warning("Phrase anagrams need the sub-anagram index; their workers are not started.")
+        return
+    # Workers are spawned rather than forked from this multi-threaded, connected process.
+    pool = ProcessPoolExecutor(
+        max_workers=settings.PHRASE_ANAGRAM_WORKERS,
+        mp_context=multiprocessing.get_context("spawn"),
+        initializer=init_worker,
+        initargs=(index.snapshot(),),
+    )
+    # Stored first so that shutdown stops the workers even if the warm-up is cancelled.
+    app.state.phrase_anagram_pool = pool
+    # A worker is spawned by the first call that finds none idle, pickling the
+    # snapshot for it; spawn them all now, off the event loop, rather than in requests.
+    await asyncio.to_thread(lambda: list(pool.map(sleep, [0.1] * settings.PHRASE_ANAGRAM_WORKERS)))
+    app.state.phrase_anagram_slots = asyncio.Semaphore(settings.PHRASE_ANAGRAM_MAX_PENDING)
+
+
+async def _start_partition_maintainer(app: FastAPI) -> None:
+    """
+    Create the upcoming request_log partitions before anything is logged, then keep maintaining them.
+    """
+    maintainer = PartitionMaintainer(
+        engine=app.state.db_engine,
+        premake_days=settings.REQUEST_LOG_PARTITION_PREMAKE_DAYS,
+        retention_days=settings.REQUEST_LOG_RETENTION_DAYS,
+        mode=settings.REQUEST_LOG_RETENTION_MODE,
+        interval_seconds=settings.REQUEST_LOG_MAINTENANCE_INTERVAL_SECONDS,
+        rollup_retention_days=settings.REQUEST_LOG_ROLLUP_RETENTION_DAYS,
+    )
+    await maintainer.run_once()
+    maintainer.start()
+    app.state.partition_maintainer = maintainer
+
+
+def _start_request_log_sink(app: FastAPI) -> None:
+    """
+    Start the background writer that batches request log inserts.
+    """
+    sink = RequestLogSink(
+        session_factory=app.state.db_session_factory,
+        max_queue_size=settings.REQUEST_LOG_QUEUE_SIZE,
+        batch_size=settings.REQUEST_LOG_BATCH_SIZE,
+        flush_interval_ms=settings.REQUEST_LOG_FLUSH_INTERVAL_MS,
+        overflow_policy=settings.REQUEST_LOG_OVERFLOW_POLICY,
+    )
+    sink.start()
+    app.state.request_log_sink = sink
+
+
+async def _start_word_event_listener(app: FastAPI) -> None:
+    """
+    Listen for words added by other workers to keep this worker's index and cache current.
+    """
+    dsn = app.state.db_engine.url.set(drivername="postgresql").render_as_string(hide_password=False)
+    listener = WordEventListener(dsn=dsn, state=app.state)
+    await listener.start()
+    app.state.word_event_listener = listener
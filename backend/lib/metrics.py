@@ -0,0 +1,146 @@
+import os
+from time import perf_counter
+from typing import Tuple
+
+from prometheus_client import (
+    CONTENT_TYPE_LATEST, REGISTRY, CollectorRegistry, Counter, Gauge, Histogram, generate_latest, multiprocess
+)
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from sqlalchemy.pool import AsyncAdaptedQueuePool
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from lib.tracing import record_span
+
+# With several uvicorn workers every process writes its samples to files in
+# this directory and /metrics merges them. It has to be set, and emptied,
+# before the workers start.
+MULTIPROC_DIR_ENV = "PROMETHEUS_MULTIPROC_DIR"
+
+LATENCY_BUCKETS = (.0005, .001, .0025, .005, .01, .025, .05, .1, .25, .5, 1, 2.5, 5, 10)
+
+REQUEST_LATENCY = Histogram(
+    "http_request_duration_seconds",
+    "End-to-end request latency, from the first middleware to the last response byte.",
+    ["method", "route", "status"],
+    buckets=LATENCY_BUCKETS,
+)
+REQUESTS_IN_FLIGHT = Gauge(
+    "http_requests_in_flight",
+    "Requests being served.",
+    multiprocess_mode="livesum",
+)
+DB_POOL_CHECKOUT = Histogram(
+    "db_pool_checkout_seconds",
+    "Time spent waiting for a connection from the database pool.",
+    buckets=LATENCY_BUCKETS,
+)
+DB_QUERY_LATENCY = Histogram(
+    "db_query_duration_seconds",
+    "Time spent executing database statements.",
+    ["statement"],
+    buckets=LATENCY_BUCKETS,
+)
+SIMILAR_LOOKUPS = Counter(
+    "similar_lookups_total",
+    "Signature lookups of similar words, by the layer that answered.",
+    ["source"],
+)
+SIMILAR_CACHE_LOOKUPS = Counter(
+    "similar_cache_lookups_total",
+    "Lookups in the signature cache of /similar.",
+    ["result"],
+)
+
+
+class MetricsMiddleware:
+    """
+    Pure ASGI middleware recording the latency of every HTTP request and the
+    number of requests in flight.
+
+    Requests are labelled with their route template (e.g. /api/v1/similar)
+    rather than the raw path, to keep the label set bounded.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        status_code = 500
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        REQUESTS_IN_FLIGHT.inc()
+        start = perf_counter()
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            REQUESTS_IN_FLIGHT.dec()
+            route = scope.get("route")
+            REQUEST_LATENCY.labels(
+                method=scope["method"],
+                route=getattr(route, "path", "unmatched"),
+                status=str(status_code),
+            ).observe(perf_counter() - start)
+
+
+class TimedAsyncAdaptedQueuePool(AsyncAdaptedQueuePool):
+    """
+    The default async engine pool, timing how long each checkout waits for a connection.
+    """
+
+    def _do_get(self):
+        start = perf_counter()
+        try:
+            return super()._do_get()
+        finally:
+            DB_POOL_CHECKOUT.observe(perf_counter() - start)
+            record_span("db.checkout", start)
+
+
+def instrument_engine(engine: Engine) -> None:
+    """
+    Time every statement executed on an engine (the sync_engine of an AsyncEngine),
+    as a metric and as a span of the current trace.
+    """
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        conn.info.setdefault("query_start_time", []).append(perf_counter())
+
+    @event.listens_for(engine, "after_cursor_execute")
+    def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        start = conn.info["query_start_time"].pop()
+        statement_type = statement.lstrip().split(None, 1)[0].upper()
+        DB_QUERY_LATENCY.labels(statement=statement_type).observe(perf_counter() - start)
+        record_span(f"db.execute {statement_type}", start)
+
+
+def render_metrics() -> Tuple[bytes, str]:
+    """
+    Render the metrics of this process, or of every worker in multiprocess mode.
+
+    Returns:
+        Tuple[bytes, str]: The exposition text and its content type.
+    """
+    if os.environ.get(MULTIPROC_DIR_ENV):
+        registry = CollectorRegistry()
+        multiprocess.MultiProcessCollector(registry)
+        return generate_latest(registry), CONTENT_TYPE_LATEST
+    return generate_latest(REGISTRY), CONTENT_TYPE_LATEST
+
+
+def mark_process_dead() -> None:
+    """
+    Drop this worker's live gauges from the multiprocess directory on shutdown.
+    """
+    if os.environ.get(MULTIPROC_DIR_ENV):
+        multiprocess.mark_process_dead(os.getpid())
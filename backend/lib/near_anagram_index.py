@@ -0,0 +1,204 @@
+import asyncio
+import logging
+from array import array
+from bisect import bisect_left
+from typing import Dict, Iterator, List, NamedTuple, Optional, Tuple
+from zlib import crc32
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from models.word import Word
+from lib.anagram_index import INDEX_FETCH_SIZE
+
+logger = logging.getLogger(__name__)
+
+ID_BITS = 32
+ID_MASK = (1 << ID_BITS) - 1
+
+# Ranking of the edit that turns the query's letters into a neighbor's.
+OPERATION_RANK = {"substitution": 0, "insertion": 1, "deletion": 2}
+
+
+class NearAnagram(NamedTuple):
+    word: str
+    operation: str
+    added: Optional[str]
+    removed: Optional[str]
+
+
+def deletion_keys(signature: bytes) -> Iterator[Tuple[int, bytes]]:
+    """
+    Yield (letter index, signature with one occurrence of that letter removed)
+    for every letter present in the signature.
+    """
+    for idx, count in enumerate(signature):
+        if count:
+            yield idx, signature[:idx] + bytes((count - 1,)) + signature[idx + 1:]
+
+
+def _letter(idx: int) -> str:
+    return chr(ord('a') + idx)
+
+
+def _added_letter(signature: bytes, key: bytes) -> Optional[int]:
+    """
+    Return the letter whose removal turns `signature` into `key`, or None if
+    they are not one letter apart (e.g. a crc32 collision).
+    """
+    added = None
+    for idx, (count, key_count) in enumerate(zip(signature, key)):
+        if count == key_count:
+            continue
+        if count != key_count + 1 or added is not None:
+            return None
+        added = idx
+    return added
+
+
+class NearAnagramIndex:
+    """
+    In-memory index of the signatures one letter insertion, deletion or
+    substitution away from a word's signature.
+
+    Every dictionary signature is registered under each of its deletion
+    variants (the signature with one letter removed). Neighbors of a query
+    signature Q then come from a handful of lookups:
+
+    - insertion: signatures registered under Q itself;
+    - substitution: signatures registered under Q minus one letter;
+    - deletion: Q minus one letter, when it is a dictionary signature.
+
+    The variants are stored compactly as one sorted array of
+    `crc32(variant) << 32 | signature id` and searched with bisect; candidates
+    are verified, so hash collisions are harmless. Signatures added after the
+    index was built are kept in a small dict until the next compaction.
+    """
+
+    def __init__(self) -> None:
+        self._signatures: List[bytes] = []
+        self._words: List[List[str]] = []
+        self._ids: Dict[bytes, int] = {}
+        self._variants = array("Q")
+        self._recent_variants: Dict[bytes, List[int]] = {}
+        self._size = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    def add(self, word: str, signature: bytes) -> bool:
+        """
+        Add a word to the index.
+
+        Returns:
+            bool: True if the word was added, False if it was already indexed.
+        """
+        signature_id = self._ids.get(signature)
+        if signature_id is None:
+            signature_id = self._add_signature(signature)
+            for _, key in deletion_keys(signature):
+                self._recent_variants.setdefault(key, []).append(signature_id)
+        elif word in self._words[signature_id]:
+            return False
+        self._words[signature_id].append(word)
+        self._size += 1
+        return True
+
+    def compact(self) -> None:
+        """
+        Rebuild the sorted variant array from every indexed signature.
+        """
+        self._variants = array("Q", sorted(
+            crc32(key) << ID_BITS | signature_id
+            for signature_id, signature in enumerate(self._signatures)
+            for _, key in deletion_keys(signature)
+        ))
+        self._recent_variants.clear()
+
+    def query(self, signature: bytes, limit: int = 100) -> Tuple[List[NearAnagram], int]:
+        """
+        Find the words one letter insertion, deletion or substitution away from a signature.
+
+        Args:
+            signature (bytes): Signature of the query word.
+            limit (int): Maximum number of words to return.
+
+        Returns:
+            Tuple[List[NearAnagram], int]: Up to `limit` near anagrams, substitutions
+             first, then insertions, then deletions, each alphabetically; and the
+             total number of near anagrams.
+        """
+        matches: List[NearAnagram] = []
+
+        for signature_id, added in self._registered_under(signature):
+            matches.extend(NearAnagram(word, "insertion", _letter(added), None)
+                           for word in self._words[signature_id])
+
+        for removed, key in deletion_keys(signature):
+            deleted_id = self._ids.get(key)
+            if deleted_id is not None:
+                matches.extend(NearAnagram(word, "deletion", None, _letter(removed))
+                               for word in self._words[deleted_id])
+            for signature_id, added in self._registered_under(key):
+                if added != removed:
+                    matches.extend(NearAnagram(word, "substitution", _letter(added), _letter(removed))
+                                   for word in self._words[signature_id])
+
+        matches.sort(key=lambda match: (OPERATION_RANK[match.operation], match.word))
+        return matches[:limit], len(matches)
+
+    def _add_signature(self, signature: bytes) -> int:
+        signature_id = len(self._signatures)
+        self._signatures.append(signature)
+        self._words.append([])
+        self._ids[signature] = signature_id
+        return signature_id
+
+    def _registered_under(self, key: bytes) -> Iterator[Tuple[int, int]]:
+        """
+        Yield (signature id, added letter) for the signatures having `key` as a deletion variant.
+        """
+        key_hash = crc32(key) << ID_BITS
+        position = bisect_left(self._variants, key_hash)
+        candidates = []
+        while position < len(self._variants) and self._variants[position] >> ID_BITS << ID_BITS == key_hash:
+            candidates.append(self._variants[position] & ID_MASK)
+            position += 1
+        candidates.extend(self._recent_variants.get(key, ()))
+
+        for signature_id in candidates:
+            added = _added_letter(self._signatures[signature_id], key)
+            if added is not None:
+                yield signature_id, added
+
+    @classmethod
+    async def build(cls, db_session: AsyncSession) -> "NearAnagramIndex":
+        """
+        Build the index by streaming the words table through a server-side cursor.
+
+        Args:
+            db_session (AsyncSession): db session.
+
+        Returns:
+            NearAnagramIndex: The populated, compacted index.
+        """
+        index = cls()
+        statement = (
+            select(Word.word, Word.signature)
+            .execution_options(yield_per=INDEX_FETCH_SIZE)
+        )
+        result = await db_session.stream(statement)
+        async for rows in result.partitions():
+            for word, signature in rows:
+                signature_id = index._ids.get(signature)
+                if signature_id is None:
+                    signature_id = index._add_signature(signature)
+                if word not in index._words[signature_id]:
+                    index._words[signature_id].append(word)
+                    index._size += 1
+        # Seconds of sorting: off the event loop, which keeps serving requests during warm-up.
+        await asyncio.to_thread(index.compact)
+
+        logger.info(f"Near-anagram index built: {len(index)} words, {len(index._signatures)} signatures, "
+                    f"{len(index._variants)} deletion variants.")
+        return index
@@ -0,0 +1,76 @@
+import asyncio
+import logging
+from typing import Optional
+
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from database.partition_utils import RetentionMode, maintain_partitions
+
+logger = logging.getLogger(__name__)
+
+
+class PartitionMaintainer:
+    """
+    Keeps the daily request_log partitions ahead of time and applies the
+    retention periods, once at startup and then periodically from a
+    background task.
+
+    Every worker runs one; maintain_partitions serializes them with an
+    advisory lock, and whoever comes second finds nothing left to do.
+    """
+
+    def __init__(
+        self,
+        engine: AsyncEngine,
+        premake_days: int = 7,
+        retention_days: int = 30,
+        mode: RetentionMode = "drop",
+        interval_seconds: float = 3600,
+        rollup_retention_days: int = 0,
+    ) -> None:
+        self._engine = engine
+        self._premake_days = premake_days
+        self._retention_days = retention_days
+        self._mode = mode
+        self._interval = interval_seconds
+        self._rollup_retention_days = rollup_retention_days
+        self._task: Optional[asyncio.Task] = None
+
+    async def run_once(self) -> None:
+        """
+        Create the upcoming partitions, drop the expired ones and compact the old rollups.
+        """
+        changes = await maintain_partitions(
+            self._engine,
+            premake_days=self._premake_days,
+            retention_days=self._retention_days,
+            mode=self._mode,
+            rollup_retention_days=self._rollup_retention_days,
+        )
+        if changes["created"] or changes["dropped"]:
+            logger.info(f"Request log partitions created: {changes['created']}, dropped: {changes['dropped']}")
+
+    def start(self) -> None:
+        """
+        Start the background maintenance task.
+        """
+        self._task = asyncio.create_task(self._run(), name="request-log-partitions")
+
+    async def close(self) -> None:
+        """
+        Stop the background maintenance task.
+        """
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+
+    async def _run(self) -> None:
+        while True:
+            await asyncio.sleep(self._interval)
+            try:
+                await self.run_once()
+            except Exception as e:
+                logger.error(f"Request log partition maintenance failed: {e}")
@@ -0,0 +1,154 @@
+"""
+Multi-word anagram search, run in a process pool.
+
+Each pool worker holds its own copy of the sub-anagram index, from a snapshot
+taken when the pool starts, and gathers the candidate words itself, so a
+request only ships the phrase and the few words added since. Only the standard
+library and the sub-anagram index are imported here so pool workers start
+quickly and never touch the settings or the database.
+"""
+from itertools import product
+from time import monotonic
+from typing import List, Optional, Sequence, Set, Tuple
+
+from lib.subanagram_index import SubanagramIndex
+
+ALPHABET_SIZE = 26
+
+# This worker process's copy of the sub-anagram index, set by `init_worker`.
+_index: Optional[SubanagramIndex] = None
+
+
+class _BudgetExhausted(Exception):
+    pass
+
+
+def init_worker(words: Sequence[Tuple[str, bytes]]) -> None:
+    """
+    Pool initializer: index a snapshot of the sub-anagram index in this worker process.
+
+    Args:
+        words (Sequence[Tuple[str, bytes]]): (word, signature) pairs, from `SubanagramIndex.snapshot`.
+    """
+    global _index
+    _index = SubanagramIndex()
+    for word, signature in words:
+        _index.add(word, signature)
+
+
+def search_phrase(
+        target: bytes,
+        min_word_len: int,
+        added: Sequence[Tuple[str, bytes]],
+        max_words: int,
+        max_results: int,
+        time_budget: float,
+) -> Tuple[List[str], bool]:
+    """
+    Split the letters of a phrase into combinations of words from this worker's index.
+
+    Args:
+        target (bytes): Signature of the phrase's letters.
+        min_word_len (int): Minimum number of letters per word.
+        added (Sequence[Tuple[str, bytes]]): Words added to the index since its
+         snapshot that fit in the phrase; they are added to this worker's copy first.
+        max_words (int): Maximum number of words per phrase.
+        max_results (int): Stop after this many phrases.
+        time_budget (float): Stop after this many seconds, gathering the candidates included.
+
+    Returns:
+        Tuple[List[str], bool]: See `solve_phrase`.
+    """
+    start = monotonic()
+    for word, signature in added:
+        _index.add(word, signature)
+    candidates = _index.matching_signatures(target, min_len=min_word_len)
+    return solve_phrase(target, candidates, max_words, max_results, time_budget - (monotonic() - start))
+
+
+def solve_phrase(
+        target: bytes,
+        candidates: Sequence[Tuple[bytes, List[str]]],
+        max_words: int,
+        max_results: int,
+        time_budget: float,
+) -> Tuple[List[str], bool]:
+    """
+    Split the letters of a phrase into combinations of dictionary words.
+
+    The search is a backtracking exact cover over signature vectors: at every
+    step it picks the remaining letter with the fewest candidate signatures and
+    only branches on signatures containing it, so every branch consumes the
+    hardest letter first and dead ends are found early.
+
+    Args:
+        target (bytes): Signature of the phrase's letters.
+        candidates (Sequence[Tuple[bytes, List[str]]]): Signatures that fit in the
+         phrase, with their words.
+        max_words (int): Maximum number of words per phrase.
+        max_results (int): Stop after this many phrases.
+        time_budget (float): Stop after this many seconds.
+
+    Returns:
+        Tuple[List[str], bool]: The phrases found, words longest first, and
+         whether the search completed within its budgets: finding exactly
+         `max_results` phrases still completes it if there are no more.
+    """
+    deadline = monotonic() + time_budget
+    entries = [tuple((idx, count) for idx, count in enumerate(signature) if count) for signature, _ in candidates]
+    lengths = [sum(count for _, count in letters) for letters in entries]
+    max_length = max(lengths, default=0)
+
+    by_letter: List[List[int]] = [[] for _ in range(ALPHABET_SIZE)]
+    for entry_id, letters in enumerate(entries):
+        for idx, _ in letters:
+            by_letter[idx].append(entry_id)
+    # Letters with fewer candidates are covered first.
+    letter_order = sorted(range(ALPHABET_SIZE), key=lambda idx: len(by_letter[idx]))
+
+    remaining = list(target)
+    chosen: List[int] = []
+    seen: Set[Tuple[int, ...]] = set()
+    phrases: List[str] = []
+
+    def record_solution() -> None:
+        combination = tuple(sorted(chosen))
+        if combination in seen:
+            return
+        seen.add(combination)
+        ordered = sorted(combination, key=lambda entry_id: -lengths[entry_id])
+        for words in product(*(candidates[entry_id][1] for entry_id in ordered)):
+            # Only a phrase past the limit means the results were cut short.
+            if len(phrases) >= max_results:
+                raise _BudgetExhausted
+            phrases.append(" ".join(words))
+
+    def search(remaining_letters: int) -> None:
+        if monotonic() > deadline:
+            raise _BudgetExhausted
+
+        if remaining_letters == 0:
+            record_solution()
+            return
+        words_left = max_words - len(chosen)
+        if words_left == 0 or remaining_letters > words_left * max_length:
+            return
+
+        letter = next(idx for idx in letter_order if remaining[idx])
+        for entry_id in by_letter[letter]:
+            letters = entries[entry_id]
+            if any(count > remaining[idx] for idx, count in letters):
+                continue
+            for idx, count in letters:
+                remaining[idx] -= count
+            chosen.append(entry_id)
+            search(remaining_letters - lengths[entry_id])
+            chosen.pop()
+            for idx, count in letters:
+                remaining[idx] += count
+
+    try:
+        search(sum(target))
+    except _BudgetExhausted:
+        return phrases, False
+    return phrases, True
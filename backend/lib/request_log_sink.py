@@ -0,0 +1,129 @@
+import asyncio
+import logging
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Literal, Optional
+
+from sqlalchemy import insert
+from sqlalchemy.ext.asyncio import async_sessionmaker
+
+from database.stats_utils import record_rollups
+from models.request_log import RequestLog
+
+logger = logging.getLogger(__name__)
+
+OverflowPolicy = Literal["drop_newest", "drop_oldest"]
+
+
+class RequestLogSink:
+    """
+    Buffers request log entries in a bounded queue and writes them from a
+    background task with one multi-row INSERT per batch. The per-minute
+    rollups are updated in the same transaction.
+
+    A batch is written once it holds `batch_size` entries or `flush_interval_ms`
+    have passed since it started filling. When the queue is full the overflow
+    policy decides whether the new entry or the oldest queued one is dropped.
+    """
+
+    def __init__(
+        self,
+        session_factory: async_sessionmaker,
+        max_queue_size: int = 10_000,
+        batch_size: int = 500,
+        flush_interval_ms: int = 200,
+        overflow_policy: OverflowPolicy = "drop_newest",
+    ) -> None:
+        self._session_factory = session_factory
+        self._queue: asyncio.Queue = asyncio.Queue(maxsize=max_queue_size)
+        self._batch_size = batch_size
+        self._flush_interval = flush_interval_ms / 1000
+        self._overflow_policy = overflow_policy
+        self._task: Optional[asyncio.Task] = None
+        self._stopping = False
+
+        self.written = 0
+        self.dropped = 0
+
+    def start(self) -> None:
+        """
+        Start the background writer task.
+        """
+        self._task = asyncio.create_task(self._run(), name="request-log-sink")
+
+    def submit(self, endpoint: str, processing_time: float, word: Optional[str] = None) -> bool:
+        """
+        Queue a request log entry without waiting for the database.
+
+        Returns:
+            bool: True if the entry was queued, False if it was dropped.
+        """
+        if self._stopping:
+            self.dropped += 1
+            return False
+
+        entry = {
+            "endpoint": endpoint,
+            "processing_time": processing_time,
+            "word": word,
+            "timestamp": datetime.now(tz=timezone.utc),
+        }
+        try:
+            self._queue.put_nowait(entry)
+            return True
+        except asyncio.QueueFull:
+            self.dropped += 1
+            if self._overflow_policy == "drop_oldest":
+                self._queue.get_nowait()
+                self._queue.put_nowait(entry)
+                return True
+            return False
+
+    async def close(self) -> None:
+        """
+        Stop accepting entries and flush everything still queued.
+        """
+        self._stopping = True
+        if self._task is not None:
+            await self._task
+        logger.info(f"Request log sink closed: {self.written} written, {self.dropped} dropped.")
+
+    async def _run(self) -> None:
+        while True:
+            batch = await self._next_batch()
+            if batch:
+                await self._write(batch)
+            elif self._stopping:
+                return
+
+    async def _next_batch(self) -> List[Dict[str, Any]]:
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + self._flush_interval
+        batch: List[Dict[str, Any]] = []
+
+        while len(batch) < self._batch_size:
+            try:
+                batch.append(self._queue.get_nowait())
+                continue
+            except asyncio.QueueEmpty:
+                pass
+
+            remaining = deadline - loop.time()
+            if self._stopping or remaining <= 0:
+                break
+            try:
+                batch.append(await asyncio.wait_for(self._queue.get(), remaining))
+            except asyncio.TimeoutError:
+                break
+
+        return batch
+
+    async def _write(self, batch: List[Dict[str, Any]]) -> None:
+        try:
+            async with self._session_factory() as session:
+                await session.execute(insert(RequestLog), batch)
+                await record_rollups(session, batch)
+                await session.commit()
+            self.written += len(batch)
+        except Exception as e:
+            self.dropped += len(batch)
+            logger.error(f"Failed to write {len(batch)} request log entries: {e}")
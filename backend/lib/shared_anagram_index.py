@@ -0,0 +1,361 @@
+import asyncio
+import fcntl
+import json
+import logging
+import os
+from time import monotonic, perf_counter
+from typing import Iterable, List, Optional, Tuple
+
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from lib.anagram_index import AnagramIndex
+from lib.index_file import IndexFile, IndexFileError, read_generation, write_index_file
+from models.dataset_manifest import DatasetManifest
+from models.word import Word
+from utils.string_utils import compute_letter_frequencies
+
+logger = logging.getLogger(__name__)
+
+# How often a worker checks whether another one published a new generation.
+GENERATION_CHECK_INTERVAL = 1.0
+# How often a lookup checks the delta file for words published by the other workers.
+DELTA_CHECK_INTERVAL = 0.1
+
+
+class SharedAnagramIndex(AnagramIndex):
+    """
+    Anagram index shared by every worker through a memory-mapped, read-only file.
+
+    The file (see lib/index_file.py) is built once from the words table, or
+    ahead of time by the builder CLI, and mapped by each worker, so the kernel
+    keeps a single copy in the page cache; lookups binary-search the sorted
+    signatures in place. Words added afterwards go to an append-only
+    delta file next to it, one per generation of the index file: the worker
+    that inserted them appends, and every worker replays what is new, at most
+    every DELTA_CHECK_INTERVAL, into the in-process buckets inherited from
+    AnagramIndex.
+
+    The file records the highest words.id it holds (for a file built from
+    the dataset, the dataset manifest does), so a worker attaching to it only
+    reads the words added since from the table. A worker that starts with an
+    index file not matching the words table builds the next generation; the
+    others switch to it within GENERATION_CHECK_INTERVAL, from the background
+    task started by `start`, which validates the new file in a thread.
+    """
+
+    def __init__(self, path: str) -> None:
+        super().__init__()
+        self.path = path
+        self._file: Optional[IndexFile] = None
+        self._delta_fd: Optional[int] = None
+        # Shared by `publish`, exclusive while `attach` carries a delta over to the next generation.
+        self._delta_lock_fd: Optional[int] = None
+        self._delta_offset = 0
+        self._next_delta_check = 0.0
+        self._task: Optional[asyncio.Task] = None
+
+    def __len__(self) -> int:
+        return (self._file.word_count if self._file else 0) + self._size
+
+    @property
+    def generation(self) -> int:
+        return self._file.generation if self._file else 0
+
+    def lookup(self, signature: bytes) -> Optional[List[str]]:
+        """
+        Return the words sharing a signature, or None if the signature is not indexed.
+        """
+        self._refresh()
+        words = self._base_lookup(signature)
+        added = self._buckets.get(signature)
+        if added:
+            words = added if words is None else words + added
+        return words
+
+    def add(self, word: str, signature: bytes) -> bool:
+        """
+        Add a word to this worker's view of the index; see `publish` to share it.
+
+        Returns:
+            bool: True if the word was added, False if it was already indexed.
+        """
+        words = self._base_lookup(signature)
+        if words is not None and word in words:
+            return False
+        return super().add(word, signature)
+
+    def publish(self, words: Iterable[str]) -> None:
+        """
+        Append inserted words to the delta file for the other workers to replay.
+
+        Each word is written as a JSON string on its own line; JSON escapes
+        newlines, so a record never spans more than one line. If another worker
+        has published a new generation this one has not switched to yet, the
+        words go to the new generation's delta, which this worker replays
+        when it switches.
+        """
+        payload = "".join(f"{json.dumps(word)}\n" for word in words).encode("utf-8")
+        if not payload:
+            return
+        fcntl.flock(self._delta_lock_fd, fcntl.LOCK_SH)
+        try:
+            if os.fstat(self._delta_fd).st_nlink:
+                # A single O_APPEND write keeps concurrent appends from interleaving.
+                os.write(self._delta_fd, payload)
+                return
+            # Carried over and unlinked by `attach`; the new generation's delta is created first.
+            delta_fd = os.open(self._delta_path(read_generation(self.path)), os.O_WRONLY | os.O_APPEND)
+            try:
+                os.write(delta_fd, payload)
+            finally:
+                os.close(delta_fd)
+        finally:
+            fcntl.flock(self._delta_lock_fd, fcntl.LOCK_UN)
+
+    def start(self) -> None:
+        """
+        Start the background task switching to the new generations of the index file.
+        """
+        self._task = asyncio.create_task(self._run(), name="shared-anagram-index")
+
+    async def stop(self) -> None:
+        """
+        Stop the background task.
+        """
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+
+    async def check_generation(self) -> None:
+        """
+        Switch to a newer generation of the index file if one was published.
+
+        The new file is mapped, validated and its delta read in a thread; only
+        the switch itself runs on the event loop.
+        """
+        try:
+            stat = os.stat(self.path)
+        except FileNotFoundError:
+            return
+        if self._file is None or (stat.st_dev, stat.st_ino) == self._file.file_id:
+            return
+        loaded = await asyncio.to_thread(self._load)
+        if loaded is not None:
+            previous = self.generation
+            self._install(loaded)
+            logger.info(f"Shared anagram index switched from generation {previous} to {self.generation}.")
+
+    def close(self) -> None:
+        for fd in (self._delta_fd, self._delta_lock_fd):
+            if fd is not None:
+                os.close(fd)
+        self._delta_fd = self._delta_lock_fd = None
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    async def _run(self) -> None:
+        while True:
+            await asyncio.sleep(GENERATION_CHECK_INTERVAL)
+            try:
+                await self.check_generation()
+            except Exception as e:
+                logger.error(f"Shared anagram index generation check failed: {e}")
+
+    def _delta_path(self, generation: int) -> str:
+        return f"{self.path}.{generation}.delta"
+
+    def _open(self) -> bool:
+        """
+        Map the index file and replay its delta; False if it is missing or unusable.
+        """
+        loaded = self._load()
+        if loaded is None:
+            return False
+        self._install(loaded)
+        return True
+
+    def _load(self) -> Optional[Tuple[IndexFile, int, List[str], int]]:
+        """
+        Map and validate the index file and read its delta, without touching this worker's view.
+
+        Returns:
+            Optional[Tuple[IndexFile, int, List[str], int]]: The mapped file, the
+            delta fd, the words in the delta and the offset read up to; None if
+            the file is missing or unusable.
+        """
+        try:
+            index_file = IndexFile(self.path)
+        except FileNotFoundError:
+            return None
+        except IndexFileError as e:
+            logger.warning(f"Ignoring shared anagram index: {e}")
+            return None
+        delta_fd = os.open(self._delta_path(index_file.generation), os.O_RDWR | os.O_CREAT | os.O_APPEND, 0o644)
+        words, offset = self._read_delta(delta_fd, 0)
+        return index_file, delta_fd, words, offset
+
+    def _install(self, loaded: Tuple[IndexFile, int, List[str], int]) -> None:
+        """
+        Replace this worker's view of the index with a file returned by `_load`.
+        """
+        self.close()
+        self._file, self._delta_fd, words, self._delta_offset = loaded
+        self._delta_lock_fd = os.open(f"{self.path}.delta.lock", os.O_RDWR | os.O_CREAT, 0o644)
+        self._buckets = {}
+        self._size = 0
+        self._add_delta_words(words)
+        self._next_delta_check = monotonic() + DELTA_CHECK_INTERVAL
+
+    def _base_lookup(self, signature: bytes) -> Optional[List[str]]:
+        return self._file.lookup(signature) if self._file is not None else None
+
+    def _refresh(self) -> None:
+        if self._file is None:
+            return
+        now = monotonic()
+        if now >= self._next_delta_check:
+            self._next_delta_check = now + DELTA_CHECK_INTERVAL
+            self._replay_delta()
+
+    def _replay_delta(self) -> None:
+        words, self._delta_offset = self._read_delta(self._delta_fd, self._delta_offset)
+        self._add_delta_words(words)
+
+    @staticmethod
+    def _read_delta(delta_fd: int, offset: int) -> Tuple[List[str], int]:
+        """
+        Read the words appended to a delta file past an offset.
+
+        Returns:
+            Tuple[List[str], int]: The words, and the offset read up to.
+        """
+        size = os.fstat(delta_fd).st_size
+        if size <= offset:
+            return [], offset
+        data = os.pread(delta_fd, size - offset, offset)
+        # Only whole lines; a partially visible append is picked up next time.
+        data = data[:data.rfind(b"\n") + 1]
+        words = []
+        for record in data.decode("utf-8").splitlines():
+            try:
+                words.append(json.loads(record))
+            except ValueError:
+                # e.g. a delta left by a deployment that wrote bare words; `attach`
+                # rebuilds the index when the skipped words leave it short.
+                logger.warning(f"Skipping unreadable shared anagram index delta record: {record!r}")
+        return words, offset + len(data)
+
+    def _add_delta_words(self, words: List[str]) -> None:
+        for word, signature in zip(words, compute_letter_frequencies(words)):
+            self.add(word, signature)
+
+    @classmethod
+    async def attach(cls, path: str, db_session: AsyncSession, dataset_digest: bytes = b"") -> "SharedAnagramIndex":
+        """
+        Map the shared index file, building the next generation first if it is
+        missing, corrupt, built from another dataset, or does not hold exactly
+        the words of the table up to its word id watermark.
+
+        Workers attach one at a time under a file lock, so only the first one
+        to find the file stale builds it. A file prebuilt with
+        `python -m cli.build_index` is attached without building anything; the
+        words added to the table since it was built are read into this
+        worker's view of the index.
+
+        Args:
+            path (str): Path of the index file.
+            db_session (AsyncSession): db session.
+            dataset_digest (bytes): SHA-256 of the dataset file the words table was loaded from.
+
+        Returns:
+            SharedAnagramIndex: The mapped index.
+        """
+        lock_fd = os.open(f"{path}.lock", os.O_RDWR | os.O_CREAT, 0o644)
+        try:
+            await asyncio.to_thread(fcntl.flock, lock_fd, fcntl.LOCK_EX)
+            start = perf_counter()
+            index = cls(path)
+            opened = index._open()
+            watermark = await index._usable_watermark(db_session, dataset_digest) if opened else None
+            if watermark is not None:
+                added = await index._add_words_after(db_session, watermark)
+                logger.info(f"Shared anagram index attached in {(perf_counter() - start) * 1000:.1f}ms: "
+                            f"generation {index.generation}, {len(index)} words, "
+                            f"{added} read from the table past word id {watermark}.")
+                return index
+
+            # Words appended before the build starts are committed, so the build sees them.
+            built_from = os.fstat(index._delta_fd).st_size if opened else 0
+            built = await AnagramIndex.build(db_session)
+            # Taken after the scan, so every word the build read is at or below it.
+            watermark = (await db_session.execute(select(func.max(Word.id)))).scalar_one() or 0
+            generation = index.generation + 1
+            # Start the new generation with an empty delta, even if an old deployment left one behind.
+            os.close(os.open(index._delta_path(generation), os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644))
+            write_index_file(path, built._buckets, generation, dataset_digest, word_id_watermark=watermark)
+            if opened:
+                # Words other workers appended while this one was building are carried
+                # over; the ones that made it into the build are skipped on replay.
+                # Publishing waits until the old delta is gone, then appends to the new one.
+                await asyncio.to_thread(fcntl.flock, index._delta_lock_fd, fcntl.LOCK_EX)
+                try:
+                    carried = os.pread(index._delta_fd, os.fstat(index._delta_fd).st_size - built_from, built_from)
+                    if carried:
+                        delta_fd = os.open(index._delta_path(generation), os.O_WRONLY | os.O_APPEND)
+                        os.write(delta_fd, carried)
+                        os.close(delta_fd)
+                    os.unlink(index._delta_path(index.generation))
+                finally:
+                    fcntl.flock(index._delta_lock_fd, fcntl.LOCK_UN)
+                index.close()
+
+            index = cls(path)
+            index._open()
+            logger.info(f"Shared anagram index written: generation {index.generation}, {len(index)} words.")
+            return index
+        finally:
+            fcntl.flock(lock_fd, fcntl.LOCK_UN)
+            os.close(lock_fd)
+
+    async def _usable_watermark(self, db_session: AsyncSession, dataset_digest: bytes) -> Optional[int]:
+        """
+        Return the word id up to which the mapped file holds exactly the words
+        table, or None if it does not and has to be rebuilt.
+
+        The watermark is the file's own, or for a file built from the dataset,
+        the highest id once the same dataset was loaded into the table. The
+        table holds every word the file does up to it (the file's words
+        included), so the file matches if it holds as many.
+        """
+        if self._file.dataset_digest != dataset_digest:
+            return None
+        watermark = self._file.word_id_watermark
+        if not watermark:
+            result = await db_session.execute(
+                select(DatasetManifest.last_word_id).where(DatasetManifest.digest == dataset_digest)
+            )
+            watermark = max((word_id for word_id in result.scalars() if word_id is not None), default=0)
+        if not watermark:
+            return None
+        table_count = (await db_session.execute(
+            select(func.count()).select_from(Word).where(Word.id <= watermark)
+        )).scalar_one()
+        return watermark if table_count == self._file.word_count else None
+
+    async def _add_words_after(self, db_session: AsyncSession, watermark: int) -> int:
+        """
+        Add the words inserted past the watermark to this worker's view of the index.
+
+        Returns:
+            int: The number of words read.
+        """
+        result = await db_session.execute(select(Word.word, Word.signature).where(Word.id > watermark))
+        rows = result.all()
+        for word, signature in rows:
+            self.add(word, signature)
+        return len(rows)
@@ -0,0 +1,78 @@
+from collections import OrderedDict
+from time import monotonic
+from typing import Dict, List, Optional, Tuple
+
+
+class SimilarWordsCache:
+    """
+    LRU cache with a time-to-live, mapping a letter-frequency signature to the
+    words sharing it.
+
+    Entries are keyed by signature rather than by the queried word, so every
+    anagram of a word hits the same entry and a newly added word invalidates
+    exactly one entry.
+    """
+
+    def __init__(self, max_entries: int = 10_000, ttl_seconds: float = 300) -> None:
+        self._entries: "OrderedDict[bytes, Tuple[float, List[str]]]" = OrderedDict()
+        self._max_entries = max_entries
+        self._ttl = ttl_seconds
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, signature: bytes) -> Optional[List[str]]:
+        """
+        Return the cached words of a signature, or None on a miss or an expired entry.
+        """
+        entry = self._entries.get(signature)
+        if entry is None or entry[0] < monotonic():
+            if entry is not None:
+                del self._entries[signature]
+            self.misses += 1
+            return None
+
+        self._entries.move_to_end(signature)
+        self.hits += 1
+        return entry[1]
+
+    def put(self, signature: bytes, words: List[str]) -> None:
+        """
+        Cache the words of a signature, evicting the least recently used entries if full.
+        """
+        self._entries[signature] = (monotonic() + self._ttl, words)
+        self._entries.move_to_end(signature)
+        while len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def invalidate(self, signature: bytes) -> None:
+        """
+        Drop the entry of a signature whose words changed.
+        """
+        if self._entries.pop(signature, None) is not None:
+            self.invalidations += 1
+
+    def clear(self) -> None:
+        """
+        Drop every entry, e.g. after invalidations may have been missed.
+        """
+        self.invalidations += len(self._entries)
+        self._entries.clear()
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Return the size and hit/miss counters of the cache.
+        """
+        return {
+            "entries": len(self._entries),
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "invalidations": self.invalidations,
+        }
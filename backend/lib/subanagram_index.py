@@ -0,0 +1,182 @@
+"""
+In-memory sub-anagram index.
+
+Only the standard library is imported at module level (the database is only
+needed by `SubanagramIndex.build`), so the phrase anagram worker processes
+hold their own copy of the index without the settings or the database.
+"""
+import heapq
+import logging
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple
+
+if TYPE_CHECKING:
+    from sqlalchemy.ext.asyncio import AsyncSession
+
+logger = logging.getLogger(__name__)
+
+# Up to this many distinct query letters the submasks of the query are
+# enumerated (2^16 dict probes at most); beyond it every bucket is scanned.
+SUBMASK_ENUMERATION_MAX_LETTERS = 16
+
+# Maps each count byte to the ASCII digit '0' (absent) or '1' (present).
+_PRESENCE_DIGITS = bytes([ord("0")] + [ord("1")] * 255)
+
+# (letter count, (letter, count) pairs for letters occurring more than once, words)
+SignatureEntry = Tuple[int, Tuple[Tuple[int, int], ...], List[str]]
+
+
+def letter_mask(signature: bytes) -> int:
+    """
+    Return the 26-bit mask of the letters present in a signature.
+    """
+    return int(signature.translate(_PRESENCE_DIGITS)[::-1], 2)
+
+
+class SubanagramIndex:
+    """
+    In-memory index answering "which words can be spelled from these letters".
+
+    Signatures are bucketed by the set of letters they use (a 26-bit mask). A
+    word can be spelled from the query letters only if its mask is a submask
+    of the query's mask, so a query visits just those buckets and then checks
+    the counts of the letters a word repeats; letters used once are already
+    covered by the mask.
+    """
+
+    def __init__(self) -> None:
+        self._buckets: Dict[int, Dict[bytes, SignatureEntry]] = {}
+        self._size = 0
+        # Words added since `snapshot` was taken; None until it is.
+        self._added: Optional[List[Tuple[str, bytes]]] = None
+
+    def __len__(self) -> int:
+        return self._size
+
+    def add(self, word: str, signature: bytes) -> bool:
+        """
+        Add a word to the index.
+
+        Returns:
+            bool: True if the word was added, False if it was already indexed.
+        """
+        bucket = self._buckets.setdefault(letter_mask(signature), {})
+        entry = bucket.get(signature)
+        if entry is None:
+            repeated = tuple((idx, count) for idx, count in enumerate(signature) if count > 1)
+            entry = bucket[signature] = (sum(signature), repeated, [])
+        elif word in entry[2]:
+            return False
+        entry[2].append(word)
+        self._size += 1
+        if self._added is not None:
+            self._added.append((word, signature))
+        return True
+
+    def snapshot(self) -> List[Tuple[str, bytes]]:
+        """
+        Return every indexed word, and keep the words added from now on for `added_since_snapshot`.
+
+        Returns:
+            List[Tuple[str, bytes]]: (word, signature) pairs.
+        """
+        self._added = []
+        return [(word, signature)
+                for bucket in self._buckets.values()
+                for signature, (_, _, words) in bucket.items()
+                for word in words]
+
+    def added_since_snapshot(self, signature: bytes) -> List[Tuple[str, bytes]]:
+        """
+        Return the words added since `snapshot` that can be spelled from the letters of a signature.
+
+        Returns:
+            List[Tuple[str, bytes]]: (word, signature) pairs.
+        """
+        return [(word, candidate) for word, candidate in self._added or ()
+                if all(count <= available for count, available in zip(candidate, signature))]
+
+    def query(self, signature: bytes, min_len: int = 1, limit: int = 100) -> Tuple[List[str], int]:
+        """
+        Find the words that can be spelled from the letters of a signature.
+
+        Args:
+            signature (bytes): Signature of the available letters.
+            min_len (int): Minimum number of letters a word must use.
+            limit (int): Maximum number of words to return.
+
+        Returns:
+            Tuple[List[str], int]: Up to `limit` words, longest first and then
+             alphabetically, and the total number of matching words.
+        """
+        matches = [word for _, words in self.matching_signatures(signature, min_len) for word in words]
+        top = heapq.nsmallest(limit, matches, key=lambda word: (-len(word), word))
+        return top, len(matches)
+
+    def matching_signatures(self, signature: bytes, min_len: int = 1) -> List[Tuple[bytes, List[str]]]:
+        """
+        Find the indexed signatures that can be spelled from the letters of a signature.
+
+        Args:
+            signature (bytes): Signature of the available letters.
+            min_len (int): Minimum number of letters a signature must use.
+
+        Returns:
+            List[Tuple[bytes, List[str]]]: The matching signatures with their words.
+        """
+        query_mask = letter_mask(signature)
+        available = sum(signature)
+        if not query_mask or min_len > available:
+            return []
+
+        matches: List[Tuple[bytes, List[str]]] = []
+        for mask in self._candidate_masks(query_mask):
+            bucket = self._buckets.get(mask)
+            if not bucket:
+                continue
+            for candidate, (length, repeated, words) in bucket.items():
+                if length < min_len or length > available:
+                    continue
+                if all(count <= signature[idx] for idx, count in repeated):
+                    matches.append((candidate, words))
+        return matches
+
+    def _candidate_masks(self, query_mask: int):
+        if bin(query_mask).count("1") <= SUBMASK_ENUMERATION_MAX_LETTERS:
+            submask = query_mask
+            while submask:
+                yield submask
+                submask = (submask - 1) & query_mask
+        else:
+            outside = ~query_mask
+            for mask in list(self._buckets):
+                if not mask & outside:
+                    yield mask
+
+    @classmethod
+    async def build(cls, db_session: "AsyncSession") -> "SubanagramIndex":
+        """
+        Build the index by streaming the words table through a server-side cursor.
+
+        Args:
+            db_session (AsyncSession): db session.
+
+        Returns:
+            SubanagramIndex: The populated index.
+        """
+        from sqlalchemy import select
+
+        from lib.anagram_index import INDEX_FETCH_SIZE
+        from models.word import Word
+
+        index = cls()
+        statement = (
+            select(Word.word, Word.signature)
+            .execution_options(yield_per=INDEX_FETCH_SIZE)
+        )
+        result = await db_session.stream(statement)
+        async for rows in result.partitions():
+            for word, signature in rows:
+                index.add(word, signature)
+
+        logger.info(f"Sub-anagram index built: {len(index)} words, {len(index._buckets)} letter sets.")
+        return index
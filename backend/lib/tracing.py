@@ -0,0 +1,165 @@
+import json
+import logging
+import os
+import random
+from contextlib import contextmanager
+from contextvars import ContextVar
+from time import perf_counter, time
+from typing import Iterator, List, NamedTuple, Optional
+from uuid import uuid4
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+logger = logging.getLogger(__name__)
+
+
+class Span(NamedTuple):
+    name: str
+    # Seconds since the start of the trace.
+    start: float
+    duration: float
+    depth: int
+
+
+class Trace:
+    """
+    The spans recorded while serving one request.
+    """
+
+    __slots__ = ("trace_id", "name", "started_at", "start", "spans", "depth")
+
+    def __init__(self, name: str) -> None:
+        self.trace_id = uuid4().hex[:16]
+        self.name = name
+        self.started_at = time()
+        self.start = perf_counter()
+        self.spans: List[Span] = []
+        self.depth = 0
+
+    def record(self, name: str, start: float, end: float) -> None:
+        self.spans.append(Span(name, start - self.start, end - start, self.depth))
+
+    def to_dict(self, duration: float) -> dict:
+        return {
+            "trace_id": self.trace_id,
+            "name": self.name,
+            "started_at": self.started_at,
+            "duration_ms": round(duration * 1000, 3),
+            "spans": [
+                {
+                    "name": span.name,
+                    "start_ms": round(span.start * 1000, 3),
+                    "duration_ms": round(span.duration * 1000, 3),
+                    "depth": span.depth,
+                }
+                for span in sorted(self.spans, key=lambda span: span.start)
+            ],
+        }
+
+
+_current_trace: ContextVar[Optional[Trace]] = ContextVar("current_trace", default=None)
+
+
+@contextmanager
+def span(name: str) -> Iterator[None]:
+    """
+    Time a block as a span of the current request's trace; a no-op when the
+    request is not traced.
+    """
+    trace = _current_trace.get()
+    if trace is None:
+        yield
+        return
+
+    start = perf_counter()
+    trace.depth += 1
+    try:
+        yield
+    finally:
+        trace.depth -= 1
+        trace.record(name, start, perf_counter())
+
+
+def record_span(name: str, start: float) -> None:
+    """
+    Record a span that started at `start` (a perf_counter value) and ends now,
+    for hooks that cannot wrap the timed code in a `with span(...)` block.
+    """
+    trace = _current_trace.get()
+    if trace is not None:
+        trace.record(name, start, perf_counter())
+
+
+class Tracer:
+    """
+    Starts a trace for every request and decides where finished traces go.
+
+    Recording spans costs a few perf_counter calls, so every request records
+    them: a request that took longer than the slow threshold always logs its
+    span breakdown, however rare it is. The sample rate only picks the traces
+    appended to the export file, as JSON lines.
+    """
+
+    def __init__(self, sample_rate: float = 1.0, slow_threshold_ms: float = 500,
+                 export_path: Optional[str] = None) -> None:
+        self.sample_rate = sample_rate
+        self.slow_threshold = slow_threshold_ms / 1000
+        self._export_fd: Optional[int] = None
+        if export_path:
+            self._export_fd = os.open(export_path, os.O_WRONLY | os.O_CREAT | os.O_APPEND, 0o644)
+
+    def start(self, name: str) -> Trace:
+        return Trace(name)
+
+    def finish(self, trace: Trace) -> None:
+        duration = perf_counter() - trace.start
+        if duration >= self.slow_threshold:
+            logger.warning(self.format_breakdown(trace, duration))
+        if self._export_fd is not None and (self.sample_rate >= 1 or random.random() < self.sample_rate):
+            # One O_APPEND write per trace keeps lines whole when several workers share the file.
+            os.write(self._export_fd, (json.dumps(trace.to_dict(duration)) + "\n").encode("utf-8"))
+
+    @staticmethod
+    def format_breakdown(trace: Trace, duration: float) -> str:
+        lines = [f"Slow request {trace.name} took {duration * 1000:.1f}ms [trace {trace.trace_id}]:"]
+        for span in sorted(trace.spans, key=lambda span: span.start):
+            indent = "  " * (span.depth + 1)
+            lines.append(f"{indent}{span.name}: {span.duration * 1000:.3f}ms at +{span.start * 1000:.3f}ms")
+        return "\n".join(lines)
+
+
+class TracingMiddleware:
+    """
+    Pure ASGI middleware tracing HTTP requests.
+
+    Besides the spans recorded by the application, it adds a `response` span
+    from the end of the last span to the start of the response, which covers
+    response-model validation and serialization.
+    """
+
+    def __init__(self, app: ASGIApp, tracer: Tracer) -> None:
+        self.app = app
+        self.tracer = tracer
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        trace = self.tracer.start(f"{scope['method']} {scope['path']}")
+
+        async def send_wrapper(message: Message) -> None:
+            if message["type"] == "http.response.start" and trace.spans:
+                last_end = max(span.start + span.duration for span in trace.spans)
+                trace.record("response", trace.start + last_end, perf_counter())
+            await send(message)
+
+        token = _current_trace.set(trace)
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            _current_trace.reset(token)
+            route = scope.get("route")
+            if route is not None:
+                trace.name = f"{scope['method']} {route.path}"
+            self.tracer.finish(trace)
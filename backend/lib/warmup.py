@@ -0,0 +1,70 @@
+import logging
+from contextlib import contextmanager
+from time import monotonic
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+class WarmupStatus:
+    """
+    Progress of the startup work that runs in the background once the app
+    accepts requests: the dataset sync and the in-memory index builds.
+
+    The service is ready as soon as the Word table holds words to serve:
+    at once when it already did at startup, otherwise once the dataset is
+    loaded. Until an index is built, its endpoints fall back to the
+    database (/similar) or answer 503.
+
+    Words added while the indexes are being built are also kept here, to
+    be replayed into the indexes once they are all built: a build reading
+    the table may not see them, and the index is not there yet to add them to.
+    """
+
+    def __init__(self, phases: Iterable[str]) -> None:
+        self._phases: Dict[str, Dict[str, Any]] = {name: {"state": "pending"} for name in phases}
+        self.words_available = False
+        self.pending_words: Optional[List[Tuple[str, bytes]]] = []
+
+    @property
+    def ready(self) -> bool:
+        return self.words_available
+
+    @property
+    def finished(self) -> bool:
+        return all(phase["state"] in ("done", "failed") for phase in self._phases.values())
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        """
+        Track a phase from start to end; a failure is recorded and re-raised.
+        """
+        phase = self._phases[name]
+        phase.update(state="running", startedAt=monotonic())
+        try:
+            yield
+        except Exception as e:
+            phase.update(state="failed", error=str(e), finishedAt=monotonic())
+            raise
+        phase.update(state="done", progress=1.0, finishedAt=monotonic())
+        logger.info(f"Warm-up: {name} done in {phase['finishedAt'] - phase['startedAt']:.2f}s.")
+
+    def progress(self, name: str, fraction: float) -> None:
+        self._phases[name]["progress"] = round(fraction, 3)
+
+    def take_pending_words(self) -> List[Tuple[str, bytes]]:
+        """
+        Return the words added during warm-up, and stop collecting them.
+        """
+        words, self.pending_words = self.pending_words or [], None
+        return words
+
+    def snapshot(self) -> Dict[str, Any]:
+        now = monotonic()
+        phases = {}
+        for name, phase in self._phases.items():
+            entry = {key: value for key, value in phase.items() if key not in ("startedAt", "finishedAt")}
+            if "startedAt" in phase:
+                entry["elapsedSeconds"] = round(phase.get("finishedAt", now) - phase["startedAt"], 3)
+            phases[name] = entry
+        return {"ready": self.ready, "finished": self.finished, "phases": phases}
@@ -0,0 +1,169 @@
+import asyncio
+import json
+import logging
+from typing import Iterable, List, Optional, Tuple
+
+import asyncpg
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from starlette.datastructures import State
+
+from lib.shared_anagram_index import SharedAnagramIndex
+from utils.string_utils import compute_letter_frequencies
+
+logger = logging.getLogger(__name__)
+
+WORDS_ADDED_CHANNEL = "words_added"
+# Identifies the listener connections in pg_stat_activity.
+LISTENER_APPLICATION_NAME = "anagram-word-events"
+# Postgres rejects NOTIFY payloads of 8000 bytes or more.
+MAX_PAYLOAD_BYTES = 7900
+RECONNECT_DELAY_SECONDS = 5
+
+
+async def notify_words_added(db_session: AsyncSession, words: Iterable[str]) -> None:
+    """
+    Announce added words to every worker listening on the words_added channel.
+
+    Runs in the caller's transaction: Postgres only delivers the notification
+    when the transaction commits, and drops it on rollback. Words are sent as
+    JSON arrays, split into as many notifications as needed.
+
+    Args:
+        db_session (AsyncSession): db session.
+        words (Iterable[str]): The normalized words that were inserted.
+    """
+    payload: List[str] = []
+    # The brackets; each word adds its JSON string and the ", " separator.
+    payload_size = 2
+    for word in words:
+        word_size = len(json.dumps(word).encode("utf-8")) + 2
+        if payload and payload_size + word_size > MAX_PAYLOAD_BYTES:
+            await db_session.execute(select(func.pg_notify(WORDS_ADDED_CHANNEL, json.dumps(payload))))
+            payload, payload_size = [], 2
+        payload.append(word)
+        payload_size += word_size
+    if payload:
+        await db_session.execute(select(func.pg_notify(WORDS_ADDED_CHANNEL, json.dumps(payload))))
+
+
+def apply_words_added(state: State, words: Iterable[Tuple[str, bytes]], publish: bool = False) -> None:
+    """
+    Bring this worker's in-process structures up to date with added words.
+
+    Args:
+        state (State): The application state holding the indexes and cache.
+        words: (word, signature) pairs that were inserted.
+        publish (bool): The words were inserted by this worker: also append them
+         to the shared anagram index, if any, for the other workers.
+    """
+    words = list(words)
+    warmup = getattr(state, "warmup", None)
+    if warmup is not None and warmup.pending_words is not None:
+        # Replayed once the indexes still being built are in place.
+        warmup.pending_words.extend(words)
+    index = getattr(state, "anagram_index", None)
+    if publish and isinstance(index, SharedAnagramIndex):
+        index.publish(word for word, _ in words)
+    subanagram_index = getattr(state, "subanagram_index", None)
+    near_anagram_index = getattr(state, "near_anagram_index", None)
+    cache = getattr(state, "similar_cache", None)
+    for word, signature in words:
+        if index is not None:
+            index.add(word, signature)
+        if subanagram_index is not None:
+            subanagram_index.add(word, signature)
+        if near_anagram_index is not None:
+            near_anagram_index.add(word, signature)
+        if cache is not None:
+            cache.invalidate(signature)
+
+
+class WordEventListener:
+    """
+    Listens on the words_added channel with a dedicated asyncpg connection and
+    applies the words other workers inserted to this worker's index and cache.
+
+    If the connection drops, notifications may have been missed: the cache is
+    cleared, the listener reconnects, and the words inserted since the highest
+    id it had caught up to are read from the table and applied.
+    """
+
+    def __init__(self, dsn: str, state: State) -> None:
+        self._dsn = dsn
+        self._state = state
+        self._connection: Optional[asyncpg.Connection] = None
+        # Every word up to this id is known to the indexes; None until first connected.
+        self._last_word_id: Optional[int] = None
+        self._task: Optional[asyncio.Task] = None
+        self._disconnected = asyncio.Event()
+
+    async def start(self) -> None:
+        """
+        Connect and start listening; reconnection runs in a background task.
+        """
+        await self._connect()
+        await self._catch_up()
+        self._task = asyncio.create_task(self._reconnect_loop(), name="word-event-listener")
+
+    async def close(self) -> None:
+        """
+        Stop listening and close the connection.
+        """
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+        if self._connection is not None and not self._connection.is_closed():
+            await self._connection.close()
+
+    async def _connect(self) -> None:
+        self._disconnected.clear()
+        self._connection = await asyncpg.connect(
+            self._dsn, server_settings={"application_name": LISTENER_APPLICATION_NAME}
+        )
+        self._connection.add_termination_listener(self._on_termination)
+        await self._connection.add_listener(WORDS_ADDED_CHANNEL, self._on_notification)
+        logger.info(f"Listening for added words on channel '{WORDS_ADDED_CHANNEL}'.")
+
+    async def _reconnect_loop(self) -> None:
+        while True:
+            await self._disconnected.wait()
+            cache = getattr(self._state, "similar_cache", None)
+            if cache is not None:
+                cache.clear()
+            try:
+                await self._connect()
+                await self._catch_up()
+            except Exception as e:
+                logger.warning(f"Word event listener reconnect failed: {e}")
+                if self._connection is not None and not self._connection.is_closed():
+                    self._connection.terminate()
+                await asyncio.sleep(RECONNECT_DELAY_SECONDS)
+                self._disconnected.set()
+
+    async def _catch_up(self) -> None:
+        """
+        Apply the words inserted since the last catch-up, whose notifications may have been lost.
+
+        Runs once listening, so the words inserted after the new high-water mark are notified.
+        """
+        last_word_id = await self._connection.fetchval("SELECT coalesce(max(id), 0) FROM words")
+        if self._last_word_id is not None and last_word_id > self._last_word_id:
+            rows = await self._connection.fetch(
+                "SELECT word, signature FROM words WHERE id > $1 AND id <= $2",
+                self._last_word_id, last_word_id,
+            )
+            apply_words_added(self._state, ((row["word"], bytes(row["signature"])) for row in rows))
+            logger.info(f"Word event listener caught up on {len(rows)} words inserted while disconnected.")
+        self._last_word_id = last_word_id
+
+    def _on_termination(self, connection: asyncpg.Connection) -> None:
+        logger.warning("Word event listener connection lost.")
+        self._disconnected.set()
+
+    def _on_notification(self, connection: asyncpg.Connection, pid: int, channel: str, payload: str) -> None:
+        words = json.loads(payload)
+        apply_words_added(self._state, zip(words, compute_letter_frequencies(words)))
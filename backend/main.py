@@ -1,8 +1,10 @@
-from fastapi import FastAPI, APIRouter
+from fastapi import FastAPI, APIRouter, Request, Response, status
+from fastapi.responses import JSONResponse
 
 from middlewares import register_middlewares
 from settings import settings as app_config
 from lib.lifespan import lifespan
+from lib.metrics import render_metrics
 from api.word_router import router as words_router
 from api.request_log_router import router as stats_router
 
@@ -20,6 +22,35 @@ register_middlewares(app)
 async def health_check():
     return {"status": "healthy"}
 
+
+@app.get("/health/live")
+async def liveness_check():
+    """
+    The process is up and serving; says nothing about the warm-up.
+    """
+    return {"status": "alive"}
+
+
+@app.get("/health/ready")
+async def readiness_check(request: Request):
+    """
+    Ready once there are words to serve; reports the progress of the dataset
+    sync and the index builds still running in the background.
+    """
+    warmup = getattr(request.app.state, "warmup", None)
+    if warmup is None:
+        return JSONResponse(status_code=status.HTTP_503_SERVICE_UNAVAILABLE, content={"status": "starting"})
+    return JSONResponse(
+        status_code=status.HTTP_200_OK if warmup.ready else status.HTTP_503_SERVICE_UNAVAILABLE,
+        content={"status": "ready" if warmup.ready else "starting", "warmup": warmup.snapshot()},
+    )
+
+if app_config.METRICS_ENABLED:
+    @app.get("/metrics", include_in_schema=False)
+    async def metrics():
+        content, content_type = render_metrics()
+        return Response(content=content, media_type=content_type)
+
 api_router = APIRouter()
 api_router.include_router(words_router, tags=["Word"])
 
@@ -6,6 +6,10 @@ from starlette.middleware.base import BaseHTTPMiddleware
 from starlette.middleware.cors import CORSMiddleware
 from starlette.requests import Request
 
+from lib.metrics import MetricsMiddleware
+from lib.tracing import Tracer, TracingMiddleware
+from settings import settings
+
 __all__ = ["global_userid", "register_middlewares"]
 
 global_userid: ContextVar[Optional[int]] = ContextVar("global_userid", default=None)
@@ -37,6 +41,18 @@ def register_middlewares(app: FastAPI):
         allow_headers=["*"],
         expose_headers=["X-Request-ID"],
     )
+    if settings.TRACING_ENABLED:
+        app.add_middleware(
+            TracingMiddleware,
+            tracer=Tracer(
+                sample_rate=settings.TRACE_SAMPLE_RATE,
+                slow_threshold_ms=settings.TRACE_SLOW_THRESHOLD_MS,
+                export_path=settings.TRACE_EXPORT_PATH,
+            ),
+        )
+    if settings.METRICS_ENABLED:
+        # Added last so it is the outermost middleware and times the whole request.
+        app.add_middleware(MetricsMiddleware)
     # app.add_middleware(BackgroundMiddleware)
     # app.add_middleware(CorrelationIdMiddleware)
 
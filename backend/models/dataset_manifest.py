@@ -0,0 +1,38 @@
+from datetime import datetime
+from typing import Optional
+
+from sqlalchemy import String, DateTime, Integer, LargeBinary
+from sqlalchemy.orm import mapped_column, Mapped
+
+from database.connection import Base
+
+
+class DatasetManifest(Base):
+    """
+    The dataset file the Word table was last synced with.
+    """
+    __tablename__ = 'dataset_manifest'
+
+    dataset: Mapped[str] = mapped_column(String, primary_key=True)
+    # SHA-256 of the file, written once every chunk of it is loaded.
+    digest: Mapped[bytes] = mapped_column(LargeBinary(32), nullable=False)
+    updated_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
+    # Highest words.id once the file was loaded: every word of the file is at or below it.
+    last_word_id: Mapped[Optional[int]] = mapped_column(Integer, nullable=True)
+
+    def __repr__(self) -> str:
+        return f"DatasetManifest(dataset='{self.dataset}')"
+
+
+class DatasetManifestChunk(Base):
+    """
+    A chunk of a dataset file whose words are loaded, committed with them.
+    """
+    __tablename__ = 'dataset_manifest_chunk'
+
+    dataset: Mapped[str] = mapped_column(String, primary_key=True)
+    # SHA-256 of the chunk's lines, as read from the file.
+    chunk_hash: Mapped[bytes] = mapped_column(LargeBinary(32), primary_key=True)
+
+    def __repr__(self) -> str:
+        return f"DatasetManifestChunk(dataset='{self.dataset}', chunk_hash={self.chunk_hash.hex()})"
@@ -5,13 +5,21 @@ from database.connection import Base
 from datetime import datetime, timezone
 
 class RequestLog(Base):
+    """
+    Log of served requests, range-partitioned by day on timestamp.
+
+    The partitions are created ahead of time and dropped after the retention
+    period by database/partition_utils.py; the partition key has to be part of
+    the primary key.
+    """
     __tablename__ = 'request_log'
+    __table_args__ = {"postgresql_partition_by": "RANGE (timestamp)"}
 
-    id: Mapped[int] = mapped_column(Integer, primary_key=True)
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
     endpoint: Mapped[str] = mapped_column(String, index=True)
-    timestamp: Mapped[datetime] = mapped_column(DateTime(timezone=True), default=lambda: datetime.now(tz=timezone.utc), index=True)
+    timestamp: Mapped[datetime] = mapped_column(DateTime(timezone=True), primary_key=True, default=lambda: datetime.now(tz=timezone.utc), index=True)
     processing_time: Mapped[float] = mapped_column(Float)
     word: Mapped[str] = mapped_column(String, nullable=True)
 
     def __repr__(self) -> str:
-        return f"RequestLog(id={self.id}, endpoint='{self.endpoint}')"
\ No newline at end of file
+        return f"RequestLog(id={self.id}, endpoint='{self.endpoint}')"
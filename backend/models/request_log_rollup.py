@@ -0,0 +1,22 @@
+from sqlalchemy import String, DateTime, Float, BigInteger
+from sqlalchemy.orm import mapped_column, Mapped
+
+from database.connection import Base
+from datetime import datetime
+
+
+class RequestLogRollup(Base):
+    """
+    Per-minute, per-endpoint aggregate of the request_log table.
+    """
+    __tablename__ = 'request_log_rollup'
+
+    bucket_start: Mapped[datetime] = mapped_column(DateTime(timezone=True), primary_key=True)
+    endpoint: Mapped[str] = mapped_column(String, primary_key=True)
+    request_count: Mapped[int] = mapped_column(BigInteger, nullable=False, default=0)
+    processing_time_sum: Mapped[float] = mapped_column(Float, nullable=False, default=0)
+    processing_time_min: Mapped[float] = mapped_column(Float, nullable=True)
+    processing_time_max: Mapped[float] = mapped_column(Float, nullable=True)
+
+    def __repr__(self) -> str:
+        return f"RequestLogRollup(bucket_start={self.bucket_start}, endpoint='{self.endpoint}')"
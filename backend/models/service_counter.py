@@ -0,0 +1,17 @@
+from sqlalchemy import String, BigInteger
+from sqlalchemy.orm import mapped_column, Mapped
+
+from database.connection import Base
+
+
+class ServiceCounter(Base):
+    """
+    Named counters maintained in the same transactions as the rows they count.
+    """
+    __tablename__ = 'service_counter'
+
+    name: Mapped[str] = mapped_column(String, primary_key=True)
+    value: Mapped[int] = mapped_column(BigInteger, nullable=False, default=0)
+
+    def __repr__(self) -> str:
+        return f"ServiceCounter(name='{self.name}', value={self.value})"
@@ -1,11 +1,8 @@
-from os import getenv
-from sqlalchemy import Column, String, Integer
+from sqlalchemy import Column, String, Integer, LargeBinary
 from sqlalchemy.orm import Mapped, mapped_column
 
 from database.connection import Base
-
-
-WORD_MAX_LENGTH = int(getenv("WORD_MAX_LENGTH", 100))
+from utils.string_utils import ALPHABET_SIZE, WORD_MAX_LENGTH
 
 
 class Word(Base):
@@ -13,7 +10,7 @@ class Word(Base):
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
     word: Mapped[str] = mapped_column(String(WORD_MAX_LENGTH), unique=True, nullable=False)
-    signature: Mapped[str] = mapped_column(String(26), index=True, nullable=False)
+    signature: Mapped[bytes] = mapped_column(LargeBinary(ALPHABET_SIZE), index=True, nullable=False)
 
     def __repr__(self) -> str:
         return f"Word(id={self.id}, word='{self.word}')"
\ No newline at end of file
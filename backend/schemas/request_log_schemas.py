@@ -0,0 +1,20 @@
+from datetime import datetime
+from typing import List, Optional
+from pydantic import BaseModel, Field
+
+
+class RequestLogRecord(BaseModel):
+    id: int
+    endpoint: Optional[str]
+    timestamp: Optional[datetime]
+    processing_time: Optional[float]
+    word: Optional[str]
+
+    class Config:
+        from_attributes = True
+
+
+class RequestLogPage(BaseModel):
+    items: List[RequestLogRecord]
+    next_cursor: Optional[int] = Field(None,
+                                       description="Pass as `cursor` to fetch the next page; null on the last page.")
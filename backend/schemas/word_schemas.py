@@ -1,9 +1,14 @@
 
-from typing import List
+from typing import Dict, List, Literal, Optional
 from pydantic import BaseModel, Field
+from typing_extensions import Annotated
 from os import getenv
 
 WORD_MAX_LENGTH = int(getenv("WORD_MAX_LENGTH", 100))
+BATCH_MAX_WORDS = int(getenv("BATCH_MAX_WORDS", 1000))
+PHRASE_MAX_LETTERS = int(getenv("PHRASE_MAX_LETTERS", 30))
+PHRASE_MAX_WORDS = int(getenv("PHRASE_MAX_WORDS", 5))
+PHRASE_MAX_TIME_BUDGET_MS = int(getenv("PHRASE_MAX_TIME_BUDGET_MS", 5000))
 
 class SimilarWordsResponse(BaseModel):
     similar: List[str]
@@ -12,15 +17,80 @@ class SimilarWordsResponse(BaseModel):
         from_attributes = True
 
 
+class NearAnagram(BaseModel):
+    word: str
+    operation: Literal["substitution", "insertion", "deletion"] = Field(
+        ..., description="Edit turning the query's letters into the word's.")
+    added: Optional[str] = Field(None, description="Letter the word has in addition.")
+    removed: Optional[str] = Field(None, description="Letter of the query the word lacks.")
+
+
+class NearAnagramsResponse(BaseModel):
+    near: List[NearAnagram] = Field(...,
+                                    description="Substitutions first, then insertions, then deletions.")
+    total: int = Field(..., description="Number of near anagrams before the limit was applied.")
+
+
+class SubanagramsResponse(BaseModel):
+    subanagrams: List[str] = Field(...,
+                                   description="Words spelled from the letters, longest first.")
+    total: int = Field(..., description="Number of matching words before the limit was applied.")
+
+
+class PhraseAnagramsRequest(BaseModel):
+    phrase: str = Field(..., min_length=1, max_length=200,
+                        description="The phrase whose letters are rearranged; non-letters are ignored.")
+    max_words: int = Field(3, ge=1, le=PHRASE_MAX_WORDS, description="Maximum words per phrase.")
+    min_word_len: int = Field(2, ge=1, description="Minimum letters per word.")
+    limit: int = Field(100, ge=1, le=1000, description="Maximum number of phrases to return.")
+    time_budget_ms: int = Field(1000, ge=1, le=PHRASE_MAX_TIME_BUDGET_MS,
+                                description="Time after which the search stops and returns what it found.")
+
+
+class PhraseAnagramsResponse(BaseModel):
+    phrases: List[str] = Field(..., description="Phrases using exactly the letters given.")
+    complete: bool = Field(..., description="False if the time budget or the limit cut the search short.")
+
+
 class AddWordRequest(BaseModel):
     word: str = Field(
         ...,
         min_length=1,
         max_length=200,
-        description="The word to add to the dictionary."
+        pattern=r"^\s*[A-Za-z]+\s*$",
+        description="The word to add to the dictionary; letters a-z only."
     )
 
 
 class AddWordResponse(BaseModel):
     message: str = Field(...,
-                         description="Success message.")
\ No newline at end of file
+                         description="Success message.")
+
+
+class SimilarWordsBatchRequest(BaseModel):
+    words: List[Annotated[str, Field(min_length=1, max_length=200)]] = Field(
+        ...,
+        min_length=1,
+        max_length=BATCH_MAX_WORDS,
+        description="The words to find similar words for."
+    )
+
+
+class SimilarWordsBatchResponse(BaseModel):
+    results: Dict[str, List[str]] = Field(...,
+                                          description="Similar words per input word.")
+
+
+class AddWordsRequest(BaseModel):
+    words: List[Annotated[str, Field(min_length=1, max_length=200)]] = Field(
+        ...,
+        min_length=1,
+        max_length=BATCH_MAX_WORDS,
+        description="The words to add to the dictionary."
+    )
+
+
+class AddWordsResponse(BaseModel):
+    inserted: int = Field(..., description="Words added to the dictionary.")
+    already_present: int = Field(..., description="Words that were already in the dictionary.")
+    invalid: int = Field(..., description="Words skipped for being empty, too long or not letters a-z only.")
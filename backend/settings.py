@@ -1,10 +1,12 @@
-from typing import Optional, Any
+from typing import Optional, Any, Literal
 from pathlib import Path
 from pydantic import PostgresDsn, field_validator, ValidationError, Field
 from pydantic_core.core_schema import ValidationInfo
 from pydantic_settings import BaseSettings
 import logging
 
+from utils.string_utils import MAX_LETTER_COUNT
+
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
@@ -14,6 +16,7 @@ class Settings(BaseSettings):
     API_VERSION: str = 'v1'
 
     CURRENT_FILE: Path = Path(__file__)
+    # Signatures store one byte per letter, so a word may not exceed MAX_LETTER_COUNT (255) letters
     WORD_MAX_LENGTH: int = 100
 
     # Database Configuration
@@ -24,6 +27,88 @@ class Settings(BaseSettings):
 
     SQLALCHEMY_DATABASE_URI: Optional[PostgresDsn] = None
 
+    # Read-only handlers (/similar, /stats, /request_logs) query this database when set,
+    # e.g. a streaming replica; it may also point at the primary itself
+    DB_READ_REPLICA_URI: Optional[PostgresDsn] = None
+    # After a replica connection fails, reads go to the primary for this many seconds
+    DB_READ_REPLICA_RETRY_SECONDS: float = 30
+
+    # Connection pool of each worker; DB_POOL_WARMUP opens DB_POOL_SIZE connections at startup
+    # and prepares the hot statements on each, kept in asyncpg's per-connection statement cache
+    DB_POOL_SIZE: int = 5
+    DB_MAX_OVERFLOW: int = 10
+    DB_POOL_TIMEOUT: float = 30
+    DB_POOL_RECYCLE: int = 1800
+    DB_POOL_WARMUP: bool = True
+    DB_STATEMENT_CACHE_SIZE: int = 256
+
+    # Dataset loader: "copy" streams the file through asyncpg COPY, "orm" uses Word objects
+    DATASET_LOADER: Literal["copy", "orm"] = "copy"
+    # Words per batch; each batch commits with a checkpoint, so an interrupted load resumes after it
+    DATASET_BATCH_SIZE: int = 20_000
+
+    # In-memory signature -> words index serving /similar
+    ANAGRAM_INDEX_ENABLED: bool = True
+    # Share it between workers as one memory-mapped file instead of one copy per worker
+    ANAGRAM_INDEX_SHARED: bool = False
+    ANAGRAM_INDEX_PATH: str = "/tmp/anagram_index.bin"
+
+    # In-memory letter-set index serving /subanagrams
+    SUBANAGRAM_INDEX_ENABLED: bool = True
+
+    # In-memory one-letter-edit neighbor index serving /similar/near
+    NEAR_ANAGRAM_INDEX_ENABLED: bool = True
+
+    # Worker processes running /phrase-anagrams searches; 0 disables the endpoint. Searches
+    # beyond the maximum pending (running or queued for a worker) are answered with 503
+    PHRASE_ANAGRAM_WORKERS: int = 2
+    PHRASE_ANAGRAM_MAX_PENDING: int = 8
+
+    # Prometheus metrics at /metrics; set PROMETHEUS_MULTIPROC_DIR when running several workers
+    METRICS_ENABLED: bool = True
+
+    # In-process request tracing: every request records its spans, and those slower than the
+    # threshold log their breakdown; with an export path, the sampled fraction of traces is
+    # appended to it as JSON lines. Raise the rate (up to 1.0) to export more while investigating
+    TRACING_ENABLED: bool = True
+    TRACE_SAMPLE_RATE: float = 0.01
+    TRACE_SLOW_THRESHOLD_MS: float = 500
+    TRACE_EXPORT_PATH: Optional[str] = None
+
+    # Signature-keyed LRU/TTL cache in front of the /similar database lookup
+    SIMILAR_CACHE_ENABLED: bool = True
+    SIMILAR_CACHE_MAX_ENTRIES: int = 10_000
+    SIMILAR_CACHE_TTL_SECONDS: float = 300
+
+    # Propagate added words to every worker's index and cache via Postgres LISTEN/NOTIFY
+    WORD_EVENTS_ENABLED: bool = True
+
+    # Background request-log writer; when disabled each request commits its own log row
+    REQUEST_LOG_ASYNC: bool = True
+    REQUEST_LOG_QUEUE_SIZE: int = 10_000
+    REQUEST_LOG_BATCH_SIZE: int = 500
+    REQUEST_LOG_FLUSH_INTERVAL_MS: int = 200
+    REQUEST_LOG_OVERFLOW_POLICY: Literal["drop_newest", "drop_oldest"] = "drop_newest"
+
+    # Daily request_log partitions are created this many days ahead; partitions older than the
+    # retention period (0 keeps everything) are dropped, after being folded into the rollups
+    # with "summarize"
+    REQUEST_LOG_PARTITION_PREMAKE_DAYS: int = 7
+    REQUEST_LOG_RETENTION_DAYS: int = 0
+    REQUEST_LOG_RETENTION_MODE: Literal["drop", "summarize"] = "summarize"
+    REQUEST_LOG_MAINTENANCE_INTERVAL_SECONDS: float = 3600
+    # Per-minute request_log rollups older than this many days are merged into daily ones
+    # (0 keeps them all); /stats totals are unchanged
+    REQUEST_LOG_ROLLUP_RETENTION_DAYS: int = 90
+
+    @field_validator("WORD_MAX_LENGTH")
+    @classmethod
+    def check_word_max_length(cls, v: int) -> int:
+        if not 0 < v <= MAX_LETTER_COUNT:
+            raise ValueError(f"WORD_MAX_LENGTH must be between 1 and {MAX_LETTER_COUNT}: "
+                             f"signatures store one byte per letter")
+        return v
+
     @field_validator("SQLALCHEMY_DATABASE_URI", mode="before")
     @classmethod
     def assemble_db_uri(cls, v: Optional[str], info: ValidationInfo) -> Any:
@@ -16,6 +16,7 @@ async def test_get_stats():
     assert "totalWords" in data
     assert "totalRequests" in data
     assert "avgProcessingTimeMs" in data
+    assert data["dbPool"]["checkedOut"] <= data["dbPool"]["size"] + data["dbPool"]["maxOverflow"]
 
 
 @pytest.mark.asyncio
@@ -44,3 +45,62 @@ async def test_get_similar_words(word: str, expected_anagrams: list):
     else:
         assert response.status_code == 404
         assert response.json().get("detail") == "Similar words not found"
+
+
+@pytest.mark.asyncio
+async def test_get_subanagrams():
+    params = {"letters": "listen", "min_len": 5, "limit": 10}
+
+    async with AsyncClient(base_url=BASE_URL) as ac:
+        response = await ac.get("/subanagrams", params=params)
+
+    assert response.status_code == 200
+    data = response.json()
+    assert {"listen", "silent", "enlist"} <= set(data["subanagrams"])
+    assert data["total"] >= len(data["subanagrams"])
+    available = compute_letter_frequency("listen")
+    for word in data["subanagrams"]:
+        signature = compute_letter_frequency(word)
+        assert sum(signature) >= 5
+        assert all(count <= available[idx] for idx, count in enumerate(signature))
+
+
+@pytest.mark.asyncio
+async def test_get_near_anagrams():
+    params = {"word": "apple", "limit": 5}
+
+    async with AsyncClient(base_url=BASE_URL) as ac:
+        response = await ac.get("/similar/near", params=params)
+
+    assert response.status_code == 200
+    data = response.json()
+    assert len(data["near"]) == 5
+    assert data["total"] >= 5
+    assert all(match["operation"] == "substitution" for match in data["near"])
+    assert "ample" in [match["word"] for match in data["near"]]
+
+
+@pytest.mark.asyncio
+async def test_get_metrics():
+    async with AsyncClient(base_url="http://localhost:8000") as ac:
+        await ac.get(f"/api/{settings.API_VERSION}/similar", params={"word": "apple"})
+        response = await ac.get("/metrics")
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain")
+    assert f'route="/api/{settings.API_VERSION}/similar"' in response.text
+    assert "db_pool_checkout_seconds_count" in response.text
+
+
+@pytest.mark.asyncio
+async def test_health_probes():
+    async with AsyncClient(base_url="http://localhost:8000") as ac:
+        live = await ac.get("/health/live")
+        ready = await ac.get("/health/ready")
+
+    assert live.status_code == 200
+    assert ready.status_code in (200, 503)
+    data = ready.json()
+    assert data["status"] == ("ready" if ready.status_code == 200 else "starting")
+    if "warmup" in data:
+        assert data["warmup"]["phases"]["dataset"]["state"] in ("pending", "running", "done", "failed")
@@ -1,6 +1,7 @@
 import pytest
 from httpx import AsyncClient
 from backend.settings import settings
+from backend.utils.string_utils import compute_letter_frequency
 
 BASE_URL = f"http://localhost:8000/api/{settings.API_VERSION}/"
 
@@ -20,3 +21,69 @@ async def test_add_word(word):
     else:
         assert response.status_code == 500
         assert "Failed to add word" in response.json().get("detail")
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("word", ["qzxjab\nqzxjcd", "two words", "don't"])
+async def test_add_word_rejects_non_letters(word):
+    async with AsyncClient(base_url=BASE_URL) as ac:
+        response = await ac.post("/add-word", json={"word": word})
+
+    assert response.status_code == 422
+
+
+@pytest.mark.asyncio
+async def test_similar_words_batch():
+    payload = {"words": ["apple", "cloud", "chip"]}
+
+    async with AsyncClient(base_url=BASE_URL) as ac:
+        response = await ac.post("/similar/batch", json=payload)
+
+    assert response.status_code == 200
+    results = response.json().get("results")
+    assert set(results) == set(payload["words"])
+
+    for word, similar_words in results.items():
+        assert word not in similar_words
+        for similar_word in similar_words:
+            assert compute_letter_frequency(similar_word) == compute_letter_frequency(word)
+
+
+@pytest.mark.asyncio
+async def test_add_words():
+    payload = {"words": ["apple", "cloud", "Fastapi", "  "]}
+
+    async with AsyncClient(base_url=BASE_URL) as ac:
+        response = await ac.post("/add-words", json=payload)
+
+    assert response.status_code == 200
+    data = response.json()
+    assert data["inserted"] + data["already_present"] == 3
+    assert data["invalid"] == 1
+
+
+@pytest.mark.asyncio
+async def test_add_words_counts_non_letters_as_invalid():
+    payload = {"words": ["qzxjab\nqzxjcd", "qzxj ab", "qzxj\tab"]}
+
+    async with AsyncClient(base_url=BASE_URL) as ac:
+        response = await ac.post("/add-words", json=payload)
+
+    assert response.status_code == 200
+    assert response.json() == {"inserted": 0, "already_present": 0, "invalid": 3}
+
+
+@pytest.mark.asyncio
+async def test_phrase_anagrams():
+    payload = {"phrase": "dirty room", "max_words": 2, "limit": 1000}
+
+    async with AsyncClient(base_url=BASE_URL, timeout=30) as ac:
+        response = await ac.post("/phrase-anagrams", json=payload)
+
+    assert response.status_code == 200
+    data = response.json()
+    assert "dirty room" in data["phrases"]
+    target = compute_letter_frequency("dirty room")
+    for phrase in data["phrases"]:
+        assert len(phrase.split()) <= 2
+        assert compute_letter_frequency(phrase) == target
@@ -0,0 +1,46 @@
+import io
+import json
+
+import pytest
+
+from backend.cli.anagrams import resolve
+from backend.lib.index_file import write_index_file
+from backend.utils.string_utils import compute_letter_frequency
+
+DICTIONARY = ["cat", "act", "tac", "dog", "god", "bird"]
+WORDS = ["cat", "god", "fish", "tca", "bird"] * 7
+
+
+@pytest.fixture
+def index_path(tmp_path):
+    buckets = {}
+    for word in DICTIONARY:
+        buckets.setdefault(compute_letter_frequency(word), []).append(word)
+    path = str(tmp_path / "index.bin")
+    write_index_file(path, buckets)
+    return path
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_ndjson_rows_follow_the_input(index_path, workers):
+    output = io.StringIO()
+
+    assert resolve(WORDS, index_path, output, workers=workers, chunk_size=3) == len(WORDS)
+
+    rows = [json.loads(line) for line in output.getvalue().splitlines()]
+    assert [row["word"] for row in rows] == WORDS
+    assert rows[:5] == [
+        {"word": "cat", "similar": ["act", "tac"]},
+        {"word": "god", "similar": ["dog"]},
+        {"word": "fish", "similar": []},
+        {"word": "tca", "similar": ["cat", "act", "tac"]},
+        {"word": "bird", "similar": []},
+    ]
+
+
+def test_csv(index_path):
+    output = io.StringIO()
+
+    resolve(["cat", "fish"], index_path, output, output_format="csv")
+
+    assert output.getvalue() == "word,similar\ncat,act tac\nfish,\n"
@@ -0,0 +1,33 @@
+from backend.database.db_utils import read_dataset_chunks
+
+WORDS = [f"word{i}" for i in range(2000)]
+
+
+async def collect(path, **kwargs):
+    return [chunk async for chunk in read_dataset_chunks(path, **kwargs)]
+
+
+async def test_chunks_cover_the_file(tmp_path):
+    path = tmp_path / "words.txt"
+    path.write_text("Cat\n\n  dog  \n" + "x" * 500 + "\nnaïve", encoding="utf-8")
+
+    chunks = await collect(path, boundary_mask=0xFFFFFFFF, max_chunk_lines=2)
+
+    assert [words for _, words, _ in chunks] == [["cat"], ["dog"], ["naïve"]]
+    content = path.read_bytes()
+    assert content[:chunks[0][2]] == b"Cat\n\n"
+    assert chunks[-1][2] == len(content)
+
+
+async def test_an_edit_only_changes_the_chunks_around_it(tmp_path):
+    path = tmp_path / "words.txt"
+    path.write_text("\n".join(WORDS) + "\n")
+    before = await collect(path, boundary_mask=0x1F)
+
+    path.write_text("\n".join(WORDS[:1000] + ["inserted"] + WORDS[1000:]) + "\n")
+    after = await collect(path, boundary_mask=0x1F)
+
+    assert [word for _, words, _ in after for word in words] == WORDS[:1000] + ["inserted"] + WORDS[1000:]
+    changed = {chunk_hash for chunk_hash, _, _ in after} - {chunk_hash for chunk_hash, _, _ in before}
+    assert len(before) > 20
+    assert len(changed) == 1
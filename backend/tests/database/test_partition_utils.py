@@ -0,0 +1,15 @@
+from datetime import date
+
+from backend.database.partition_utils import DEFAULT_PARTITION, partition_day, partition_name
+
+
+def test_partition_name_round_trips():
+    day = date(2026, 1, 9)
+    assert partition_name(day) == "request_log_p20260109"
+    assert partition_day(partition_name(day)) == day
+
+
+def test_partition_day_ignores_other_tables():
+    assert partition_day("request_log") is None
+    assert partition_day("request_log_rollup") is None
+    assert partition_day(DEFAULT_PARTITION) is None
@@ -0,0 +1,71 @@
+import pytest
+
+from backend.lib.index_file import HEADER, IndexFile, IndexFileError, write_index_file
+from backend.utils.string_utils import compute_letter_frequency
+
+DIGEST = bytes(range(32))
+
+
+def write_words(path, words):
+    buckets = {}
+    for word in words:
+        buckets.setdefault(compute_letter_frequency(word), []).append(word)
+    write_index_file(str(path), buckets, generation=3, dataset_digest=DIGEST, word_id_watermark=41)
+
+
+def test_round_trip(tmp_path):
+    write_words(tmp_path / "index.bin", ["cat", "act", "dog", "naïve"])
+    index_file = IndexFile(str(tmp_path / "index.bin"))
+
+    assert (index_file.generation, index_file.word_count, index_file.signature_count) == (3, 4, 3)
+    assert index_file.dataset_digest == DIGEST
+    assert index_file.word_id_watermark == 41
+    assert index_file.lookup(compute_letter_frequency("tac")) == ["cat", "act"]
+    assert index_file.lookup(compute_letter_frequency("naïve")) == ["naïve"]
+    assert index_file.lookup(compute_letter_frequency("bird")) is None
+    index_file.close()
+
+
+def test_empty_index(tmp_path):
+    write_index_file(str(tmp_path / "index.bin"), {})
+    index_file = IndexFile(str(tmp_path / "index.bin"))
+
+    assert index_file.word_count == 0
+    assert index_file.word_id_watermark == 0
+    assert index_file.lookup(compute_letter_frequency("cat")) is None
+    index_file.close()
+
+
+def test_corrupt_file_is_rejected(tmp_path):
+    path = tmp_path / "index.bin"
+    write_words(path, ["cat", "act", "dog"])
+    data = bytearray(path.read_bytes())
+    data[-1] ^= 0xFF
+    path.write_bytes(bytes(data))
+
+    with pytest.raises(IndexFileError, match="checksum"):
+        IndexFile(str(path))
+
+
+def test_truncated_file_is_rejected(tmp_path):
+    path = tmp_path / "index.bin"
+    write_words(path, ["cat", "act", "dog"])
+    path.write_bytes(path.read_bytes()[:-2])
+
+    with pytest.raises(IndexFileError, match="truncated"):
+        IndexFile(str(path))
+
+    path.write_bytes(b"\x00" * (HEADER.size - 1))
+    with pytest.raises(IndexFileError):
+        IndexFile(str(path))
+
+
+def test_lookup_many_matches_lookup(tmp_path):
+    words = ["cat", "act", "dog", "god", "bird", "a", "zz"]
+    write_words(tmp_path / "index.bin", words)
+    index_file = IndexFile(str(tmp_path / "index.bin"))
+    signatures = [compute_letter_frequency(word) for word in words + ["fish", "", "zzz"]]
+
+    assert index_file.lookup_many(signatures) == [index_file.lookup(signature) for signature in signatures]
+    assert index_file.lookup_many([]) == []
+    index_file.close()
@@ -0,0 +1,39 @@
+from backend.lib.near_anagram_index import NearAnagramIndex
+from backend.utils.string_utils import compute_letter_frequency
+
+WORDS = ["cat", "act", "cart", "at", "cot", "dog", "scat", "tac"]
+
+
+def build_index() -> NearAnagramIndex:
+    index = NearAnagramIndex()
+    for word in WORDS:
+        index.add(word, compute_letter_frequency(word))
+    index.compact()
+    return index
+
+
+def test_query_finds_every_edit_ranked():
+    near, total = build_index().query(compute_letter_frequency("cat"))
+    assert [(match.word, match.operation) for match in near] == [
+        ("cot", "substitution"),
+        ("cart", "insertion"),
+        ("scat", "insertion"),
+        ("at", "deletion"),
+    ]
+    assert near[0].added == "o" and near[0].removed == "a"
+    assert total == 4
+
+
+def test_query_applies_limit():
+    near, total = build_index().query(compute_letter_frequency("cat"), limit=2)
+    assert [match.word for match in near] == ["cot", "cart"]
+    assert total == 4
+
+
+def test_words_added_after_compaction_are_found():
+    index = build_index()
+    assert index.add("chat", compute_letter_frequency("chat"))
+    assert not index.add("chat", compute_letter_frequency("chat"))
+
+    near, _ = index.query(compute_letter_frequency("cat"))
+    assert ("chat", "insertion", "h", None) in [tuple(match) for match in near]
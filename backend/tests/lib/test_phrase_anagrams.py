@@ -0,0 +1,54 @@
+from backend.lib.phrase_anagrams import init_worker, search_phrase, solve_phrase
+from backend.utils.string_utils import compute_letter_frequency
+
+WORDS = ["dirty", "room", "dormitory", "rid", "motory", "moor", "dry", "tim", "toy"]
+
+
+def candidates_for(phrase: str):
+    available = compute_letter_frequency(phrase)
+    by_signature = {}
+    for word in WORDS:
+        signature = compute_letter_frequency(word)
+        if all(count <= available[idx] for idx, count in enumerate(signature)):
+            by_signature.setdefault(signature, []).append(word)
+    return list(by_signature.items())
+
+
+def test_solve_phrase_finds_every_split():
+    target = compute_letter_frequency("dirty room")
+    phrases, complete = solve_phrase(target, candidates_for("dirty room"), max_words=3, max_results=100, time_budget=5)
+
+    assert complete
+    assert sorted(phrases) == sorted(["dormitory", "dirty room", "dirty moor", "motory rid"])
+
+
+def test_solve_phrase_respects_word_and_result_limits():
+    target = compute_letter_frequency("dirty room")
+
+    phrases, complete = solve_phrase(target, candidates_for("dirty room"), max_words=1, max_results=100, time_budget=5)
+    assert phrases == ["dormitory"] and complete
+
+    phrases, complete = solve_phrase(target, candidates_for("dirty room"), max_words=3, max_results=2, time_budget=5)
+    assert len(phrases) == 2 and not complete
+
+    phrases, complete = solve_phrase(target, candidates_for("dirty room"), max_words=3, max_results=4, time_budget=5)
+    assert len(phrases) == 4 and complete
+
+
+def test_solve_phrase_stops_at_the_deadline():
+    target = compute_letter_frequency("dirty room")
+    phrases, complete = solve_phrase(target, candidates_for("dirty room"), max_words=3, max_results=100, time_budget=0)
+
+    assert phrases == [] and not complete
+
+
+def test_search_phrase_uses_the_worker_index_and_the_added_words():
+    init_worker([(word, compute_letter_frequency(word)) for word in WORDS if word != "moor"])
+    target = compute_letter_frequency("dirty room")
+
+    phrases, complete = search_phrase(target, 3, [], max_words=3, max_results=100, time_budget=5)
+    assert sorted(phrases) == sorted(["dormitory", "dirty room", "motory rid"]) and complete
+
+    phrases, _ = search_phrase(target, 3, [("moor", compute_letter_frequency("moor"))],
+                               max_words=3, max_results=100, time_budget=5)
+    assert "dirty moor" in phrases
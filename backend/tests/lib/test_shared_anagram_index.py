@@ -0,0 +1,106 @@
+import os
+
+from backend.lib import shared_anagram_index
+from backend.lib.index_file import write_index_file
+from backend.lib.shared_anagram_index import SharedAnagramIndex
+from backend.utils.string_utils import compute_letter_frequency
+
+WORDS = ["cat", "act", "tac", "dog", "god", "bird"]
+
+
+def write_words(path, words, generation=1):
+    buckets = {}
+    for word in words:
+        buckets.setdefault(compute_letter_frequency(word), []).append(word)
+    write_index_file(str(path), buckets, generation)
+
+
+def open_index(path) -> SharedAnagramIndex:
+    index = SharedAnagramIndex(str(path))
+    assert index._open()
+    return index
+
+
+def test_lookup_reads_the_mapped_file(tmp_path):
+    write_words(tmp_path / "index.bin", WORDS)
+    index = open_index(tmp_path / "index.bin")
+
+    assert sorted(index.lookup(compute_letter_frequency("cat"))) == ["act", "cat", "tac"]
+    assert index.lookup(compute_letter_frequency("bird")) == ["bird"]
+    assert index.lookup(compute_letter_frequency("fish")) is None
+    assert len(index) == len(WORDS)
+    assert not index.add("dog", compute_letter_frequency("dog"))
+
+
+def test_published_words_reach_other_workers(tmp_path, monkeypatch):
+    monkeypatch.setattr(shared_anagram_index, "DELTA_CHECK_INTERVAL", 0)
+    write_words(tmp_path / "index.bin", WORDS)
+    writer = open_index(tmp_path / "index.bin")
+    reader = open_index(tmp_path / "index.bin")
+
+    for word in ["cta", "fish"]:
+        writer.add(word, compute_letter_frequency(word))
+    writer.publish(["cta", "fish"])
+
+    assert sorted(reader.lookup(compute_letter_frequency("cat"))) == ["act", "cat", "cta", "tac"]
+    assert reader.lookup(compute_letter_frequency("fish")) == ["fish"]
+    assert len(reader) == len(writer) == len(WORDS) + 2
+
+
+def test_published_records_keep_words_whole(tmp_path, monkeypatch):
+    monkeypatch.setattr(shared_anagram_index, "DELTA_CHECK_INTERVAL", 0)
+    write_words(tmp_path / "index.bin", WORDS)
+    writer = open_index(tmp_path / "index.bin")
+    reader = open_index(tmp_path / "index.bin")
+
+    writer.publish(["qzx\ncat", "fish"])
+
+    assert reader.lookup(compute_letter_frequency("qzxcat")) == ["qzx\ncat"]
+    assert sorted(reader.lookup(compute_letter_frequency("cat"))) == ["act", "cat", "tac"]
+    assert len(reader) == len(WORDS) + 2
+
+
+def test_lookups_replay_the_delta_at_most_every_interval(tmp_path):
+    write_words(tmp_path / "index.bin", WORDS)
+    writer = open_index(tmp_path / "index.bin")
+    reader = open_index(tmp_path / "index.bin")
+
+    writer.publish(["fish"])
+    assert reader.lookup(compute_letter_frequency("fish")) is None
+
+    reader._next_delta_check = 0.0
+    assert reader.lookup(compute_letter_frequency("fish")) == ["fish"]
+
+
+async def test_new_generation_replaces_the_mapping(tmp_path):
+    write_words(tmp_path / "index.bin", WORDS)
+    index = open_index(tmp_path / "index.bin")
+
+    write_words(tmp_path / "index.bin", WORDS + ["odg"], generation=2)
+    assert index.generation == 1
+    await index.check_generation()
+
+    assert index.generation == 2
+    assert sorted(index.lookup(compute_letter_frequency("dog"))) == ["dog", "god", "odg"]
+
+
+def test_unusable_file_is_not_opened(tmp_path):
+    (tmp_path / "index.bin").write_bytes(b"not an index")
+    assert not SharedAnagramIndex(str(tmp_path / "index.bin"))._open()
+    assert not SharedAnagramIndex(str(tmp_path / "missing.bin"))._open()
+
+
+async def test_words_published_after_the_carry_over_go_to_the_new_generation(tmp_path):
+    write_words(tmp_path / "index.bin", WORDS)
+    index = open_index(tmp_path / "index.bin")
+
+    # What `attach` does once the next generation is written and the delta carried over.
+    (tmp_path / "index.bin.2.delta").touch()
+    write_words(tmp_path / "index.bin", WORDS, generation=2)
+    os.unlink(tmp_path / "index.bin.1.delta")
+
+    index.publish(["fish"])
+    await index.check_generation()
+
+    assert index.generation == 2
+    assert index.lookup(compute_letter_frequency("fish")) == ["fish"]
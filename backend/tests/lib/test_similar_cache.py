@@ -0,0 +1,45 @@
+from unittest.mock import patch
+
+from backend.lib.similar_cache import SimilarWordsCache
+
+
+def test_cache_hit_and_miss_counters():
+    cache = SimilarWordsCache(max_entries=10, ttl_seconds=60)
+
+    assert cache.get(b"sig") is None
+    cache.put(b"sig", ["apple", "appel"])
+
+    assert cache.get(b"sig") == ["apple", "appel"]
+    assert cache.stats()["hits"] == 1
+    assert cache.stats()["misses"] == 1
+
+
+def test_cache_evicts_least_recently_used():
+    cache = SimilarWordsCache(max_entries=2, ttl_seconds=60)
+    cache.put(b"a", ["a"])
+    cache.put(b"b", ["b"])
+    cache.get(b"a")
+    cache.put(b"c", ["c"])
+
+    assert cache.get(b"b") is None
+    assert cache.get(b"a") == ["a"]
+    assert cache.evictions == 1
+
+
+def test_cache_entries_expire():
+    cache = SimilarWordsCache(max_entries=10, ttl_seconds=5)
+    with patch("backend.lib.similar_cache.monotonic", return_value=100.0):
+        cache.put(b"sig", ["word"])
+    with patch("backend.lib.similar_cache.monotonic", return_value=106.0):
+        assert cache.get(b"sig") is None
+    assert len(cache) == 0
+
+
+def test_cache_invalidates_one_signature():
+    cache = SimilarWordsCache(max_entries=10, ttl_seconds=60)
+    cache.put(b"a", ["a"])
+    cache.put(b"b", ["b"])
+    cache.invalidate(b"a")
+
+    assert cache.get(b"a") is None
+    assert cache.get(b"b") == ["b"]
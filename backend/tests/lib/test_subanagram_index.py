@@ -0,0 +1,57 @@
+from backend.lib.subanagram_index import SubanagramIndex, letter_mask
+from backend.utils.string_utils import compute_letter_frequency
+
+WORDS = ["a", "at", "tat", "tea", "eat", "ate", "teat", "state", "taste", "zebra"]
+
+
+def build_index() -> SubanagramIndex:
+    index = SubanagramIndex()
+    for word in WORDS:
+        index.add(word, compute_letter_frequency(word))
+    return index
+
+
+def test_letter_mask():
+    assert letter_mask(compute_letter_frequency("aab")) == 0b11
+    assert letter_mask(compute_letter_frequency("z")) == 1 << 25
+
+
+def test_query_respects_letter_counts():
+    words, total = build_index().query(compute_letter_frequency("teat"))
+    assert set(words) == {"a", "at", "tat", "tea", "eat", "ate", "teat"}
+    assert total == 7
+
+
+def test_query_orders_longest_first_and_applies_limits():
+    index = build_index()
+    words, total = index.query(compute_letter_frequency("statue"), min_len=3, limit=3)
+    assert words == ["state", "taste", "teat"]
+    assert total == 7
+
+
+def test_query_matches_brute_force_on_many_letters():
+    # More distinct letters than the submask enumeration handles, so every bucket is scanned.
+    letters = "abcdefghijklmnopqrstuvwxyz"
+    words, total = build_index().query(compute_letter_frequency(letters), limit=100)
+    available = compute_letter_frequency(letters)
+    expected = [
+        word for word in WORDS
+        if all(count <= available[idx] for idx, count in enumerate(compute_letter_frequency(word)))
+    ]
+    assert sorted(words) == sorted(expected)
+    assert total == len(expected)
+
+
+def test_add_ignores_duplicates():
+    index = build_index()
+    assert not index.add("tea", compute_letter_frequency("tea"))
+    assert len(index) == len(WORDS)
+
+
+def test_words_added_since_the_snapshot():
+    index = build_index()
+    assert len(index.snapshot()) == len(WORDS)
+
+    for word in ["tat", "seat", "zoo"]:
+        index.add(word, compute_letter_frequency(word))
+    assert index.added_since_snapshot(compute_letter_frequency("teas")) == [("seat", compute_letter_frequency("seat"))]
@@ -0,0 +1,48 @@
+import json
+
+from backend.lib import tracing
+from backend.lib.tracing import Tracer, span
+
+
+def test_span_is_a_no_op_without_a_trace():
+    with span("untraced"):
+        pass
+    assert tracing._current_trace.get() is None
+
+
+def test_spans_nest_under_the_current_trace():
+    trace = tracing.Trace("GET /similar")
+    token = tracing._current_trace.set(trace)
+    try:
+        with span("outer"):
+            with span("inner"):
+                pass
+    finally:
+        tracing._current_trace.reset(token)
+
+    assert [(s.name, s.depth) for s in trace.spans] == [("inner", 1), ("outer", 0)]
+    assert "  outer" in Tracer.format_breakdown(trace, 0.01)
+
+
+def test_slow_requests_are_logged_whatever_the_sample_rate(tmp_path, caplog):
+    export_path = tmp_path / "traces.jsonl"
+    tracer = Tracer(sample_rate=0, slow_threshold_ms=0, export_path=str(export_path))
+    trace = tracer.start("GET /similar")
+    trace.record("db.query", trace.start, trace.start + 0.002)
+    tracer.finish(trace)
+
+    assert "db.query: 2.000ms" in caplog.text
+    assert export_path.read_text() == ""
+
+
+def test_tracer_samples_and_exports(tmp_path):
+    export_path = tmp_path / "traces.jsonl"
+    tracer = Tracer(sample_rate=1, slow_threshold_ms=10_000, export_path=str(export_path))
+    trace = tracer.start("GET /stats")
+    trace.record("query", trace.start, trace.start + 0.002)
+    tracer.finish(trace)
+
+    exported = json.loads(export_path.read_text().splitlines()[0])
+    assert exported["name"] == "GET /stats"
+    assert exported["spans"][0]["name"] == "query"
+    assert exported["spans"][0]["duration_ms"] == 2.0
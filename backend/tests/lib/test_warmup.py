@@ -0,0 +1,41 @@
+import pytest
+
+from backend.lib.warmup import WarmupStatus
+
+
+def test_phases_are_tracked():
+    warmup = WarmupStatus(["dataset", "anagram_index"])
+    assert not warmup.finished
+
+    with warmup.phase("dataset"):
+        warmup.progress("dataset", 0.4567)
+        assert warmup.snapshot()["phases"]["dataset"]["progress"] == 0.457
+    with pytest.raises(RuntimeError):
+        with warmup.phase("anagram_index"):
+            raise RuntimeError("connection lost")
+
+    snapshot = warmup.snapshot()
+    assert snapshot["finished"]
+    assert snapshot["phases"]["dataset"]["state"] == "done"
+    assert snapshot["phases"]["anagram_index"] == {
+        "state": "failed",
+        "error": "connection lost",
+        "elapsedSeconds": snapshot["phases"]["anagram_index"]["elapsedSeconds"],
+    }
+
+
+def test_ready_once_words_are_available():
+    warmup = WarmupStatus(["dataset"])
+    assert not warmup.ready and not warmup.snapshot()["ready"]
+
+    warmup.words_available = True
+    assert warmup.ready
+
+
+def test_pending_words_are_collected_until_taken():
+    warmup = WarmupStatus([])
+    warmup.pending_words.append(("cat", b"sig"))
+
+    assert warmup.take_pending_words() == [("cat", b"sig")]
+    assert warmup.pending_words is None
+    assert warmup.take_pending_words() == []
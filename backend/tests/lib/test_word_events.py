@@ -0,0 +1,70 @@
+import asyncio
+from typing import List, Tuple
+
+from starlette.datastructures import State
+
+from backend.lib import word_events
+from backend.lib.anagram_index import AnagramIndex
+from backend.lib.similar_cache import SimilarWordsCache
+from backend.lib.word_events import WordEventListener
+from backend.utils.string_utils import compute_letter_frequency
+
+
+class FakeConnection:
+    """
+    Stands in for the listener's asyncpg connection, over an in-memory words table.
+    """
+
+    def __init__(self, words: List[Tuple[int, str]]) -> None:
+        self.words = words
+
+    async def fetchval(self, query: str) -> int:
+        return max((word_id for word_id, _ in self.words), default=0)
+
+    async def fetch(self, query: str, after: int, up_to: int):
+        return [{"word": word, "signature": compute_letter_frequency(word)}
+                for word_id, word in self.words if after < word_id <= up_to]
+
+    def is_closed(self) -> bool:
+        return False
+
+    async def close(self) -> None:
+        pass
+
+
+class FakeListener(WordEventListener):
+    def __init__(self, connection: FakeConnection, state: State) -> None:
+        super().__init__(dsn="", state=state)
+        self.fake_connection = connection
+        self.connects = 0
+
+    async def _connect(self) -> None:
+        self._disconnected.clear()
+        self._connection = self.fake_connection
+        self.connects += 1
+
+
+async def test_words_missed_while_disconnected_are_caught_up(monkeypatch):
+    monkeypatch.setattr(word_events, "RECONNECT_DELAY_SECONDS", 0)
+    state = State()
+    state.anagram_index = AnagramIndex()
+    state.similar_cache = SimilarWordsCache()
+    for word in ("cat", "act"):
+        state.anagram_index.add(word, compute_letter_frequency(word))
+    state.similar_cache.put(compute_letter_frequency("cat"), ["act", "cat"])
+
+    table = FakeConnection([(1, "cat"), (2, "act")])
+    listener = FakeListener(table, state)
+    await listener.start()
+
+    # Inserted by another worker while the connection is down: its notification is lost.
+    table.words.append((3, "tac"))
+    listener._on_termination(table)
+    for _ in range(100):
+        if listener.connects == 2 and listener._last_word_id == 3:
+            break
+        await asyncio.sleep(0.01)
+    await listener.close()
+
+    assert sorted(state.anagram_index.lookup(compute_letter_frequency("cat"))) == ["act", "cat", "tac"]
+    assert state.similar_cache.get(compute_letter_frequency("cat")) is None
@@ -0,0 +1,47 @@
+import pytest
+
+from backend.utils import string_utils
+from backend.utils.string_utils import compute_letter_frequency, compute_letter_frequencies, is_valid_word, ALPHABET_SIZE
+
+WORDS = ["", "a", "Stressed", "desserts", "don't-stop", "naïve", "straße", "KELVIN", "z" * 300, "listen"] * 20
+
+
+@pytest.mark.parametrize("word", ["", "a", "stressed", "antidisestablishmentarianism", "z" * 300])
+def test_signature_is_fixed_width(word: str):
+    assert len(compute_letter_frequency(word)) == ALPHABET_SIZE
+
+
+def test_signature_counts_letters():
+    signature = compute_letter_frequency("Stressed")
+    assert signature[ord("s") - ord("a")] == 3
+    assert signature[ord("e") - ord("a")] == 2
+    assert sum(signature) == len("stressed")
+
+
+def test_signature_ignores_non_letters():
+    assert compute_letter_frequency("don't-stop") == compute_letter_frequency("dontstop")
+
+
+def test_signature_is_unambiguous_for_repeated_letters():
+    # The decimal-joined format mapped both words to the same string ("1" + "11" == "11" + "1").
+    assert compute_letter_frequency("a" + "b" * 11) != compute_letter_frequency("a" * 11 + "b")
+
+
+def test_batch_signatures_match_scalar():
+    assert compute_letter_frequencies(WORDS) == [compute_letter_frequency(word) for word in WORDS]
+
+
+def test_batch_signatures_match_scalar_without_numpy(monkeypatch):
+    monkeypatch.setattr(string_utils, "np", None)
+    assert compute_letter_frequencies(WORDS) == [compute_letter_frequency(word) for word in WORDS]
+
+
+@pytest.mark.parametrize("word", ["a", "stressed", "z" * string_utils.WORD_MAX_LENGTH])
+def test_valid_words(word: str):
+    assert is_valid_word(word)
+
+
+@pytest.mark.parametrize("word", ["", "qzxjab\nqzxjcd", "two words", "tab\t", "nul\x00", "don't", "naïve", "Upper",
+                                  "z" * (string_utils.WORD_MAX_LENGTH + 1)])
+def test_invalid_words(word: str):
+    assert not is_valid_word(word)
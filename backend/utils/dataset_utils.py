@@ -0,0 +1,45 @@
+import hashlib
+from pathlib import Path
+from typing import IO, Iterator, Union
+
+READ_BLOCK_SIZE = 1 << 20
+
+
+def iter_words(stream: IO[str], block_size: int = READ_BLOCK_SIZE) -> Iterator[str]:
+    """
+    Yield the normalized (stripped, lowercased), non-empty lines of a text stream,
+    reading it in large blocks.
+    """
+    remainder = ""
+    while True:
+        block = stream.read(block_size)
+        if not block:
+            break
+        lines = (remainder + block).split("\n")
+        remainder = lines.pop()
+        for line in lines:
+            word = line.strip().lower()
+            if word:
+                yield word
+    word = remainder.strip().lower()
+    if word:
+        yield word
+
+
+def iter_dataset_words(dataset_path: Union[str, Path]) -> Iterator[str]:
+    """
+    Yield the normalized, non-empty words of a dataset file, as the dataset loader reads them.
+    """
+    with open(dataset_path, "r", encoding="utf-8") as f:
+        yield from iter_words(f)
+
+
+def file_digest(path: Union[str, Path], block_size: int = READ_BLOCK_SIZE) -> bytes:
+    """
+    Return the SHA-256 digest of a file's content.
+    """
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        while block := f.read(block_size):
+            digest.update(block)
+    return digest.digest()
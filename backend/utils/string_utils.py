@@ -1,11 +1,65 @@
-def compute_letter_frequency(word: str) -> str:
+import re
+from os import getenv
+from typing import List, Sequence
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional: compute_letter_frequencies falls back to pure Python.
+    np = None
+
+ALPHABET_SIZE = 26
+WORD_MAX_LENGTH = int(getenv("WORD_MAX_LENGTH", 100))
+MAX_LETTER_COUNT = 255
+# Words are stored as lowercase letters only; anything else is rejected on insertion.
+WORD_PATTERN = re.compile(r"[a-z]+")
+# Below this many words the NumPy setup costs more than it saves.
+NUMPY_MIN_BATCH = 64
+
+
+def is_valid_word(word: str) -> bool:
     """
-    Return a 26-character string representing the frequency of letters a-z.
-    For example, 'stressed' -> '01300100000000000000000000'
+    Return whether a normalized word can be stored: 1 to WORD_MAX_LENGTH letters a-z.
     """
-    freq = [0] * 26
+    return len(word) <= WORD_MAX_LENGTH and WORD_PATTERN.fullmatch(word) is not None
+
+
+def compute_letter_frequency(word: str) -> bytes:
+    """
+    Return a fixed-width 26-byte signature holding the frequency of letters a-z,
+    one byte per letter, so no two distinct frequency vectors share a signature.
+    Counts saturate at 255, which is longer than any word the table can store.
+    For example, 'stressed' -> bytes([0, 0, 0, 1, 2, 0, ..., 0, 1, 3, 1, 0, ...])
+    """
+    freq = [0] * ALPHABET_SIZE
     for ch in word.lower():
         idx = ord(ch) - ord('a')
-        if 0 <= idx < 26:
+        if 0 <= idx < ALPHABET_SIZE:
             freq[idx] += 1
-    return ''.join(map(str, freq))
+    return bytes(min(count, MAX_LETTER_COUNT) for count in freq)
+
+
+def compute_letter_frequencies(words: Sequence[str]) -> List[bytes]:
+    """
+    Return the signature of every word, identical to compute_letter_frequency.
+
+    With NumPy installed the words are lowercased and encoded into one byte
+    array, and a single histogram counts the a-z bytes of every word at once.
+    Non-ASCII characters encode to bytes outside a-z, so they are ignored
+    exactly as in the scalar function. Without NumPy each word is signed in turn.
+    """
+    if np is None or len(words) < NUMPY_MIN_BATCH:
+        return [compute_letter_frequency(word) for word in words]
+
+    encoded = [word.lower().encode("utf-8", errors="replace") for word in words]
+    lengths = np.fromiter(map(len, encoded), dtype=np.int64, count=len(encoded))
+    # uint8 arithmetic wraps bytes below 'a' around, so one comparison selects a-z.
+    letters = np.frombuffer(b"".join(encoded), dtype=np.uint8) - np.uint8(ord('a'))
+    rows = np.repeat(np.arange(len(encoded), dtype=np.int64), lengths)
+    is_letter = letters < ALPHABET_SIZE
+
+    counts = np.bincount(
+        rows[is_letter] * ALPHABET_SIZE + letters[is_letter],
+        minlength=len(encoded) * ALPHABET_SIZE,
+    )
+    packed = np.minimum(counts, MAX_LETTER_COUNT).astype(np.uint8).tobytes()
+    return [packed[start:start + ALPHABET_SIZE] for start in range(0, len(packed), ALPHABET_SIZE)]